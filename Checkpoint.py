@@ -0,0 +1,99 @@
+"""
+    Checkpoint of a long genetic algorithm run(python engine, parameters['checkpoint'])
+        - state: next epoch, population, best solution, random stream, history buffers, cache statistics, early stopping,
+          parameters, strategy, prime implicants and minterms of the run, so a resumed run does not run Quine-McCluskey again
+        - file: magic, then the zlib-compressed pickle of the state(the population is packed as fixed-width big-endian bytes)
+        - written to a temporary file and renamed, so a crash while writing never breaks the last checkpoint
+        - checkpoint files are pickles, load only files written by this program
+
+    Usage:
+        python Checkpoint.py info outputs/run.ckpt
+        python Checkpoint.py resume outputs/run.ckpt --output outputs/resumed
+"""
+
+import os, json, zlib, pickle, argparse, tempfile
+
+MAGIC = b'GQMCK1'
+
+
+def pack_genomes(genomes, gene_size):
+    """
+    Args:
+        genomes (list[int]): genomes
+        gene_size (int): number of prime implicants(bits of a genome)
+
+    Returns:
+        bytes: genomes as fixed-width big-endian words
+    """
+    word_size = max(1, (gene_size + 7) // 8)
+    return b''.join(genome.to_bytes(word_size, 'big') for genome in genomes)
+
+def unpack_genomes(data, gene_size):
+    """
+    Inverse of pack_genomes
+
+    Returns:
+        list[int]: genomes
+    """
+    word_size = max(1, (gene_size + 7) // 8)
+    return [int.from_bytes(data[start:start + word_size], 'big') for start in range(0, len(data), word_size)]
+
+def save_checkpoint(path, state):
+    """
+    Write the state atomically(temporary file in the same directory, then rename)
+
+    Args:
+        path (str): checkpoint file path
+        state (dict): picklable state of the run
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as f:
+            f.write(MAGIC)
+            f.write(zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+def load_checkpoint(path):
+    """
+    Args:
+        path (str): checkpoint file path
+
+    Returns:
+        dict: state of the run
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"Unknown checkpoint format: {path}")
+    return pickle.loads(zlib.decompress(data[len(MAGIC):]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or resume a genetic algorithm checkpoint")
+    parser.add_argument('command', choices=['info', 'resume'])
+    parser.add_argument('checkpoint', help="checkpoint file path")
+    parser.add_argument('--output', default=None, help="output directory of the resumed run(result.json)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'info':
+        state = load_checkpoint(args.checkpoint)
+        print(f"epoch {state['epoch']} / {state['parameters']['epoch']}, best fitness {state['best_solution'][1]}, "
+              f"{state['gene_size']} prime implicants, seed {state['rng'].root_seed}")
+        return
+    from Pipeline import resume_testcase, summarize_result # the resumed run needs the whole pipeline
+    record = summarize_result(resume_testcase(args.checkpoint, log=print))
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        with open(os.path.join(args.output, 'result.json'), 'w') as json_file:
+            json.dump(record, json_file, indent=2)
+    print(json.dumps(record))
+
+if __name__ == '__main__':
+    main()
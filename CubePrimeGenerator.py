@@ -0,0 +1,252 @@
+"""
+    Cube-based prime implicant generator for wide functions
+        - input: PLA-style cubes('1-0-', leftmost character is the most significant variable) of the ON-set and the dontcare set
+        - prime implicants: unate recursive paradigm, no minterm is ever enumerated. [ __primes method ]
+            primes(F) = SCC(x * primes(F_x) + x' * primes(F_x') + primes(F_x) * primes(F_x'))
+            a unate cover is its own set of prime implicants after single cube containment(SCC).
+        - minterms: the ON-set is split into cubes that are either inside or outside of every prime implicant,
+          and one cube is kept for each set of covering prime implicants [ __coverage_cubes method ].
+          these cubes take the place of the minterms in (prime_implicants, minterms), `cube in prime_implicant` is containment,
+          so a full cover of the cubes is a full cover of the ON-set and the fitness counts the covered cubes.
+        trace modes
+            - full, summary: prime_implicants.csv with the cube of each prime implicant
+            - off: no output directory and no file is written
+"""
+
+import os, time
+
+from QuineMcCluskey import Implicant
+
+
+def parse_cube(cube):
+    """
+    Convert a PLA-style cube string to (value, dash mask)
+
+    Args:
+        cube (str): cube string of '0', '1' and '-'
+
+    Returns:
+        (int, int): cube value(dash positions are 0) and dash positions
+    """
+    value = int(cube.replace('-', '0'), 2)
+    mask = int(''.join('1' if bit == '-' else '0' for bit in cube), 2)
+    return value, mask
+
+def format_cube(value, mask, variable_count):
+    """
+    Convert (value, dash mask) to a PLA-style cube string, the inverse of parse_cube
+    """
+    return ''.join('-' if (mask >> bit) & 1 else str((value >> bit) & 1) for bit in reversed(range(variable_count)))
+
+
+class CubePrimeGenerator:
+    def __init__(self, cubes, dontcare_cubes, output_directory=None, trace='full', metrics=None):
+        self.cubes = cubes
+        self.dontcare_cubes = dontcare_cubes
+        self.variable_count = max(map(len, cubes + dontcare_cubes))
+        self.full_mask = (1 << self.variable_count) - 1
+        self.prime_implicants = []
+        if trace not in ('full', 'summary', 'off'):
+            raise ValueError(f"Unknown trace mode: {trace}")
+        if trace != 'off' and output_directory is None:
+            raise ValueError(f"Trace mode {trace} needs an output directory(use trace='off' without one)")
+        self.trace = trace
+        self.metrics = metrics # Instrumentation.Metrics receiver, None: not measured
+
+        # create cube_prime_generator output directory
+        self.output_directory = None
+        if trace != 'off':
+            self.output_directory = os.path.join(output_directory, 'cube_prime_generator')
+            os.makedirs(self.output_directory, exist_ok=True)
+
+    def __parse(self, cubes):
+        return [parse_cube(cube.rjust(self.variable_count, '0')) for cube in cubes]
+
+    def __single_cube_containment(self, cover):
+        """
+        Remove the cubes contained in another cube of the cover
+
+        Args:
+            cover (list[(int, int)]): list of (value, dash mask) cubes
+
+        Returns:
+            list[(int, int)]: cubes that are not contained in another cube
+        """
+        kept = []
+        # bitsets of the kept cubes(i-th bit: i-th kept cube) for each variable
+        dash_cubes = [0] * self.variable_count # cubes with a dash
+        cover_cubes = [[0, 0] for _ in range(self.variable_count)] # cubes with a dash or the given polarity
+        # a cube can only be contained in a cube with more dashes
+        for value, mask in sorted(set(cover), key=lambda cube: -cube[1].bit_count()):
+            containing = (1 << len(kept)) - 1
+            for position in range(self.variable_count):
+                if (mask >> position) & 1:
+                    containing &= dash_cubes[position]
+                else:
+                    containing &= cover_cubes[position][(value >> position) & 1]
+                if not containing:
+                    break
+            if containing: # contained in a kept cube
+                continue
+            cube_bit = 1 << len(kept)
+            kept.append((value, mask))
+            for position in range(self.variable_count):
+                if (mask >> position) & 1:
+                    dash_cubes[position] |= cube_bit
+                    cover_cubes[position][0] |= cube_bit
+                    cover_cubes[position][1] |= cube_bit
+                else:
+                    cover_cubes[position][(value >> position) & 1] |= cube_bit
+        return kept
+
+    def __binate_variable(self, cover):
+        """
+        Find the variable that appears in both polarities in the most cubes
+
+        Args:
+            cover (list[(int, int)]): list of (value, dash mask) cubes
+
+        Returns:
+            int | None: bit of the most binate variable, None if the cover is unate
+        """
+        best_bit, best_count = None, 0
+        for position in range(self.variable_count):
+            bit = 1 << position
+            ones = sum(1 for value, mask in cover if not mask & bit and value & bit)
+            zeros = sum(1 for value, mask in cover if not mask & bit and not value & bit)
+            if ones and zeros and ones + zeros > best_count:
+                best_bit, best_count = bit, ones + zeros
+        return best_bit
+
+    def __cofactor(self, cover, bit, polarity):
+        """
+        Cofactor of the cover with respect to the variable(bit) set to polarity.
+        the variable becomes a dash in every remaining cube.
+        """
+        return [(value & ~bit, mask | bit) for value, mask in cover
+                if mask & bit or bool(value & bit) == polarity]
+
+    def __primes(self, cover):
+        """
+        Prime implicants of the function of the cover(unate recursive paradigm)
+
+        Args:
+            cover (list[(int, int)]): list of (value, dash mask) cubes
+
+        Returns:
+            list[(int, int)]: prime implicants
+        """
+        if not cover:
+            return []
+        if any(mask == self.full_mask for _, mask in cover): # tautology cube
+            return [(0, self.full_mask)]
+        bit = self.__binate_variable(cover)
+        if bit is None: # unate cover
+            return self.__single_cube_containment(cover)
+
+        positive_primes = self.__primes(self.__cofactor(cover, bit, True))
+        negative_primes = self.__primes(self.__cofactor(cover, bit, False))
+        primes = [(value | bit, mask & ~bit) for value, mask in positive_primes]
+        primes += [(value, mask & ~bit) for value, mask in negative_primes]
+        # consensus: products of the cofactor primes do not depend on the variable
+        for positive_value, positive_mask in positive_primes:
+            for negative_value, negative_mask in negative_primes:
+                if not (positive_value ^ negative_value) & ~positive_mask & ~negative_mask:
+                    primes.append((positive_value | negative_value, positive_mask & negative_mask))
+        return self.__single_cube_containment(primes)
+
+    def __split(self, cube, other):
+        """
+        Split the cube by the other cube
+
+        Args:
+            cube ((int, int)): (value, dash mask) cube
+            other ((int, int)): (value, dash mask) cube
+
+        Returns:
+            (list[(int, int)], (int, int) | None): disjoint cubes outside of the other cube and the intersection(None if disjoint)
+        """
+        value, mask = cube
+        other_value, other_mask = other
+        if (value ^ other_value) & ~mask & ~other_mask: # a variable of different polarity
+            return [cube], None
+        outside = []
+        split_bits = mask & ~other_mask # dashes of the cube that are fixed in the other cube
+        while split_bits:
+            bit = split_bits & -split_bits
+            split_bits ^= bit
+            mask &= ~bit
+            outside.append((value | (~other_value & bit), mask)) # opposite polarity of the other cube
+            value |= other_value & bit
+        return outside, (value, mask)
+
+    def __coverage_cubes(self, on_cover):
+        """
+        Split the ON-set cubes into cubes that are either inside or outside of every prime implicant,
+        and keep one cube for each set of covering prime implicants(cubes of the same set are always covered together)
+
+        Args:
+            on_cover (list[(int, int)]): ON-set cubes
+
+        Returns:
+            list[(int, int)]: coverage cubes
+        """
+        # refine each cube by the prime implicants intersecting it, a piece only checks the later prime implicants.
+        # larger prime implicants(more dashes, end of the list) first, they split the cubes into fewer pieces
+        prime_implicants = [(index, (self.prime_implicants[index].value, self.prime_implicants[index].mask))
+                            for index in reversed(range(len(self.prime_implicants)))]
+        coverage_cubes = {} # key: indices of the covering prime implicants, value: first coverage cube
+        # the ON-set cubes may overlap, pieces of the overlap have the same covering prime implicants and are merged
+        stack = [(cube, prime_implicants, ()) for cube in reversed(on_cover)]
+        while stack:
+            cube, candidates, covering = stack.pop()
+            for position, (index, candidate) in enumerate(candidates):
+                outside, inside = self.__split(cube, candidate)
+                if inside is None: # outside of the prime implicant
+                    continue
+                if not outside: # inside of the prime implicant
+                    covering += (index,)
+                    continue
+                # partially inside of the prime implicant
+                later_candidates = candidates[position + 1:]
+                for piece, piece_covering in [(piece, covering) for piece in outside] + [(inside, covering + (index,))]:
+                    piece_value, piece_mask = piece
+                    stack.append((piece, [(other_index, (other_value, other_mask))
+                                          for other_index, (other_value, other_mask) in later_candidates
+                                          if not (piece_value ^ other_value) & ~piece_mask & ~other_mask], piece_covering))
+                break
+            else:
+                coverage_cubes.setdefault(covering, cube)
+        return sorted(coverage_cubes.values())
+
+    def __save_prime_implicants_to_csv(self):
+        """
+        save the prime implicants to csv file
+        first element is the index of the prime implicant and second element is the prime implicant's cube
+        """
+        with open(os.path.join(self.output_directory, 'prime_implicants.csv'), 'w') as f:
+            for index, prime_implicant in enumerate(self.prime_implicants):
+                f.write(f"{index + 1}, {format_cube(prime_implicant.value, prime_implicant.mask, self.variable_count)}\n")
+
+    def process(self):
+        """
+        Cube-based prime implicant generator main process
+
+        Returns:
+            (list[Implicant], list[Implicant]): prime implicants and the ON-set coverage cubes(in place of minterms)
+        """
+        start_time = time.perf_counter()
+        on_cover = self.__parse(self.cubes)
+        primes = self.__primes(on_cover + self.__parse(self.dontcare_cubes))
+        # deterministic order of prime implicants, same key as QuineMcCluskey
+        self.prime_implicants = [Implicant(value, mask) for value, mask in
+                                 sorted(primes, key=lambda implicant: (implicant[1].bit_count(), implicant[0].bit_count(), implicant))]
+        minterms = [Implicant(value, mask) for value, mask in self.__coverage_cubes(on_cover)]
+        if self.metrics is not None:
+            self.metrics.on_quine_mccluskey_step({'step': 1,
+                                                  'time': time.perf_counter() - start_time,
+                                                  'table_size': len(minterms),
+                                                  'prime_implicants': len(self.prime_implicants)})
+        if self.trace != 'off':
+            self.__save_prime_implicants_to_csv()
+        return (self.prime_implicants, minterms)
@@ -0,0 +1,123 @@
+"""
+    Early stopping rules for the genetic algorithm engines
+        - patience: the best fitness has not improved for patience epochs
+        - lower_bound: the best solution covers every minterm with as few prime implicants as the cover lower bound(optimal)
+        - time_budget: the wall-clock time(seconds) of the run is over
+        - diversity_floor: the genetic diversity(number of unique genomes) fell to the floor
+        - cancelled: the cancel event(e.g. the cancel button of the GUI) is set
+"""
+
+import math, time
+
+from QuineMcCluskey import covered_indices
+
+
+def cover_lower_bound(prime_implicants, minterms):
+    """
+    Lower bound of the number of prime implicants of a full cover.
+    minterms that share no covering prime implicant with each other need different prime implicants.
+
+    Args:
+        prime_implicants (list[tuple[int]]): prime implicants
+        minterms (list[int]): minterms
+
+    Returns:
+        (int, int): lower bound of the cover size and the number of coverable minterms
+    """
+    minterm_to_idx = {minterm: idx for idx, minterm in enumerate(dict.fromkeys(minterms))}
+    column_rows = [0] * len(minterm_to_idx) # bitset of prime implicants covering each minterm
+    for row, prime_implicant in enumerate(prime_implicants):
+        for column in covered_indices(prime_implicant, minterm_to_idx):
+            column_rows[column] |= 1 << row
+    coverable = [rows for rows in column_rows if rows]
+
+    bound, used_rows = 0, 0
+    for rows in sorted(coverable, key=int.bit_count): # minterms with fewer covers first
+        if not rows & used_rows:
+            bound += 1
+            used_rows |= rows
+    return bound, len(coverable)
+
+
+class EarlyStopping:
+    def __init__(self, config, lower_bound=None, cancel_event=None):
+        """
+        Args:
+            config (dict): parameters['early_stopping'] (patience, lower_bound, time_budget, diversity_floor)
+            lower_bound ((int, int), optional): cover lower bound and number of coverable minterms(cover_lower_bound),
+                None: the lower_bound rule is not used. Defaults to None.
+            cancel_event (threading.Event | multiprocessing.Event, optional): stop when it is set. Defaults to None.
+        """
+        self.patience = config.get('patience')
+        self.time_budget = config.get('time_budget')
+        self.diversity_floor = config.get('diversity_floor')
+        self.lower_bound = lower_bound
+        self.cancel_event = cancel_event
+        self.best_fitness = -math.inf
+        self.best_epoch = -1
+        self.start_time = time.perf_counter()
+        self.stop_reason = None
+
+    def getstate(self):
+        """
+        Returns:
+            dict: progress of the rules(checkpoint), the elapsed time instead of the start time
+        """
+        return {'best_fitness': self.best_fitness, 'best_epoch': self.best_epoch,
+                'elapsed_time': time.perf_counter() - self.start_time}
+
+    def setstate(self, state):
+        """
+        Restore the progress of getstate, the time budget counts the elapsed time of the previous run
+        """
+        self.best_fitness, self.best_epoch = state['best_fitness'], state['best_epoch']
+        self.start_time = time.perf_counter() - state['elapsed_time']
+
+    def should_stop(self, epoch, best_solution, genetic_diversity):
+        """
+        Check the stopping rules at the end of an epoch
+
+        Args:
+            epoch (int): current epoch
+            best_solution (tuple): best solution found so far (genome, fitness, covered minterms, used prime implicants, epoch)
+            genetic_diversity (int): genetic diversity of the next generation
+
+        Returns:
+            bool: True if the run should stop(the reason is kept in stop_reason)
+        """
+        best_fitness, covered_minterms, used_prime_implicants = best_solution[1:4]
+        if best_fitness > self.best_fitness:
+            self.best_fitness, self.best_epoch = best_fitness, epoch
+
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            self.stop_reason = 'cancelled'
+        elif self.lower_bound is not None and covered_minterms == self.lower_bound[1] and used_prime_implicants <= self.lower_bound[0]:
+            self.stop_reason = 'lower_bound'
+        elif self.patience is not None and epoch - self.best_epoch >= self.patience:
+            self.stop_reason = 'patience'
+        elif self.time_budget is not None and time.perf_counter() - self.start_time >= self.time_budget:
+            self.stop_reason = 'time_budget'
+        elif self.diversity_floor is not None and genetic_diversity <= self.diversity_floor:
+            self.stop_reason = 'diversity_floor'
+        return self.stop_reason is not None
+
+
+def create_early_stopping(parameters, prime_implicants, minterms, cancel_event=None):
+    """
+    Create the early stopping rules of parameters['early_stopping']
+
+    Args:
+        parameters (dict): genetic algorithm parameters
+        prime_implicants (list[tuple[int]]): prime implicants
+        minterms (list[int]): minterms
+        cancel_event (threading.Event | multiprocessing.Event, optional): stop when it is set. Defaults to None.
+
+    Returns:
+        EarlyStopping | None: None if early stopping is not configured and there is no cancel event
+    """
+    config = parameters.get("early_stopping") or {}
+    if not config and cancel_event is None:
+        return None
+    # a full cover(every coverable minterm) with as few prime implicants as the lower bound is optimal for any weight
+    lower_bound = cover_lower_bound(prime_implicants, minterms) if config.get('lower_bound', False) else None
+    return EarlyStopping(config, lower_bound, cancel_event)
@@ -0,0 +1,185 @@
+"""
+Exact Cover Solver Implementation
+    Find a minimum-cardinality cover of the PI chart by bitset branch-and-bound.
+    1. Find an initial upper bound with greedy set cover. [ __greedy_cover method ]
+    2. Branch on the uncovered minterm with the fewest candidate prime implicants. [ __search method ]
+       the i-th branch uses the i-th candidate and excludes the candidates of the earlier branches.
+    3. Prune a branch when used + lower bound >= best. [ __lower_bound method ]
+       lower bound: number of uncovered minterms that share no candidate prime implicant with each other.
+    4. Stop when the time budget or the node budget runs out(or the cancel event is set) and return the best cover found so far.
+"""
+
+import math, time
+
+from QuineMcCluskey import covered_indices
+
+
+class ExactCoverSolver:
+    def __init__(self, parameters, strategy, cancel_event=None):
+        self.prime_implicants = None
+        self.minterms = None
+
+        # paramerter dictionary unpacking
+        self.weight = int(parameters["weight"])
+        self.time_budget = float(parameters.get("time_budget", math.inf)) # seconds
+        self.node_budget = float(parameters.get("node_budget", math.inf)) # number of search nodes
+        self.cancel_event = cancel_event # stop the search when it is set, None: not cancellable
+
+        # search state
+        self.nodes = 0
+        self.is_exhausted = False # True when a budget ran out
+        self.stop_reason = None # node_budget, time_budget or cancelled
+        self.best_cover = None # bitset of prime implicant indices
+
+    def __set_minterms(self, minterms):
+        self.minterms = minterms
+
+    def __set_prime_implicants(self, prime_implicants):
+        self.prime_implicants = prime_implicants
+        self.gene_size = len(self.prime_implicants) # number of prime implicants
+
+    def __build_chart(self):
+        """
+        Build the PI chart as bitsets
+        row_masks[r]: bitset of minterm indices covered by the r-th prime implicant
+        column_rows[c]: bitset of prime implicant indices covering the c-th (unique) minterm
+        """
+        minterm_to_idx = {minterm: idx for idx, minterm in enumerate(dict.fromkeys(self.minterms))}
+        self.row_masks = [0] * self.gene_size
+        self.column_rows = [0] * len(minterm_to_idx)
+        for row, prime_implicant in enumerate(self.prime_implicants):
+            for column in covered_indices(prime_implicant, minterm_to_idx):
+                self.row_masks[row] |= 1 << column
+                self.column_rows[column] |= 1 << row
+        # minterms without any prime implicant can never be covered
+        self.coverable = 0
+        for row_mask in self.row_masks:
+            self.coverable |= row_mask
+
+    def __iterate_bits(self, bitset):
+        while bitset:
+            lowest_bit = bitset & -bitset
+            bitset ^= lowest_bit
+            yield lowest_bit.bit_length() - 1
+
+    def __greedy_cover(self):
+        """
+        Greedy set cover(the prime implicant covering the most uncovered minterms first)
+
+        Returns:
+            int: bitset of prime implicant indices
+        """
+        uncovered, cover = self.coverable, 0
+        while uncovered:
+            row = max(range(self.gene_size), key=lambda row: (self.row_masks[row] & uncovered).bit_count())
+            cover |= 1 << row
+            uncovered &= ~self.row_masks[row]
+        return cover
+
+    def __lower_bound(self, uncovered, excluded):
+        """
+        Count uncovered minterms that have pairwise disjoint candidate prime implicants.
+        each of them needs a different prime implicant, so the count is a lower bound of the remaining cover size.
+        """
+        bound, used_rows = 0, 0
+        # minterms with fewer candidates block fewer others, so they are picked first
+        for candidates in sorted((self.column_rows[column] & ~excluded for column in self.__iterate_bits(uncovered)),
+                                 key=int.bit_count):
+            if not candidates & used_rows:
+                bound += 1
+                used_rows |= candidates
+        return bound
+
+    def __is_budget_exhausted(self):
+        self.nodes += 1
+        if self.nodes > self.node_budget:
+            self.stop_reason = 'node_budget'
+        elif self.nodes % 1024 == 0 and time.perf_counter() - self.start_time > self.time_budget:
+            self.stop_reason = 'time_budget'
+        elif self.nodes % 1024 == 0 and self.cancel_event is not None and self.cancel_event.is_set():
+            self.stop_reason = 'cancelled'
+        self.is_exhausted = self.stop_reason is not None
+        return self.is_exhausted
+
+    def __search(self):
+        """
+        Branch-and-bound search(depth first, with an explicit stack so that deep charts do not hit the recursion limit)
+        a stack item is (uncovered, cover, used, excluded)
+            uncovered (int): bitset of uncovered minterm indices
+            cover (int): bitset of used prime implicant indices
+            used (int): number of used prime implicants
+            excluded (int): bitset of prime implicant indices excluded by earlier branches
+        """
+        stack = [(self.coverable, 0, 0, 0)]
+        while stack:
+            uncovered, cover, used, excluded = stack.pop()
+            if self.__is_budget_exhausted():
+                return
+            if not uncovered:
+                if used < self.best_cover.bit_count():
+                    self.best_cover = cover
+                continue
+            if used + self.__lower_bound(uncovered, excluded) >= self.best_cover.bit_count():
+                continue
+
+            # branch on the uncovered minterm with the fewest candidate prime implicants
+            branch_candidates = None
+            for column in self.__iterate_bits(uncovered):
+                candidates = self.column_rows[column] & ~excluded
+                if branch_candidates is None or candidates.bit_count() < branch_candidates.bit_count():
+                    branch_candidates = candidates
+                    if candidates.bit_count() <= 1:
+                        break
+            if not branch_candidates: # the minterm cannot be covered in this branch
+                continue
+
+            rows = sorted(self.__iterate_bits(branch_candidates),
+                          key=lambda row: (self.row_masks[row] & uncovered).bit_count(), reverse=True)
+            branches = []
+            for row in rows:
+                branches.append((uncovered & ~self.row_masks[row], cover | (1 << row), used + 1, excluded))
+                excluded |= 1 << row
+            stack.extend(reversed(branches)) # the first branch is searched first
+
+    def __to_genome(self, cover):
+        """
+        Convert a bitset of prime implicant indices to the genome format(i-th bit selects the (gene_size - 1 - i)-th prime implicant)
+        """
+        genome = 0
+        for row in self.__iterate_bits(cover):
+            genome |= 1 << (self.gene_size - 1 - row)
+        return genome
+
+    def process(self, prime_implicants, minterms):
+        """
+        Exact Cover Solver main process
+
+        Args:
+            prime_implicants (list[tuple[int]]): prime implicants
+            minterms (list[int]): minterms
+
+        Returns:
+            (dict, list, tuple, list, dict): fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params
+                fitness_data, max_genomes and genetic_diversity are empty(no epoch),
+                visualization_params['exact'] has the search statistics.
+        """
+        self.__set_prime_implicants(prime_implicants)
+        self.__set_minterms(minterms)
+        self.__build_chart()
+        self.start_time = time.perf_counter()
+        self.best_cover = self.__greedy_cover()
+        self.__search()
+
+        covered_minterms = self.coverable.bit_count()
+        used_prime_implicants = self.best_cover.bit_count()
+        fitness = self.weight * covered_minterms + self.gene_size - used_prime_implicants
+        best_solution = (self.__to_genome(self.best_cover), fitness, covered_minterms, used_prime_implicants, -1)
+
+        visualization_params = {'gene_size': self.gene_size,
+                                'minterms': self.minterms,
+                                'prime_implicants': self.prime_implicants,
+                                'stop_reason': self.stop_reason,
+                                'exact': {'nodes': self.nodes,
+                                          'is_optimal': not self.is_exhausted,
+                                          'elapsed_time': time.perf_counter() - self.start_time}}
+        return {'average': [], 'max': [], 'min': []}, [], best_solution, [], visualization_params
@@ -1,22 +1,38 @@
 """ 
 Genetic Algorithm Implementation
-    1. Initialize the population with random genomes. [ __init_population method ]
+    1. Initialize the population with random genomes, optionally seeded with greedy/sparse covers. [ __init_population method ]
     2. Evaluate the fitness of each genome. [ evaluate_fitness method ]
     3. Select the parents based on the fitness. [ __selection method ]
     4. Generate the next generation by crossover(mixing the genes of the parents) [ __crossover method ] 
     5. Mutate the genes of the next generation. [ __mutation method ]
+       (optional) Refine the best genomes of the generation by local search(memetic step). [ __local_search method ]
     6. Replace the current generation with the next generation. [ __generate_next_genomes method ]
-    7. Repeat steps 2-6 until maximum epoch is reached.
+    7. Repeat steps 2-6 until maximum epoch is reached or an early stopping rule is met(parameters['early_stopping']).
+    The run is saved every parameters['checkpoint']['interval'] epochs(and when it is cancelled) and continued by resume.
 """
 
-import math, random
+import math, time
+from collections import OrderedDict
 
 from strategy.Crossover import Uniform, SinglePoint
-from strategy.Selection import RouletteWheel
+from QuineMcCluskey import covered_indices
+from EarlyStopping import create_early_stopping
+from History import History
+from RandomStream import RandomStream
+from Checkpoint import save_checkpoint, pack_genomes, unpack_genomes
+from strategy.Mutation import BitFlip
+from strategy.LocalSearch import GreedyCoverRefinement, coverage_lists
+from strategy.Initialization import UniformRandom, GreedyCover, SparseCover
+from strategy.Selection import RouletteWheel, AliasMethod, StochasticUniversalSampling, Tournament
 
 class GeneticAlgorithm:
-    def __init__(self, parameters, strategy):
+    def __init__(self, parameters, strategy, metrics=None, cancel_event=None, rng=None):
         self.prime_implicants = None
+        # random number stream of the whole run, seeded by parameters['seed'](os entropy if not given)
+        self.rng = rng if rng is not None else RandomStream(parameters.get("seed"))
+        self.metrics = metrics # Instrumentation.Metrics receiver, None: not measured
+        self.cancel_event = cancel_event # stop after the current epoch when it is set, None: not cancellable
+        self.epoch_metrics = {}
         self.minterms = None
 
         # paramerter dictionary unpacking
@@ -26,21 +42,47 @@ class GeneticAlgorithm:
         self.mutation_rate = float(parameters["mutation_rate"])
         self.parent_population_size = int(parameters["parent_population_size"])
         self.bit_mutation_rate = float(parameters["bit_mutation_rate"])
+        self.fitness_cache_size = int(parameters.get("fitness_cache_size", 10 * self.population_size)) # 0: no cache
+        self.local_search_size = int(parameters.get("local_search_size", 0)) # best genomes refined per generation, 0: no local search
+        # ratio of the initial population created by each seeding strategy, the rest is uniform random
+        self.initialization = {name: float(ratio) for name, ratio in parameters.get("initialization", {}).items()}
+        for name in self.initialization:
+            if name not in ('greedy', 'sparse'):
+                raise ValueError(f"Unknown initialization strategy: {name}")
+        self.parameters = parameters
+        self.strategy = strategy
+        checkpoint = parameters.get("checkpoint") or {}
+        self.checkpoint_path = checkpoint.get('path') # None: no checkpoint
+        self.checkpoint_interval = int(checkpoint.get('interval', 1000))
 
         # strategy dictionary unpacking
         if strategy['crossover'] == 'uniform':
-            self.crossover_strategy = Uniform()
+            self.crossover_strategy = Uniform(self.rng)
         else: 
-            self.crossover_strategy = SinglePoint()
-        self.selection_strategy = RouletteWheel(self.population_size)
+            self.crossover_strategy = SinglePoint(self.rng)
+        selection = strategy.get('selection', 'roulette_wheel')
+        if selection == 'alias':
+            self.selection_strategy = AliasMethod(self.rng)
+        elif selection == 'stochastic_universal':
+            self.selection_strategy = StochasticUniversalSampling(self.rng)
+        elif selection == 'tournament':
+            self.selection_strategy = Tournament(int(strategy.get('tournament_size', 2)), self.rng)
+        elif selection == 'roulette_wheel':
+            self.selection_strategy = RouletteWheel(self.population_size, self.rng)
+        else:
+            raise ValueError(f"Unknown selection strategy: {selection}")
+        self.mutation_strategy = BitFlip(self.mutation_rate, self.bit_mutation_rate, self.rng)
 
         # best solution (genome, fitness, covered minterms, used prime implicants, epoch)
         self.best_solution = (0, -math.inf, -math.inf, math.inf, -1)
 
-        # data for visualization
-        self.genetic_diversity = []
-        self.fitness_data = {'average': [], 'max': [], 'min': []}
-        self.max_genomes = []
+        # data for visualization, recorded by the history policy(parameters['history']) once the gene size is known
+        self.history = None
+
+        # fitness memoization (key: genome, value: (fitness, covered minterms)), least recently used genome is evicted first
+        self.fitness_cache = OrderedDict()
+        # running totals and the last epoch only, so the statistics do not grow with the epochs(bounded history)
+        self.cache_statistics = {'hits': 0, 'misses': 0, 'epoch_hits': 0, 'epoch_misses': 0}
     
     def __set_minterms(self, minterms):
         self.minterms = minterms
@@ -49,6 +91,22 @@ class GeneticAlgorithm:
         self.prime_implicants = prime_implicants
         self.gene_size = len(self.prime_implicants) # number of prime implicants
 
+    def __build_coverage_index(self):
+        """
+        Build the coverage bitmask of each genome bit once per process.
+        i-th bit of the genome selects the (gene_size - 1 - i)-th prime implicant,
+        and j-th bit of the mask is set when the prime implicant covers the j-th (unique) minterm.
+        """
+        minterm_to_idx = {minterm: idx for idx, minterm in enumerate(dict.fromkeys(self.minterms))}
+        self.coverage_masks = []
+        for i in range(self.gene_size):
+            mask = 0
+            for idx in covered_indices(self.prime_implicants[self.gene_size - 1 - i], minterm_to_idx):
+                mask |= 1 << idx
+            self.coverage_masks.append(mask)
+        self.minterm_count = len(minterm_to_idx)
+        self.coverage_index_lists = None # built on first use(seeding, local search)
+
     def __evaluate_genetic_diversity(self, genomes):
         """
         Evaluate the genetic diversity of the population
@@ -63,30 +121,91 @@ class GeneticAlgorithm:
 
     def __init_population(self):
         """
-        Initialize the population with random genomes.
+        Initialize the population with seeded genomes(parameters['initialization']) and random genomes.
 
         Returns:
-            list[int]: list of random genomes
+            list[int]: list of initial genomes
         """
-        bit_limit = 1 << self.gene_size  # 2 ** self.gene_size
-        random_genomes = []
-        for _ in range(self.population_size): # select random genome from 0 to 2 ** self.gene_size - 1
-            random_genomes.append(random.randrange(bit_limit))
-        return random_genomes
-
-    def __mutation(self, genome):
-        if random.random() < self.mutation_rate:
-            for i in range(self.gene_size):
-                if random.random() < self.bit_mutation_rate:
-                    genome ^= (1 << i)  # flip i-th bit
-        return genome
-
-    def __crossover(self, parents):
-        return self.crossover_strategy.process(parents, self.gene_size)
+        strategies = []
+        if self.initialization:
+            bit_minterms, minterm_bits = self.__coverage_lists()
+            strategies = [(GreedyCover(bit_minterms, minterm_bits, self.rng), self.initialization.get('greedy', 0.0)),
+                          (SparseCover(bit_minterms, minterm_bits, self.rng), self.initialization.get('sparse', 0.0))]
+        genomes = []
+        for strategy, ratio in strategies:
+            for _ in range(min(round(ratio * self.population_size), self.population_size - len(genomes))):
+                genomes.append(strategy.process(self.gene_size))
+        uniform_random = UniformRandom(self.rng)
+        while len(genomes) < self.population_size:
+            genomes.append(uniform_random.process(self.gene_size))
+        return genomes
+
+    def __mutation(self, genomes):
+        return self.mutation_strategy.process_batch(genomes, self.gene_size)
+
+    def __crossover(self, parents_list):
+        return self.crossover_strategy.process_batch(parents_list, self.gene_size)
 
     def __selection(self, genomes):
         return self.selection_strategy.process(self.parent_population_size, genomes)
 
+    def __coverage_lists(self):
+        """
+        Returns:
+            (list[list[int]], list[list[int]]): minterm indices covered by each genome bit, genome bits covering each minterm
+        """
+        if self.coverage_index_lists is None:
+            self.coverage_index_lists = coverage_lists(self.coverage_masks, self.minterm_count)
+        return self.coverage_index_lists
+
+    def __local_search(self, genomes_with_fitness, epoch):
+        """
+        Replace the best local_search_size genomes with their refined genomes(full cover without redundant prime implicants)
+
+        Args:
+            genomes_with_fitness (list[(int, int)]): list of genomes with fitness (fitness, genome)
+            epoch (int): current epoch
+
+        Returns:
+            (int, int, int, list[(int, int)]): result of the evaluation after the refinement ( total_fitness, min_genome, max_genome, genomes_with_fitness) )
+        """
+        best_indices = sorted(range(len(genomes_with_fitness)), key=lambda idx: genomes_with_fitness[idx][0], reverse=True)
+        for idx in best_indices[:self.local_search_size]:
+            genome, covered_minterms, used_prime_implicant = self.local_search_strategy.process(genomes_with_fitness[idx][1])
+            fitness = self.weight * covered_minterms + self.gene_size - used_prime_implicant
+            if fitness <= genomes_with_fitness[idx][0]:
+                continue
+            genomes_with_fitness[idx] = (fitness, genome)
+            if self.fitness_cache_size:
+                self.fitness_cache[genome] = (fitness, covered_minterms)
+                if len(self.fitness_cache) > self.fitness_cache_size:
+                    self.fitness_cache.popitem(last=False)
+            if fitness > self.best_solution[1]:
+                self.best_solution = (genome, fitness, covered_minterms, used_prime_implicant, epoch)
+
+        # evaluation result of the refined generation, same tie-breaking as __evaluate_fitness
+        min_genome = [math.inf, None]
+        max_genome = [-math.inf, None]
+        total_fitness = 0
+        for fitness, genome in genomes_with_fitness:
+            total_fitness += fitness
+            if fitness < min_genome[0]:
+                min_genome = [fitness, genome]
+            if fitness > max_genome[0]:
+                max_genome = [fitness, genome]
+        return (total_fitness, min_genome, max_genome, genomes_with_fitness)
+
+    def __run_phase(self, phase, function, *args):
+        """
+        Run one phase of the epoch and keep its time if metrics are measured
+        """
+        if self.metrics is None:
+            return function(*args)
+        start_time = time.perf_counter()
+        result = function(*args)
+        self.epoch_metrics[phase] = time.perf_counter() - start_time
+        return result
+
     def __generate_next_genomes(self, genomes):
         """
         Generate the next genomes by selection, crossover and mutation.
@@ -97,15 +216,14 @@ class GeneticAlgorithm:
         Returns:
             list[int]: next generation list of genomes
         """
-        parent_genomes = self.__selection(genomes)
-        next_genomes = []
+        parent_genomes = self.__run_phase('select', self.__selection, genomes)
+        parents_list = []
         for _ in range(self.population_size):
-            random_number1 = random.randrange(self.parent_population_size)
-            random_number2 = random.randrange(self.parent_population_size)
-            next_genomes.append(
-                self.__mutation(self.__crossover((parent_genomes[random_number1], parent_genomes[random_number2]))))
-        self.genetic_diversity.append(self.__evaluate_genetic_diversity(next_genomes))
-        return next_genomes
+            random_number1 = self.rng.randrange(self.parent_population_size)
+            random_number2 = self.rng.randrange(self.parent_population_size)
+            parents_list.append((parent_genomes[random_number1], parent_genomes[random_number2]))
+        return self.__run_phase('mutate', self.__mutation,
+                                self.__run_phase('crossover', self.__crossover, parents_list))
 
     def __evaluate_fitness(self, genomes, epoch):
         """
@@ -126,22 +244,33 @@ class GeneticAlgorithm:
         max_genome = [-math.inf, None]
         total_fitness = 0
 
-        # using set for faster search
-        minterms = set(self.minterms)
+        coverage_masks = self.coverage_masks
+        total_prime_implicants = self.gene_size
+        fitness_cache = self.fitness_cache
+        cache_hits = 0
 
         for genome in genomes:
             used_prime_implicant = genome.bit_count()
-            cover_set = set() # len(cover_set):  number of covered minterms
-
-            # find covered minterms
-            for i in range(self.gene_size): # i: index of prime implicant
-                if (genome >> i) & 1: # check back to front(gene_size - 1 to 0-th bit)
-                    for covered_minterm in self.prime_implicants[self.gene_size - 1 - i]:
-                        if covered_minterm in minterms:
-                            cover_set.add(covered_minterm)
-            # evaluate fitness
-            covered_minterms, total_prime_implicants = len(cover_set), len(self.prime_implicants)
-            fitness = self.weight * covered_minterms  + total_prime_implicants - used_prime_implicant
+            if genome in fitness_cache:
+                fitness_cache.move_to_end(genome)
+                fitness, covered_minterms = fitness_cache[genome]
+                cache_hits += 1
+            else:
+                cover_mask = 0 # cover_mask.bit_count(): number of covered minterms
+
+                # find covered minterms, visiting only the set bits of the genome
+                remaining = genome
+                while remaining:
+                    lowest_bit = remaining & -remaining
+                    cover_mask |= coverage_masks[lowest_bit.bit_length() - 1]
+                    remaining ^= lowest_bit
+                # evaluate fitness
+                covered_minterms = cover_mask.bit_count()
+                fitness = self.weight * covered_minterms  + total_prime_implicants - used_prime_implicant
+                if self.fitness_cache_size:
+                    fitness_cache[genome] = (fitness, covered_minterms)
+                    if len(fitness_cache) > self.fitness_cache_size:
+                        fitness_cache.popitem(last=False) # evict the least recently used genome
             total_fitness += fitness
 
             # update min_genome, max_genome and best_solution
@@ -152,39 +281,127 @@ class GeneticAlgorithm:
 
             # update best_solution
             if fitness > self.best_solution[1]:
-                self.best_solution = (genome, fitness, len(cover_set), used_prime_implicant, epoch)
+                self.best_solution = (genome, fitness, covered_minterms, used_prime_implicant, epoch)
 
             genomes_with_fitness.append((fitness, genome))
+        self.cache_statistics['epoch_hits'], self.cache_statistics['epoch_misses'] = cache_hits, len(genomes) - cache_hits
+        self.cache_statistics['hits'] += cache_hits
+        self.cache_statistics['misses'] += len(genomes) - cache_hits
         return (total_fitness, min_genome, max_genome, genomes_with_fitness)
     
-    def process(self, prime_implicants, minterms):
+    def __save_checkpoint(self, epoch, genomes, early_stopping, context):
+        """
+        Save the state to continue the run from the given epoch
+        """
+        save_checkpoint(self.checkpoint_path, {'epoch': epoch,
+                                               'genomes': pack_genomes(genomes, self.gene_size),
+                                               'gene_size': self.gene_size,
+                                               'best_solution': self.best_solution,
+                                               'rng': self.rng,
+                                               'history': self.history,
+                                               'cache_statistics': self.cache_statistics,
+                                               'early_stopping': early_stopping.getstate() if early_stopping else None,
+                                               'parameters': self.parameters,
+                                               'strategy': self.strategy,
+                                               'prime_implicants': self.prime_implicants,
+                                               'minterms': self.minterms,
+                                               'context': context})
+
+    def __prepare(self, prime_implicants, minterms):
+        self.__set_prime_implicants(prime_implicants)
+        self.__set_minterms(minterms)
+        self.__build_coverage_index()
+        if self.local_search_size:
+            self.local_search_strategy = GreedyCoverRefinement(*self.__coverage_lists())
+
+    def process(self, prime_implicants, minterms, migration=None, context=None):
         """
         Genetic Algorithm main process
 
         Args:
             prime_implicants (list[tuple[int]]): prime implicants
             minterms (list[int]): minterms
+            migration (callable, optional): migration(epoch, genomes_with_fitness) -> genomes_with_fitness,
+                called after the evaluation of each epoch to exchange genomes with other populations. Defaults to None.
+            context (object, optional): picklable data saved in the checkpoints(e.g. the testcase). Defaults to None.
 
         Returns:
             (dict, list, tuple, list, dict): fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params
         """
-        self.__set_prime_implicants(prime_implicants)
-        self.__set_minterms(minterms)
-        genomes = self.__init_population()
-        for epoch in range(self.epoch):
-            total_fitness, min_genome, max_genome, genomes_with_fitness = self.__evaluate_fitness(genomes, epoch)
-
-            # set fitness data
-            self.fitness_data['average'].append(total_fitness / self.population_size)
-            self.fitness_data['max'].append(max_genome[0])
-            self.fitness_data['min'].append(min_genome[0])
-            
-            # set hitmap data
-            self.max_genomes.append(max_genome[1])
+        self.__prepare(prime_implicants, minterms)
+        self.history = History(self.gene_size, self.parameters.get("history"), self.rng.spawn(1)[0])
+        early_stopping = create_early_stopping(self.parameters, self.prime_implicants, self.minterms, self.cancel_event)
+        return self.__run(0, self.__init_population(), early_stopping, migration, context)
 
-            genomes = self.__generate_next_genomes(genomes_with_fitness)
+    @classmethod
+    def resume(cls, state, metrics=None, cancel_event=None):
+        """
+        Continue the run of a checkpoint without Quine-McCluskey(the prime implicants and minterms are in the checkpoint)
+
+        Args:
+            state (dict): checkpoint state(Checkpoint.load_checkpoint)
+            metrics (Instrumentation.Metrics, optional): per-epoch metrics receiver. Defaults to None.
+            cancel_event (multiprocessing.Event, optional): stop after the current epoch when it is set. Defaults to None.
+
+        Returns:
+            (dict, list, tuple, list, dict): same as process, the history has the epochs before the checkpoint too
+        """
+        algorithm = cls(state['parameters'], state['strategy'], metrics, cancel_event, state['rng'])
+        algorithm.__prepare(state['prime_implicants'], state['minterms'])
+        algorithm.best_solution = state['best_solution']
+        algorithm.history = state['history']
+        algorithm.cache_statistics = state['cache_statistics']
+        early_stopping = create_early_stopping(algorithm.parameters, algorithm.prime_implicants, algorithm.minterms, cancel_event)
+        if early_stopping and state['early_stopping']:
+            early_stopping.setstate(state['early_stopping'])
+        genomes = unpack_genomes(state['genomes'], algorithm.gene_size)
+        return algorithm.__run(state['epoch'], genomes, early_stopping, None, state['context'])
+
+    def __run(self, start_epoch, genomes, early_stopping, migration, context):
+        """
+        Run the epochs from start_epoch
 
+        Returns:
+            (dict, list, tuple, list, dict): fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params
+        """
+        for epoch in range(start_epoch, self.epoch):
+            total_fitness, min_genome, max_genome, genomes_with_fitness = self.__run_phase('evaluate', self.__evaluate_fitness, genomes, epoch)
+            if self.local_search_size:
+                total_fitness, min_genome, max_genome, genomes_with_fitness = self.__run_phase('local_search', self.__local_search,
+                                                                                               genomes_with_fitness, epoch)
+            average_fitness = total_fitness / self.population_size
+
+            if migration:
+                genomes_with_fitness = migration(epoch, genomes_with_fitness)
+            genomes = self.__generate_next_genomes(genomes_with_fitness)
+            genetic_diversity = self.__evaluate_genetic_diversity(genomes)
+
+            # set fitness, hitmap and genetic diversity data
+            self.history.record(epoch, average_fitness, max_genome[0], min_genome[0], max_genome[1], genetic_diversity)
+            if self.metrics is not None:
+                self.metrics.on_genetic_algorithm_epoch({'epoch': epoch, **self.epoch_metrics,
+                                                         'evaluations': self.cache_statistics['epoch_misses'],
+                                                         'cache_hits': self.cache_statistics['epoch_hits'],
+                                                         'unique_genomes': genetic_diversity,
+                                                         'max_fitness': max_genome[0],
+                                                         'average_fitness': average_fitness,
+                                                         'best_fitness': self.best_solution[1]})
+
+            stop = early_stopping is not None and early_stopping.should_stop(epoch, self.best_solution, genetic_diversity)
+            if self.checkpoint_path and ((epoch + 1) % self.checkpoint_interval == 0 and not stop
+                                         or stop and early_stopping.stop_reason == 'cancelled'):
+                self.__save_checkpoint(epoch + 1, genomes, early_stopping, context)
+            if stop:
+                break
+        self.history.finish()
+
+        epochs, fitness_data, max_genomes, genetic_diversity = self.history.series()
+        self.history.close()
         visualization_params = {'gene_size': self.gene_size,
                                 'minterms': self.minterms,
-                                'prime_implicants': self.prime_implicants}
-        return self.fitness_data, self.max_genomes, self.best_solution, self.genetic_diversity, visualization_params
\ No newline at end of file
+                                'prime_implicants': self.prime_implicants,
+                                'cache_statistics': self.cache_statistics,
+                                'epochs': epochs,
+                                'seed': self.rng.root_seed,
+                                'stop_reason': early_stopping.stop_reason if early_stopping else None}
+        return fitness_data, max_genomes, self.best_solution, genetic_diversity, visualization_params
\ No newline at end of file
@@ -1,22 +1,29 @@
 """
     Main application for running the Genetic, Quine-McCluskey algorithm
+    The algorithms run in a background process, the GUI polls its messages(log, per-epoch progress, result) with after().
+    The series of a run are saved to series.npz and the plots are rendered from it in a process pool(Visualization module).
+    Visualization(numpy) is imported with the first result, so the GUI starts without numpy(then only result.txt is saved).
 """
 
-import os, json, time
+import os, json, queue, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-import matplotlib.pyplot as plt
 import tkinter as tk
 from tkinter import filedialog, Listbox
 
-from QuineMcCluskey import QuineMcCluskey
-from GeneticAlgorithm import GeneticAlgorithm
+from Pipeline import run_testcase_worker
 
 
 class GeneticQM(tk.Tk):
+    POLL_INTERVAL = 100 # milliseconds between the polls of the worker messages
+
     def __init__(self):
         super().__init__() # initialize the GUI
         self.title("Genetic Quine-McCluskey")
+        self.worker = None # background process of the running testcase
+        self.plot_executor = None # process pool of the plots, created with the first plot
+        self.plot_futures = []
         self.__create_widgets()
 
     def __create_widgets(self):
@@ -38,12 +45,29 @@ class GeneticQM(tk.Tk):
         self.run_button = tk.Button(self, text="Run", command=self.process)
         self.run_button.grid(row=0, column=3, sticky="e")
 
+        # Cancel Button(stops the genetic algorithm after the current epoch, the epochs so far are saved)
+        self.cancel_button = tk.Button(self, text="Cancel", command=self.__cancel, state=tk.DISABLED)
+        self.cancel_button.grid(row=0, column=4, sticky="e")
+
         # Log window
         self.log = Listbox(self)
-        self.log.grid(row=1, columnspan=4, sticky="we")
+        self.log.grid(row=1, columnspan=5, sticky="we")
+
+        # Progress of the running genetic algorithm
+        self.progress_label = tk.Label(self, anchor="w")
+        self.progress_label.grid(row=2, columnspan=5, sticky="we")
 
         self.__write_log("Application started")
 
+    def destroy(self):
+        """
+            Stop the plot process pool with the window, the pending plots are cancelled
+        """
+        if self.plot_executor is not None:
+            self.plot_executor.shutdown(wait=False, cancel_futures=True)
+            self.plot_executor = None
+        super().destroy()
+
     def __browse_file(self):
         """
             Open a file dialog to select a testcase file(.json)
@@ -76,181 +100,84 @@ class GeneticQM(tk.Tk):
         os.makedirs(output_directory, exist_ok=True)
         return output_directory
 
-    def __plot_fitness(self, data, title="Fitness Plot"):
-        """
-            Save the fitness plot to the output directory
-
-        Args:
-            data (dict[str, num]): fitness data (min, average, max)
-            title (str, optional): plot title. Defaults to "Fitness Plot".
-        """
-        # x-axis: epoch, y-axis: fitness
-        epoch = len(data['average'])
-        plt.plot(range(epoch),data['min'], label='Min Fitness', color='green')
-        plt.plot(range(epoch),data['average'], label='Average Fitness', color='blue')
-        plt.plot(range(epoch),data['max'], label='Max Fitness', color='orange')
-
-        plt.title(title)
-        plt.xlabel("Epoch")
-        plt.ylabel("Fitness")
-        plt.legend(loc='best', framealpha=0.5)
-        plt.savefig(f"{os.path.join(self.output_directory, 'Fitness_Plot.png')}")
-        plt.close()
-
-    def __plot_normalized_fitness(self, data, title="Normalized Fitness Plot"):
-        epoch = len(data['average'])
-        
-        # normalize the average fitness data
-        max_average, min_average = max(data['average']), min(data['average'])
-        normalized_epoch = list(map(lambda x: x / epoch, range(epoch)))
-        normalized_fitness_data = list(map(lambda x: (x - min_average) / (max_average - min_average), data['average']))
-
-        # x-axis: epoch, y-axis: normalized fitness
-        plt.plot(normalized_epoch, normalized_fitness_data, label='Average Fitness', color='blue')
-
-        plt.title(title)
-        plt.xlabel("Epoch")
-        plt.ylabel("Fitness")
-        plt.legend(loc='best', framealpha=0.5)
-        plt.savefig(f"{os.path.join(self.output_directory, 'Normalized_Fitness_Plot.png')}")
-        plt.close()
-
-    def __binary_gene_to_list(self, gene, gene_size):
-        """
-        Convert a binary genome to a list of 0s and 1s for visualization
-
-        Args:
-            gene (int): number type genome
-            gene_size (int): bit size of the genome
-
-        Returns:
-            list[int]: list type genome (0s and 1s)
-        """
-        ret = [0 for _ in range(gene_size)]
-        for i in range(gene_size):
-            if (gene >> i) & 1:
-                ret[gene_size - 1 - i] = 1
-        return ret
-
-    def __generate_minterm_cover_list(self, gene, gene_size, prime_implicants, minterms):
-        """
-        Generate a list of minterm coverage for the given genome 
-
-        Args:
-            gene (int): int type genome
-            gene_size (int): bit size of the genome
-            prime_implicants (list[tuple[int]]): list of prime implicants(set of minterms)
-            minterms (list[int]): list of minterms
-
-        Returns:
-            list[int]: list of minterm coverage
-        """
-        minterm_to_idx = dict()
-        for i, idx in enumerate(minterms):
-            minterm_to_idx[idx] = i
-        ret = [0 for _ in range(len(minterms))]
-        for i in range(gene_size):
-            if (gene >> i) & 1:
-                for j in prime_implicants[gene_size - 1 - i]:
-                    if j in minterm_to_idx:
-                        ret[minterm_to_idx[j]] += 1
-        return ret
-
-    def __plot_genetic_diversity(self, data, title="Genetic Diversity Plot"):
-        """_summary_
-
-        Args:
-            data (list[int]): genetic diversity data(number of unique genomes)
-            title (str, optional): plot title. Defaults to "Genetic Diversity Plot".
-        """
-
-        # x-axis: epoch, y-axis: genetic diversity
-        epoch = len(data)
-        plt.plot(range(epoch), data, label='Genetic Diversity', color='purple')
-
-        plt.title(title)
-        plt.xlabel("Epoch")
-        plt.ylabel("Genetic Diversity")
-        plt.savefig(f"{os.path.join(self.output_directory, 'Genetic_Diversity_Plot.png')}")
-        plt.close()
-    
-    def __plot_group_genetic_diversity(self, data, group=10, title="Genetic Diversity(Group) Plot"):
-        """
-        Plot the genetic diversity for each group of epochs(average of group epochs) 
-
-        Args:
-            data (list[int]): genetic diversity data(number of unique genomes)
-            group (int, optional): number of epochs in a group. Defaults to 10.
-            title (str, optional): plot title. Defaults to "Genetic Diversity(Group) Plot".
-        """
-        if len(data) % group != 0:
-            raise ValueError("Population size % group should be 0")
-        
-        # x-axis: epoch, y-axis: genetic diversity
-        group_size = len(data) // group
-        x_data = range(0, len(data) - 1, group_size)
-        
-        # calculate the average of the group epochs
-        group_data = []
-        for i in range(0, len(data) - 1, group_size):
-            group = sum(data[i:i + group_size]) / group_size
-            group_data.append(group)
-        
-        # plot the group genetic diversity
-        plt.plot(x_data, group_data, color='purple')
-        plt.title(title)
-        plt.xlabel("Epoch")
-        plt.ylabel("Genetic Diversity")
-        plt.savefig(f"{os.path.join(self.output_directory, 'Genetic_Diversity_Group_Plot.png')}")
-        plt.close()
-
-    def __plot_hitmap(self, data, color, title="Hitmap Plot", has_colorbar=False, has_min_limit=False):
-        """
-        Plot a hitmap for the given data
-
-        Args:
-            data (list[int]): hitmap data 
-            color (str): color map
-            title (str, optional): Plot title. Defaults to "Hitmap Plot".
-            has_colorbar (bool, optional): colorbar option. Defaults to False.
-            has_min_limit (bool, optional): minimum limit option. Defaults to False.
-        """
-        plt.matshow(data, cmap=plt.get_cmap(color))
-        plt.title(title)
-        if has_colorbar:
-            plt.colorbar(shrink=0.8, aspect=10)
-        if has_min_limit:
-            plt.clim(vmin=0)
-        plt.savefig(f"{os.path.join(self.output_directory, title + '.png')}")
-        plt.close()
-
     def process(self):
         """
-            Run the Quine-McCluskey algorithm and the Genetic Algorithm
+            Start the Quine-McCluskey algorithm and the Genetic Algorithm in a background process
         """
-
+        if self.worker is not None: # a testcase is already running
+            return
         with open(self.testcase_entry.get(), 'r') as json_file:
             testcase = json.load(json_file)
-            self.__write_log(f"Testcase loaded")
-            self.output_directory = self.__create_output_directory()
-            self.__write_log(f"Output directory created{self.output_directory}")
-            qm = QuineMcCluskey(testcase["minterms"], testcase["dontcares"], self.output_directory)
-            prime_implicants, minterms = qm.process() # get prime implicants and minterms
-            self.__write_log("Quine-McCluskey process completed")
-
-            # initialize the algorithm
-            self.algorithm = GeneticAlgorithm(testcase["parameters"], testcase["strategy"])
-
-            # run the algorithm
-            start_time = time.time()
-            fitness_data, max_genomes, best_solution, diversity_data, visualization_params = self.algorithm.process(prime_implicants, minterms)
-            end_time = time.time() 
-            self.__write_log("Genetic Algorithm process completed")
-            self.__write_log(f"Excution Time: {end_time - start_time:.5f} seconds")
+        self.__write_log(f"Testcase loaded")
+        self.output_directory = self.__create_output_directory()
+        self.__write_log(f"Output directory created{self.output_directory}")
+
+        self.testcase = testcase
+        self.message_queue = multiprocessing.Queue()
+        self.cancel_event = multiprocessing.Event()
+        self.worker = multiprocessing.Process(target=run_testcase_worker,
+                                              args=(testcase, self.output_directory, self.message_queue, self.cancel_event),
+                                              daemon=True)
+        self.worker.start()
+        self.run_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.after(self.POLL_INTERVAL, self.__poll_worker)
+
+    def __cancel(self):
+        """
+            Request the running genetic algorithm to stop
+        """
+        self.cancel_event.set()
+        self.cancel_button.config(state=tk.DISABLED)
+        self.__write_log("Cancel requested")
+
+    def __finish_worker(self):
+        self.worker.join()
+        self.worker = None
+        self.run_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+
+    def __poll_worker(self):
+        """
+            Handle the messages of the background process and poll again until the result arrives
+        """
+        while True:
+            try:
+                kind, payload = self.message_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'log':
+                self.__write_log(payload)
+            elif kind == 'epoch': # only the latest epoch is shown
+                self.progress_label.config(text=f"Epoch: {payload['epoch']}  Best Fitness: {payload['best_fitness']}  "
+                                                f"Genetic Diversity: {payload['unique_genomes']}")
+            elif kind == 'result':
+                self.__finish_worker()
+                self.__save_results(self.testcase, payload)
+                return
+            else: # error
+                self.__finish_worker()
+                self.__write_log("Run failed")
+                for line in payload.splitlines():
+                    self.__write_log(line)
+                return
+        if not self.worker.is_alive() and self.message_queue.empty(): # exited without a result
+            self.__finish_worker()
+            self.__write_log("Run failed: worker process exited")
+            return
+        self.after(self.POLL_INTERVAL, self.__poll_worker)
+
+    def __save_results(self, testcase, result):
+        """
+            Save result.txt and the plots of a finished(or cancelled) run
+        """
+        fitness_data, best_solution = result['fitness_data'], result['best_solution']
+        visualization_params = result['visualization_params']
 
         gene_size = visualization_params['gene_size']
-        prime_implicants = visualization_params['prime_implicants']
         minterms = visualization_params['minterms']
+        if visualization_params.get('stop_reason'):
+            self.__write_log(f"Genetic Algorithm stopped: {visualization_params['stop_reason']}")
 
         # write the results to result.txt
         with open(os.path.join(self.output_directory, "result.txt"), 'w') as f:
@@ -260,16 +187,47 @@ class GeneticQM(tk.Tk):
             f.write(f"Number of Covered Minterms: {best_solution[2]}\n")
             f.write(f"Covered Minterms / Total Minterms: {(best_solution[2]/len(minterms)) * 100}%\n")
             f.write(f"Epoch: {best_solution[4]}\n")
-
-        # save the visualization results
-        self.__plot_fitness(fitness_data)
-        self.__plot_normalized_fitness(fitness_data)
-        self.__plot_genetic_diversity(diversity_data)
-        self.__plot_group_genetic_diversity(diversity_data, group=testcase["visualization"]["group"])
-        best_genome_data = list(map(lambda gene: self.__binary_gene_to_list(gene, gene_size), max_genomes))
-        self.__plot_hitmap(best_genome_data, 'Blues', title="Prime_Implicants_Usage_Heatmap")
-        best_genome_cover_data = list(map(lambda gene: self.__generate_minterm_cover_list(gene, gene_size, prime_implicants, minterms), max_genomes))
-        self.__plot_hitmap(best_genome_cover_data, 'Greys', title="Minterm_Coverage_Hitmap", has_colorbar=True, has_min_limit=True)
+            if visualization_params.get('seed') is not None:
+                f.write(f"Seed: {visualization_params['seed']}\n")
+            if visualization_params.get('stop_reason'):
+                f.write(f"Stop Reason: {visualization_params['stop_reason']}\n")
+            if 'cache_statistics' in visualization_params:
+                cache_statistics = visualization_params['cache_statistics']
+                f.write(f"Fitness Cache Hits / Misses: {cache_statistics['hits']} / {cache_statistics['misses']}\n")
+
+        # save the series and render the requested plots in the background
+        if not fitness_data['max']: # no genetic algorithm epoch(e.g. the reduced PI chart is empty)
+            return
+        try:
+            from Visualization import SERIES_FILE, save_series, render_plots # numpy is only required for the series and plots
+        except ImportError as error:
+            self.__write_log(f"Series and plots skipped: {error}")
+            return
+        visualization = testcase["visualization"]
+        series_path = os.path.join(self.output_directory, SERIES_FILE)
+        save_series(series_path, result, group=visualization["group"])
+        self.__write_log(f"Series saved {series_path}")
+        plots = visualization.get("plots", []) # rendered only on request
+        if not plots:
+            return
+        if self.plot_executor is None:
+            self.plot_executor = ProcessPoolExecutor(max_workers=visualization.get("plot_workers"))
+        self.plot_futures += render_plots(series_path, self.output_directory, plots, executor=self.plot_executor,
+                                          max_rows=visualization.get("max_heatmap_rows", 500))
+        self.after(self.POLL_INTERVAL, self.__poll_plots)
+
+    def __poll_plots(self):
+        """
+            Log the finished plots and poll again until every plot is rendered
+        """
+        for future in [future for future in self.plot_futures if future.done()]:
+            self.plot_futures.remove(future)
+            if future.exception() is not None:
+                self.__write_log(f"Plot failed: {future.exception()}")
+            else:
+                self.__write_log(f"Plot saved {os.path.basename(future.result())}")
+        if self.plot_futures:
+            self.after(self.POLL_INTERVAL, self.__poll_plots)
 
 if __name__ == '__main__':
     GeneticQM().mainloop()
\ No newline at end of file
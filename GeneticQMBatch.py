@@ -0,0 +1,123 @@
+"""
+    Headless batch runner for the Genetic, Quine-McCluskey algorithm
+    It does not import tkinter or matplotlib, so it starts fast and runs on servers without a display.
+
+    Usage:
+        python GeneticQMBatch.py testcases
+        python GeneticQMBatch.py "testcases/*.json" --workers 4 --trace summary
+"""
+
+import os, json, glob, argparse, traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from Pipeline import run_testcase, summarize_result
+from PrimeImplicantCache import PrimeImplicantCache, DEFAULT_DIRECTORY
+from Instrumentation import JsonLinesSink
+from RandomStream import RandomStream
+
+
+def collect_testcases(paths):
+    """
+    Collect testcase files from directories and glob patterns
+
+    Args:
+        paths (list[str]): directories, files or glob patterns
+
+    Returns:
+        list[str]: sorted testcase file paths without duplicates
+    """
+    testcase_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            testcase_paths.extend(glob.glob(os.path.join(path, '*.json')))
+        else:
+            testcase_paths.extend(glob.glob(path))
+    return sorted(set(testcase_paths))
+
+def run_testcase_file(testcase_path, output_directory, trace, cache_directory=None, cache_max_bytes=None, metrics=False,
+                      series=False, rng=None):
+    """
+    Run one testcase file in a worker process
+
+    Args:
+        testcase_path (str): testcase file path
+        output_directory (str): batch output directory
+        trace (str): Quine-McCluskey trace mode(full, summary, off)
+        cache_directory (str, optional): prime implicant cache directory, None to disable the cache. Defaults to None.
+        cache_max_bytes (int, optional): size limit of the prime implicant cache. Defaults to None.
+        metrics (bool, optional): write per-step/per-epoch metrics to <output>/<testcase>.metrics.jsonl. Defaults to False.
+        series (bool, optional): save the series to <output>/<testcase>.series.npz for Visualization.py. Defaults to False.
+        rng (RandomStream, optional): child stream of the batch seed, used when the testcase has no parameters['seed'].
+            Defaults to None.
+
+    Returns:
+        dict: result record of the testcase
+    """
+    record = {'testcase': testcase_path}
+    try:
+        with open(testcase_path, 'r') as json_file:
+            testcase = json.load(json_file)
+        testcase_directory = os.path.join(output_directory, os.path.splitext(os.path.basename(testcase_path))[0])
+        cache = PrimeImplicantCache(cache_directory, cache_max_bytes) if cache_directory else None
+        sink = JsonLinesSink(testcase_directory + '.metrics.jsonl', testcase=testcase_path) if metrics else None
+        try:
+            if "seed" in testcase["parameters"]: # the seed of the testcase reproduces the same run in the GUI
+                rng = None
+            result = run_testcase(testcase, testcase_directory, trace=trace, cache=cache, metrics=sink, rng=rng)
+            record.update(summarize_result(result))
+            if rng is not None: # RandomStream(seed, spawn_key) reproduces the testcase
+                record['spawn_key'] = list(rng.spawn_key)
+        finally:
+            if sink:
+                sink.close()
+        if series and result['fitness_data']['max']:
+            from Visualization import save_series # numpy is only required for the series
+            save_series(testcase_directory + '.series.npz', result, testcase.get("visualization", {}).get("group", 10))
+    except Exception:
+        record['error'] = traceback.format_exc()
+    return record
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Genetic Quine-McCluskey on many testcase files")
+    parser.add_argument('paths', nargs='+', help="testcase directories, files or glob patterns")
+    parser.add_argument('--output', default=os.path.join("./outputs", f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"),
+                        help="output directory of results.jsonl (and trace files)")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes. Defaults to cpu count")
+    parser.add_argument('--trace', choices=['off', 'summary', 'full'], default='off', help="Quine-McCluskey trace mode")
+    parser.add_argument('--cache-dir', default=DEFAULT_DIRECTORY, help="prime implicant cache directory")
+    parser.add_argument('--cache-max-bytes', type=int, default=64 << 20, help="size limit of the prime implicant cache")
+    parser.add_argument('--no-cache', action='store_true', help="always run Quine-McCluskey")
+    parser.add_argument('--metrics', action='store_true', help="write per-step/per-epoch metrics as json lines per testcase")
+    parser.add_argument('--series', action='store_true', help="save the series as npz per testcase(plots: Visualization.py)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="root seed of the batch, each testcase without parameters.seed gets its own child stream")
+    args = parser.parse_args(argv)
+    cache_directory = None if args.no_cache else args.cache_dir
+
+    testcase_paths = collect_testcases(args.paths)
+    if not testcase_paths:
+        parser.error("no testcase file found")
+    os.makedirs(args.output, exist_ok=True)
+    streams = RandomStream(args.seed).spawn(len(testcase_paths)) if args.seed is not None else [None] * len(testcase_paths)
+
+    # one result record(json line) per testcase file, written in the order of testcase_paths
+    failed = 0
+    with open(os.path.join(args.output, 'results.jsonl'), 'w') as result_file, \
+            ProcessPoolExecutor(max_workers=args.workers) as executor:
+        records = executor.map(run_testcase_file, testcase_paths,
+                               [args.output] * len(testcase_paths), [args.trace] * len(testcase_paths),
+                               [cache_directory] * len(testcase_paths), [args.cache_max_bytes] * len(testcase_paths),
+                               [args.metrics] * len(testcase_paths), [args.series] * len(testcase_paths), streams)
+        for record in records:
+            result_file.write(json.dumps(record) + '\n')
+            result_file.flush()
+            if 'error' in record:
+                failed += 1
+                print(f"[failed] {record['testcase']}")
+            else:
+                print(f"[done] {record['testcase']} fitness={record['fitness']} coverage={record['coverage']:.1f}%")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
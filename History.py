@@ -0,0 +1,210 @@
+"""
+    Memory-bounded history of the genetic algorithm epochs(fitness, best genome and genetic diversity of each epoch)
+        recording policies(parameters['history']['policy']):
+            - full(default): every epoch
+            - every: every interval-th epoch(and the last epoch)
+            - ring: the last size epochs
+            - reservoir: a uniform random sample of size epochs(Algorithm R)
+        the scalar series are typed array buffers, the genomes are fixed-width big-endian bytes
+        that can be spilled to a memory-mapped file(parameters['history']['spill']: file path).
+        a pickled History(checkpoint) keeps the genomes as bytes, the spill file is written again on load.
+        close() closes the spill file once the series are read, the spilled genomes of series() are copied out first.
+"""
+
+import mmap, random
+from array import array
+
+
+class GenomeBuffer:
+    """
+    Fixed-width byte storage of the genomes(int), read as a sequence of ints.
+    """
+    def __init__(self, gene_size, path=None, capacity=1024):
+        self.word_size = max(1, (gene_size + 7) // 8)
+        self.path = path
+        self.length = 0
+        if path is None:
+            self.buffer = bytearray(capacity * self.word_size)
+        else: # memory-mapped file, grown by doubling
+            self.file = open(path, 'w+b')
+            self.file.truncate(capacity * self.word_size)
+            self.buffer = mmap.mmap(self.file.fileno(), capacity * self.word_size)
+
+    def __capacity(self):
+        return len(self.buffer) // self.word_size
+
+    def __grow(self):
+        size = 2 * len(self.buffer)
+        if self.path is None:
+            self.buffer.extend(bytes(len(self.buffer)))
+        else:
+            self.file.truncate(size)
+            self.buffer.resize(size)
+
+    def __setitem__(self, index, genome):
+        start = index * self.word_size
+        self.buffer[start:start + self.word_size] = genome.to_bytes(self.word_size, 'big')
+
+    def append(self, genome):
+        if self.length == self.__capacity():
+            self.__grow()
+        self[self.length] = genome
+        self.length += 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("genome index out of range")
+        start = index * self.word_size
+        return int.from_bytes(self.buffer[start:start + self.word_size], 'big')
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for index in range(self.length):
+            yield self[index]
+
+    def __reduce__(self): # sent to another process as a plain list
+        return list, (list(self),)
+
+    def tobytes(self):
+        return bytes(self.buffer[:self.length * self.word_size])
+
+    def frombytes(self, data):
+        """
+        Append the genomes of tobytes()
+        """
+        end = self.length * self.word_size + len(data)
+        while len(self.buffer) < end:
+            self.__grow()
+        self.buffer[self.length * self.word_size:end] = data
+        self.length = end // self.word_size
+
+    def close(self):
+        if self.path is not None and not self.buffer.closed:
+            self.buffer.close()
+            self.file.close()
+
+
+class History:
+    POLICIES = ('full', 'every', 'ring', 'reservoir')
+
+    def __init__(self, gene_size, config=None, rng=None):
+        """
+        Args:
+            gene_size (int): number of prime implicants(bits of a genome)
+            config (dict, optional): parameters['history'] (policy, interval, size, spill). Defaults to None(full).
+            rng (random.Random, optional): random number stream of the reservoir policy, apart from the genetic algorithm stream.
+                Defaults to None(random.Random(config['seed'])).
+        """
+        config = config or {}
+        self.gene_size = gene_size
+        self.policy = config.get('policy', 'full')
+        if self.policy not in self.POLICIES:
+            raise ValueError(f"Unknown history policy: {self.policy}")
+        self.interval = int(config.get('interval', 1))
+        self.size = int(config.get('size', 1000))
+        if self.interval < 1 or self.size < 1:
+            raise ValueError(f"History interval and size must be at least 1: {self.interval}, {self.size}")
+        self.random = rng if rng is not None else random.Random(config.get('seed')) # the genetic algorithm sequence is not changed
+        self.seen = 0 # number of offered epochs(ring, reservoir)
+        self.pending = None # latest epoch not recorded by the every policy(recorded at finish)
+
+        self.epochs = array('q')
+        self.average = array('d')
+        self.max = array('q')
+        self.min = array('q')
+        self.diversity = array('q')
+        spill = config.get('spill')
+        self.genomes = GenomeBuffer(gene_size, spill, min(self.size, 1024) if self.policy in ('ring', 'reservoir') else 1024)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['genomes'] = (self.genomes.path, self.genomes.tobytes())
+        return state
+
+    def __setstate__(self, state):
+        path, data = state.pop('genomes')
+        self.__dict__.update(state)
+        self.genomes = GenomeBuffer(self.gene_size, path)
+        self.genomes.frombytes(data)
+
+    def __write(self, slot, entry):
+        """
+        Write the entry to the slot(== current length: append)
+        """
+        columns = (self.epochs, self.average, self.max, self.min, self.genomes, self.diversity)
+        if slot == len(self.epochs):
+            for column, value in zip(columns, entry):
+                column.append(value)
+        else:
+            for column, value in zip(columns, entry):
+                column[slot] = value
+
+    def record(self, epoch, average_fitness, max_fitness, min_fitness, max_genome, genetic_diversity):
+        """
+        Offer the data of one epoch to the recording policy
+        """
+        entry = (epoch, average_fitness, max_fitness, min_fitness, max_genome, genetic_diversity)
+        if self.policy == 'full':
+            self.__write(len(self.epochs), entry)
+        elif self.policy == 'every':
+            if epoch % self.interval == 0:
+                self.__write(len(self.epochs), entry)
+                self.pending = None
+            else:
+                self.pending = entry
+        elif self.policy == 'ring':
+            self.__write(self.seen % self.size if self.seen >= self.size else self.seen, entry)
+            self.seen += 1
+        else: # reservoir
+            if self.seen < self.size:
+                self.__write(self.seen, entry)
+            else:
+                slot = self.random.randrange(self.seen + 1)
+                if slot < self.size:
+                    self.__write(slot, entry)
+            self.seen += 1
+
+    def finish(self):
+        """
+        Record the last epoch of the every policy, so the series always ends at the last epoch
+        """
+        if self.pending is not None:
+            self.__write(len(self.epochs), self.pending)
+            self.pending = None
+
+    def __order(self):
+        """
+        Returns:
+            list[int] | None: slots in epoch order, None if the slots are already in epoch order
+        """
+        if self.policy == 'ring' and self.seen > self.size:
+            start = self.seen % self.size
+            return list(range(start, self.size)) + list(range(start))
+        if self.policy == 'reservoir':
+            return sorted(range(len(self.epochs)), key=self.epochs.__getitem__)
+        return None
+
+    def series(self):
+        """
+        Recorded series in epoch order
+
+        Returns:
+            (array, dict, GenomeBuffer | list, array): epochs, fitness_data(average, max, min), max_genomes, genetic_diversity
+        """
+        order = self.__order()
+        if order is None:
+            genomes = self.genomes if self.genomes.path is None else list(self.genomes) # readable after close
+            return (self.epochs, {'average': self.average, 'max': self.max, 'min': self.min}, genomes, self.diversity)
+        reorder = lambda column: array(column.typecode, (column[slot] for slot in order))
+        return (reorder(self.epochs), {'average': reorder(self.average), 'max': reorder(self.max), 'min': reorder(self.min)},
+                [self.genomes[slot] for slot in order], reorder(self.diversity))
+
+    def close(self):
+        """
+        Close the spill file of the genomes(the series returned by series() stay readable)
+        """
+        self.genomes.close()
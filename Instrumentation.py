@@ -0,0 +1,95 @@
+"""
+    Instrumentation module contains the receivers of the per-step/per-epoch metrics.
+    QuineMcCluskey and GeneticAlgorithm measure nothing when no metrics receiver is given.
+"""
+
+import json, time
+
+
+class Metrics:
+    """
+    Base metrics receiver. Subclasses override the hooks they need.
+    """
+    def on_quine_mccluskey_step(self, record):
+        """
+        Called after each Quine-McCluskey step
+
+        Args:
+            record (dict): step, time(seconds), table_size(implicants in the step table), prime_implicants(found in the step)
+        """
+        pass
+
+    def on_genetic_algorithm_epoch(self, record):
+        """
+        Called after each genetic algorithm epoch
+
+        Args:
+            record (dict): epoch, the seconds of each phase(evaluate, select, crossover, mutate),
+                evaluations(fitness computed), cache_hits, unique_genomes(of the next generation),
+                max_fitness, average_fitness and best_fitness
+        """
+        pass
+
+
+class MetricsRecorder(Metrics):
+    """
+    Keep every record in memory.
+    """
+    def __init__(self):
+        self.quine_mccluskey_steps = []
+        self.genetic_algorithm_epochs = []
+
+    def on_quine_mccluskey_step(self, record):
+        self.quine_mccluskey_steps.append(record)
+
+    def on_genetic_algorithm_epoch(self, record):
+        self.genetic_algorithm_epochs.append(record)
+
+
+class CallbackMetrics(Metrics):
+    """
+    Forward the records to plain functions.
+    """
+    def __init__(self, on_step=None, on_epoch=None):
+        self.on_step = on_step
+        self.on_epoch = on_epoch
+
+    def on_quine_mccluskey_step(self, record):
+        if self.on_step:
+            self.on_step(record)
+
+    def on_genetic_algorithm_epoch(self, record):
+        if self.on_epoch:
+            self.on_epoch(record)
+
+
+class JsonLinesSink(Metrics):
+    """
+    Write every record as one json line(with its type and wall-clock timestamp), flushed per record so it can be tailed.
+
+    Usage:
+        with JsonLinesSink('metrics.jsonl', run='testcase1') as metrics:
+            GeneticAlgorithm(parameters, strategy, metrics=metrics).process(prime_implicants, minterms)
+    """
+    def __init__(self, path, **labels):
+        self.file = open(path, 'a')
+        self.labels = labels # extra fields of every record(e.g. run name)
+
+    def __write(self, record_type, record):
+        self.file.write(json.dumps({'type': record_type, 'timestamp': time.time(), **self.labels, **record}) + '\n')
+        self.file.flush()
+
+    def on_quine_mccluskey_step(self, record):
+        self.__write('quine_mccluskey_step', record)
+
+    def on_genetic_algorithm_epoch(self, record):
+        self.__write('genetic_algorithm_epoch', record)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,245 @@
+"""
+Island Model Genetic Algorithm Implementation
+    1. Run N independent populations(islands) of GeneticAlgorithm in separate processes.
+       each island can use its own crossover strategy(strategy['crossover'] can be a list, island i uses crossover[i % len]).
+    2. Every migration_interval epochs, migration_size top genomes of each island migrate to another island
+       and replace its worst genomes. [ Migration class ]
+        - ring: island i sends to island (i + 1) % N
+        - random: islands are shuffled every migration round and each island sends to the next one in the shuffled cycle
+    3. The best solution of all islands is reported as the global best solution.
+    The cancel event is checked at the migration barrier(every epoch for a single island): an island sends its migrants,
+    stops waiting for its own and ends after that epoch, so no island is left waiting for a stopped one.
+    The island configurations are checked in the parent before any worker starts. A failed island puts its traceback
+    to the result queue, then the other islands(blocked at the migration barrier) are terminated and the error is raised.
+    Each island runs on its own child stream of the run's RandomStream(parameters['seed']), so the islands are independent
+    and a seeded run is reproduced(up to the arrival order of the migrants).
+"""
+
+import os, queue, random, threading, traceback, multiprocessing
+
+from GeneticAlgorithm import GeneticAlgorithm
+from RandomStream import RandomStream
+
+
+class Migration:
+    POLL_INTERVAL = 0.5 # seconds between the checks of the cancel event while waiting for the migrants
+
+    def __init__(self, island, inboxes, topology, migration_interval, migration_size, total_epoch, topology_seed,
+                 cancel_event=None, stop_event=None):
+        self.island = island
+        self.inboxes = inboxes # inboxes[i]: queue of the migrants sent to the i-th island
+        self.topology = topology
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.total_epoch = total_epoch
+        self.topology_seed = topology_seed
+        self.pending_migrants = {} # migrants of later rounds received early (key: migration round)
+        self.cancel_event = cancel_event # cancel event of the run, shared by every island
+        self.stop_event = stop_event # cancel event of the island's GeneticAlgorithm, set at the barrier after a cancel
+
+    def __destination(self, migration_round):
+        """
+        Find the island to send the migrants in the given migration round
+
+        Args:
+            migration_round (int): migration round number
+
+        Returns:
+            int: destination island index
+        """
+        island_count = len(self.inboxes)
+        if self.topology == 'ring':
+            return (self.island + 1) % island_count
+        # every island draws the same cycle from the shared seed, so each island receives exactly one message per round
+        order = list(range(island_count))
+        random.Random(self.topology_seed + migration_round).shuffle(order)
+        return order[(order.index(self.island) + 1) % island_count]
+
+    def __is_cancelled(self):
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def __receive(self, migration_round):
+        """
+        Returns:
+            list[(int, int)] | None: migrants of the round, None if the run is cancelled(the sender may have stopped)
+        """
+        while migration_round not in self.pending_migrants:
+            if self.__is_cancelled():
+                return None
+            try:
+                received_round, migrants = self.inboxes[self.island].get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            self.pending_migrants[received_round] = migrants
+        return self.pending_migrants.pop(migration_round)
+
+    def __stop(self, genomes_with_fitness):
+        self.stop_event.set()
+        return genomes_with_fitness
+
+    def __call__(self, epoch, genomes_with_fitness):
+        """
+        Send the top genomes to the destination island and replace the worst genomes with the received migrants
+
+        Args:
+            epoch (int): current epoch
+            genomes_with_fitness (list[(int, int)]): list of genomes with fitness (fitness, genome)
+
+        Returns:
+            list[(int, int)]: list of genomes with fitness after migration
+        """
+        if len(self.inboxes) < 2: # no barrier, a single island can stop at any epoch
+            return self.__stop(genomes_with_fitness) if self.__is_cancelled() else genomes_with_fitness
+        if (epoch + 1) % self.migration_interval != 0 or epoch + 1 == self.total_epoch:
+            return genomes_with_fitness
+        migration_round = (epoch + 1) // self.migration_interval
+        ranked_genomes = sorted(genomes_with_fitness, key=lambda genome_with_fitness: genome_with_fitness[0], reverse=True)
+        # the migrants are always sent first, so the destination is not left waiting when this island stops
+        self.inboxes[self.__destination(migration_round)].put((migration_round, ranked_genomes[:self.migration_size]))
+        migrants = None if self.__is_cancelled() else self.__receive(migration_round)
+        if migrants is None:
+            return self.__stop(genomes_with_fitness)
+        return ranked_genomes[:len(ranked_genomes) - len(migrants)] + migrants
+
+
+def island_configuration(island, parameters, strategy):
+    """
+    Args:
+        island (int): island index
+        parameters (dict): genetic algorithm parameters of the run
+        strategy (dict): genetic algorithm strategy of the run
+
+    Returns:
+        (dict, dict): parameters and strategy of the island
+    """
+    # migration keeps the islands in lockstep, so every island runs the full epoch count
+    # and the islands are not checkpointed(their migrants are not in a single process)
+    parameters = {key: value for key, value in parameters.items() if key not in ('early_stopping', 'checkpoint')}
+    if parameters.get('history', {}).get('spill'): # one spill file per island
+        parameters['history'] = dict(parameters['history'], spill=f"{parameters['history']['spill']}.{island}")
+    crossover = strategy['crossover']
+    island_strategy = dict(strategy, crossover=crossover[island % len(crossover)] if isinstance(crossover, list) else crossover)
+    return parameters, island_strategy
+
+def run_island(island, parameters, strategy, prime_implicants, minterms, inboxes, result_queue, topology,
+               migration_interval, migration_size, topology_seed, rng, cancel_event=None):
+    """
+    Run one island in a worker process and put its result(or the traceback of its error) to the result queue
+    """
+    try:
+        parameters, island_strategy = island_configuration(island, parameters, strategy)
+        stop_event = threading.Event() # the island stops only at the migration barrier, not at the cancel of any epoch
+        algorithm = GeneticAlgorithm(parameters, island_strategy, cancel_event=stop_event, rng=rng)
+        migration = Migration(island, inboxes, topology, migration_interval, migration_size, algorithm.epoch, topology_seed,
+                              cancel_event, stop_event)
+        fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params = algorithm.process(prime_implicants, minterms, migration)
+    except Exception:
+        result_queue.put((island, {'error': traceback.format_exc()}))
+        return
+    result_queue.put((island, {'crossover': island_strategy['crossover'],
+                               'epochs': visualization_params['epochs'],
+                               'stop_reason': visualization_params['stop_reason'],
+                               'fitness_data': fitness_data,
+                               'max_genomes': max_genomes,
+                               'best_solution': best_solution,
+                               'genetic_diversity': genetic_diversity}))
+
+
+class IslandGeneticAlgorithm:
+    POLL_INTERVAL = 1.0 # seconds between the checks of the worker processes while waiting for the results
+
+    def __init__(self, parameters, strategy, cancel_event=None, rng=None):
+        self.parameters = parameters
+        self.strategy = strategy
+        self.cancel_event = cancel_event # stop every island at its next migration barrier when it is set
+        # random number stream of the whole run, seeded by parameters['seed'](os entropy if not given)
+        self.rng = rng if rng is not None else RandomStream(parameters.get("seed"))
+
+        # island parameters
+        self.island_count = int(parameters.get("islands", os.cpu_count() or 1))
+        self.migration_interval = int(parameters.get("migration_interval", 10))
+        self.migration_size = int(parameters.get("migration_size", 2))
+        self.topology = strategy.get("topology", "ring")
+        if self.topology not in ('ring', 'random'):
+            raise ValueError(f"Unknown topology: {self.topology}")
+
+        # per-island data (index: island)
+        self.islands = []
+
+    def __check_configurations(self):
+        """
+        Build the genetic algorithm of every island once in the parent, so an invalid configuration raises
+        before any worker starts(the workers would otherwise wait for each other's migrants)
+        """
+        for island in range(self.island_count):
+            GeneticAlgorithm(*island_configuration(island, self.parameters, self.strategy), rng=RandomStream(0))
+
+    def __collect_results(self, workers, result_queue):
+        """
+        Wait for the result of every island. if an island fails(error or exit without a result),
+        the other islands are terminated and the error is raised.
+
+        Returns:
+            dict: key: island, value: result of the island
+        """
+        results = {}
+        while len(results) < len(workers):
+            try:
+                island, result = result_queue.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                # an exit code 0 without a result is not a failure yet, its result may still be in the queue
+                failed = [island for island, worker in enumerate(workers)
+                          if island not in results and not worker.is_alive() and worker.exitcode != 0]
+                if not failed:
+                    continue
+                island, result = failed[0], {'error': f"exit code {workers[failed[0]].exitcode}"}
+            if 'error' in result:
+                for worker in workers:
+                    if worker.is_alive():
+                        worker.terminate()
+                for worker in workers:
+                    worker.join()
+                raise RuntimeError(f"Island {island} failed:\n{result['error']}")
+            results[island] = result
+        return results
+
+    def process(self, prime_implicants, minterms):
+        """
+        Island Model Genetic Algorithm main process
+
+        Args:
+            prime_implicants (list[tuple[int]]): prime implicants
+            minterms (list[int]): minterms
+
+        Returns:
+            (dict, list, tuple, list, dict): fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params
+                of the island that found the global best solution. visualization_params['islands'] has the data of every island.
+        """
+        self.__check_configurations()
+        inboxes = [multiprocessing.Queue() for _ in range(self.island_count)]
+        result_queue = multiprocessing.Queue()
+        topology_seed = self.rng.randrange(1 << 32)
+        island_streams = self.rng.spawn(self.island_count)
+        workers = [multiprocessing.Process(target=run_island,
+                                           args=(island, self.parameters, self.strategy, prime_implicants, minterms,
+                                                 inboxes, result_queue, self.topology, self.migration_interval,
+                                                 self.migration_size, topology_seed, island_streams[island], self.cancel_event))
+                   for island in range(self.island_count)]
+        for worker in workers:
+            worker.start()
+        results = self.__collect_results(workers, result_queue)
+        for worker in workers:
+            worker.join()
+        self.islands = [results[island] for island in range(self.island_count)]
+
+        # global best solution: highest fitness, earliest epoch
+        best_island = max(self.islands, key=lambda island: (island['best_solution'][1], -island['best_solution'][4]))
+        visualization_params = {'gene_size': len(prime_implicants),
+                                'minterms': minterms,
+                                'prime_implicants': prime_implicants,
+                                'epochs': best_island['epochs'],
+                                'seed': self.rng.root_seed,
+                                'stop_reason': 'cancelled' if any(island['stop_reason'] for island in self.islands) else None,
+                                'islands': self.islands}
+        return (best_island['fitness_data'], best_island['max_genomes'], best_island['best_solution'],
+                best_island['genetic_diversity'], visualization_params)
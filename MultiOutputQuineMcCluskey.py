@@ -0,0 +1,173 @@
+"""
+    Multi-output Quine-McCluskey with a shared prime implicant pool
+        - tagged minterms: each term has the bitmask of the outputs whose ON-set or dontcares contain it
+        - merge: two implicants are merged when their tags share an output, the merged tag is the AND of both tags.
+          an implicant is not prime when it is merged with the same tag(the larger implicant serves the same outputs).
+        - shared prime implicants: (cube, outputs) products, one product can be used by all of its outputs
+        - minterms: one coverage index over every output, the key of the minterm m of output o is (o << variable_count) | m,
+          so the genetic algorithm covers all outputs jointly and a shared product costs one prime implicant
+        trace modes
+            - full, summary: prime_implicants.csv with the cube and the outputs of each product
+            - off: no output directory and no file is written
+"""
+
+import os, time
+
+from QuineMcCluskey import Implicant
+
+
+class SharedImplicant(Implicant):
+    """
+    Product of the shared pool: a cube and the bitmask of the outputs using it.
+    Behaves as the sorted tuple of its tagged minterm keys((output << shift) | minterm).
+    """
+    __slots__ = ('outputs', 'shift')
+
+    def __init__(self, value, mask, outputs, shift):
+        super().__init__(value, mask)
+        self.outputs = outputs # bitmask of the outputs
+        self.shift = shift # number of variables, the output index is above the variable bits
+
+    def output_indices(self):
+        """
+        Returns:
+            list[int]: indices of the outputs using the product
+        """
+        return [output for output in range(self.outputs.bit_length()) if (self.outputs >> output) & 1]
+
+    def __iter__(self):
+        for output in self.output_indices():
+            for minterm in super().__iter__():
+                yield (output << self.shift) | minterm
+
+    def __len__(self):
+        return self.outputs.bit_count() << self.mask.bit_count()
+
+    def __contains__(self, term):
+        return (self.outputs >> (term >> self.shift)) & 1 == 1 and super().__contains__(term & ((1 << self.shift) - 1))
+
+    def __eq__(self, other):
+        if not isinstance(other, SharedImplicant):
+            return NotImplemented
+        return (self.value, self.mask, self.outputs, self.shift) == (other.value, other.mask, other.outputs, other.shift)
+
+    def __hash__(self):
+        return hash((self.value, self.mask, self.outputs))
+
+    def __reduce__(self):
+        return SharedImplicant, (self.value, self.mask, self.outputs, self.shift)
+
+
+class MultiOutputQuineMcCluskey:
+    def __init__(self, outputs, output_directory=None, trace='full', metrics=None):
+        """
+        Args:
+            outputs (list[dict]): minterms and dontcares of each output
+            output_directory (str, optional): directory of the trace files. Defaults to None.
+            trace (str, optional): trace mode(full, summary, off). Defaults to 'full'.
+            metrics (Instrumentation.Metrics, optional): per-step metrics receiver. Defaults to None.
+        """
+        self.outputs = [(output["minterms"], output.get("dontcares", [])) for output in outputs]
+        self.variable_count = max(1, max((term.bit_length() for minterms, dontcares in self.outputs
+                                          for term in minterms + dontcares), default=1))
+        self.prime_implicants = []
+        if trace not in ('full', 'summary', 'off'):
+            raise ValueError(f"Unknown trace mode: {trace}")
+        if trace != 'off' and output_directory is None:
+            raise ValueError(f"Trace mode {trace} needs an output directory(use trace='off' without one)")
+        self.trace = trace
+        self.metrics = metrics # Instrumentation.Metrics receiver, None: not measured
+
+        # create multi_output_quine_mccluskey output directory
+        self.output_directory = None
+        if trace != 'off':
+            self.output_directory = os.path.join(output_directory, 'multi_output_quine_mccluskey')
+            os.makedirs(self.output_directory, exist_ok=True)
+
+    def __tagged_terms(self):
+        """
+        Returns:
+            dict: key: term, value: bitmask of the outputs whose ON-set or dontcares contain the term
+        """
+        tags = {}
+        for output, (minterms, dontcares) in enumerate(self.outputs):
+            for term in minterms + dontcares:
+                tags[term] = tags.get(term, 0) | (1 << output)
+        return tags
+
+    def __merge(self, level):
+        """
+        Merge the implicants of one level(same number of dashes)
+
+        Args:
+            level (dict): key: dash mask, value: dict(key: value, value: tag)
+
+        Returns:
+            (dict, list[(int, int, int)]): next level and the prime implicants (value, mask, tag) of this level
+        """
+        merged = {}
+        primes = []
+        for mask, values in level.items():
+            covered = set() # values merged with their own tag
+            for value, tag in values.items():
+                free_bits = ~(value | mask) & ((1 << self.variable_count) - 1)
+                while free_bits: # partner: the same implicant with one more 1 bit
+                    bit = free_bits & -free_bits
+                    free_bits ^= bit
+                    partner_tag = values.get(value | bit)
+                    if partner_tag is None or not tag & partner_tag:
+                        continue
+                    shared_tag = tag & partner_tag
+                    merged.setdefault(mask | bit, {})[value] = shared_tag
+                    if shared_tag == tag:
+                        covered.add(value)
+                    if shared_tag == partner_tag:
+                        covered.add(value | bit)
+            primes.extend((value, mask, tag) for value, tag in values.items() if value not in covered)
+        return merged, primes
+
+    def __save_prime_implicants_to_csv(self):
+        """
+        save the prime implicants to csv file
+        index, cube(leftmost character is the most significant variable) and output indices of each product
+        """
+        with open(os.path.join(self.output_directory, 'prime_implicants.csv'), 'w') as f:
+            for index, prime_implicant in enumerate(self.prime_implicants):
+                cube = ''.join('-' if (prime_implicant.mask >> bit) & 1 else str((prime_implicant.value >> bit) & 1)
+                               for bit in reversed(range(self.variable_count)))
+                outputs = ' '.join(map(str, prime_implicant.output_indices()))
+                f.write(f"{index + 1}, {cube}, {outputs}\n")
+
+    def process(self):
+        """
+        Multi-output Quine-McCluskey main process
+
+        Returns:
+            (list[SharedImplicant], list[int]): shared prime implicants and the tagged minterm keys of every output
+        """
+        level = {0: self.__tagged_terms()}
+        primes = []
+        step = 0
+        while level:
+            start_time = time.perf_counter()
+            table_size = sum(len(values) for values in level.values())
+            level, level_primes = self.__merge(level)
+            primes.extend(level_primes)
+            step += 1
+            if self.metrics is not None:
+                self.metrics.on_quine_mccluskey_step({'step': step,
+                                                      'time': time.perf_counter() - start_time,
+                                                      'table_size': table_size,
+                                                      'prime_implicants': len(level_primes)})
+
+        minterms = [(output << self.variable_count) | minterm
+                    for output, (output_minterms, _) in enumerate(self.outputs) for minterm in dict.fromkeys(output_minterms)]
+        on_keys = set(minterms)
+        # deterministic order(same key as QuineMcCluskey, then the outputs), products covering only dontcares are dropped
+        self.prime_implicants = [prime_implicant for prime_implicant in
+                                 (SharedImplicant(value, mask, tag, self.variable_count) for value, mask, tag in
+                                  sorted(primes, key=lambda prime: (prime[1].bit_count(), prime[0].bit_count(), prime[0], prime[1], prime[2])))
+                                 if any(key in on_keys for key in prime_implicant)]
+        if self.trace != 'off':
+            self.__save_prime_implicants_to_csv()
+        return (self.prime_implicants, minterms)
@@ -0,0 +1,166 @@
+"""
+PI Chart Reduction Implementation
+    Repeat until nothing changes:
+    1. Extract essential prime implicants(the only cover of some minterm). [ __extract_essential_prime_implicants method ]
+    2. Remove dominating minterms(columns). a minterm covered by every prime implicant of another minterm is covered for free. [ __remove_dominating_minterms method ]
+    3. Remove dominated prime implicants(rows). a prime implicant whose minterms are covered by another prime implicant is never better. [ __remove_dominated_prime_implicants method ]
+    The remaining prime implicants and minterms(cyclic core) are searched by the genetic algorithm,
+    and the genome of the core is expanded back to the original prime implicant indices. [ expand_genome method ]
+"""
+
+from QuineMcCluskey import covered_indices
+
+
+class PIChartReducer:
+    def __init__(self, prime_implicants, minterms):
+        self.prime_implicants = prime_implicants
+        self.minterms = minterms
+        self.essential_prime_implicants = [] # original indices of essential prime implicants
+        self.core_prime_implicants = [] # original indices of prime implicants in the cyclic core
+        self.core_minterms = [] # minterms in the cyclic core
+
+    def __build_chart(self):
+        """
+        Build the PI chart as bitsets
+
+        Returns:
+            (dict, dict): rows(key: prime implicant index, value: bitset of minterm indices),
+                columns(key: minterm index, value: bitset of prime implicant indices)
+        """
+        unique_minterms = list(dict.fromkeys(self.minterms))
+        minterm_to_idx = {minterm: idx for idx, minterm in enumerate(unique_minterms)}
+        rows = {}
+        columns = {idx: 0 for idx in range(len(unique_minterms))}
+        for row, prime_implicant in enumerate(self.prime_implicants):
+            rows[row] = 0
+            for column in covered_indices(prime_implicant, minterm_to_idx):
+                rows[row] |= 1 << column
+                columns[column] |= 1 << row
+        self.unique_minterms = unique_minterms
+        return rows, columns
+
+    def __remove_row(self, rows, columns, row):
+        row_mask = rows.pop(row)
+        while row_mask:
+            column_bit = row_mask & -row_mask
+            row_mask ^= column_bit
+            column = column_bit.bit_length() - 1
+            if column in columns:
+                columns[column] &= ~(1 << row)
+
+    def __remove_column(self, rows, columns, column):
+        column_mask = columns.pop(column)
+        while column_mask:
+            row_bit = column_mask & -column_mask
+            column_mask ^= row_bit
+            row = row_bit.bit_length() - 1
+            if row in rows:
+                rows[row] &= ~(1 << column)
+
+    def __extract_essential_prime_implicants(self, rows, columns):
+        changed = False
+        for column in list(columns):
+            if column not in columns or columns[column].bit_count() != 1:
+                continue
+            row = columns[column].bit_length() - 1
+            self.essential_prime_implicants.append(row)
+            # every minterm covered by the essential prime implicant is solved
+            row_mask = rows[row]
+            while row_mask:
+                column_bit = row_mask & -row_mask
+                row_mask ^= column_bit
+                self.__remove_column(rows, columns, column_bit.bit_length() - 1)
+            self.__remove_row(rows, columns, row)
+            changed = True
+        return changed
+
+    def __remove_dominating_minterms(self, rows, columns):
+        changed = False
+        for column in [column for column, column_mask in columns.items() if column_mask == 0]:
+            self.__remove_column(rows, columns, column) # no prime implicant can cover this minterm
+            changed = True
+        for column in sorted(columns):
+            column_mask = columns[column]
+            for other in columns:
+                other_mask = columns[other]
+                # the other minterm's covers are a subset of this minterm's covers(ties keep the lower index)
+                if other != column and other_mask & column_mask == other_mask and (other_mask != column_mask or other < column):
+                    self.__remove_column(rows, columns, column)
+                    changed = True
+                    break
+        return changed
+
+    def __remove_dominated_prime_implicants(self, rows, columns):
+        changed = False
+        for row in sorted(rows):
+            row_mask = rows[row]
+            if row_mask == 0: # covers nothing in the remaining chart
+                self.__remove_row(rows, columns, row)
+                changed = True
+                continue
+            for other in rows:
+                other_mask = rows[other]
+                # this prime implicant's minterms are a subset of the other's(ties keep the lower index)
+                if other != row and other_mask & row_mask == row_mask and (other_mask != row_mask or other < row):
+                    self.__remove_row(rows, columns, row)
+                    changed = True
+                    break
+        return changed
+
+    def process(self):
+        """
+        PI chart reduction main process
+
+        Returns:
+            (list[tuple[int]], list[int]): prime implicants and minterms of the cyclic core
+        """
+        rows, columns = self.__build_chart()
+        changed = True
+        while changed:
+            changed = self.__extract_essential_prime_implicants(rows, columns)
+            changed |= self.__remove_dominating_minterms(rows, columns)
+            changed |= self.__remove_dominated_prime_implicants(rows, columns)
+        self.core_prime_implicants = sorted(rows)
+        self.core_minterms = [self.unique_minterms[column] for column in sorted(columns)]
+        return [self.prime_implicants[row] for row in self.core_prime_implicants], self.core_minterms
+
+    def expand_genome(self, genome):
+        """
+        Expand a genome of the cyclic core to the original prime implicant indices(essential prime implicants included)
+
+        Args:
+            genome (int): genome of the cyclic core(i-th bit selects the (core_size - 1 - i)-th core prime implicant)
+
+        Returns:
+            int: genome of the original prime implicants
+        """
+        gene_size, core_size = len(self.prime_implicants), len(self.core_prime_implicants)
+        expanded_genome = 0
+        for row in self.essential_prime_implicants:
+            expanded_genome |= 1 << (gene_size - 1 - row)
+        for k, row in enumerate(self.core_prime_implicants):
+            if (genome >> (core_size - 1 - k)) & 1:
+                expanded_genome |= 1 << (gene_size - 1 - row)
+        return expanded_genome
+
+    def expand_solution(self, solution, weight):
+        """
+        Expand a solution of the cyclic core and evaluate it on the original PI chart
+
+        Args:
+            solution (tuple): (genome, fitness, covered minterms, used prime implicants, epoch) of the cyclic core
+            weight (int): weight of the fitness function
+
+        Returns:
+            tuple: (genome, fitness, covered minterms, used prime implicants, epoch) of the original PI chart
+        """
+        gene_size = len(self.prime_implicants)
+        genome = self.expand_genome(solution[0])
+        minterm_to_idx = {minterm: idx for idx, minterm in enumerate(self.unique_minterms)}
+        cover_set = set()
+        for row in range(gene_size):
+            if (genome >> (gene_size - 1 - row)) & 1:
+                cover_set.update(covered_indices(self.prime_implicants[row], minterm_to_idx))
+        used_prime_implicants = genome.bit_count()
+        fitness = weight * len(cover_set) + gene_size - used_prime_implicants
+        return (genome, fitness, len(cover_set), used_prime_implicants, solution[4])
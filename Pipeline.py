@@ -0,0 +1,240 @@
+"""
+    Pipeline module connects the testcase configuration to the algorithm implementations.
+    It must not import GUI or plotting libraries, so it can run headless.
+"""
+
+import time, traceback
+
+from QuineMcCluskey import QuineMcCluskey
+from CubePrimeGenerator import CubePrimeGenerator
+from MultiOutputQuineMcCluskey import MultiOutputQuineMcCluskey, SharedImplicant
+from GeneticAlgorithm import GeneticAlgorithm
+from PIChartReduction import PIChartReducer
+from Instrumentation import CallbackMetrics
+from Checkpoint import load_checkpoint
+
+def create_algorithm(parameters, strategy, metrics=None, cancel_event=None, rng=None):
+    """
+    Create the genetic algorithm engine(or the exact cover solver) selected by the testcase strategy
+
+    Args:
+        parameters (dict): genetic algorithm parameters
+        strategy (dict): genetic algorithm strategy. strategy['engine'] is 'python'(default), 'numpy', 'island' or 'exact'
+        metrics (Instrumentation.Metrics, optional): per-epoch metrics receiver, used by the python and numpy engines. Defaults to None.
+        cancel_event (multiprocessing.Event, optional): stops the python and numpy engines after the current epoch,
+            the island engine at the next migration barrier and the exact cover search. Defaults to None.
+        rng (RandomStream.RandomStream, optional): random number stream of the genetic algorithm engines.
+            Defaults to None(RandomStream(parameters['seed'])).
+
+    Returns:
+        GeneticAlgorithm | VectorizedGeneticAlgorithm | IslandGeneticAlgorithm | ExactCoverSolver: algorithm instance with process(prime_implicants, minterms)
+    """
+    engine = strategy.get('engine', 'python')
+    if engine == 'numpy':
+        from VectorizedGeneticAlgorithm import VectorizedGeneticAlgorithm # numpy is only required for this engine
+        return VectorizedGeneticAlgorithm(parameters, strategy, metrics, cancel_event, rng)
+    if engine == 'island':
+        from IslandGeneticAlgorithm import IslandGeneticAlgorithm
+        return IslandGeneticAlgorithm(parameters, strategy, cancel_event, rng)
+    if engine == 'exact':
+        from ExactCover import ExactCoverSolver
+        return ExactCoverSolver(parameters, strategy, cancel_event)
+    if engine != 'python':
+        raise ValueError(f"Unknown engine: {engine}")
+    return GeneticAlgorithm(parameters, strategy, metrics, cancel_event, rng)
+
+def run_testcase(testcase, output_directory=None, trace='full', log=None, cache=None, metrics=None, cancel_event=None, rng=None):
+    """
+    Run the Quine-McCluskey algorithm and the selected genetic algorithm engine for one testcase.
+    a testcase with testcase['cubes'](and optional testcase['dontcare_cubes']) uses the cube-based prime implicant generator
+    instead, its minterms are the coverage cubes of the ON-set.
+    a testcase with testcase['outputs'](list of minterms and dontcares of each output) is minimized jointly,
+    the prime implicants are the shared (cube, outputs) products and the minterms are the tagged minterms of every output.
+    if testcase['strategy']['reduction'] is true, the genetic algorithm searches only the cyclic core of the PI chart
+    and its genomes are expanded back to the original prime implicant indices.
+
+    Args:
+        testcase (dict): loaded testcase json
+        output_directory (str, optional): directory of the Quine-McCluskey trace files. Defaults to None.
+        trace (str, optional): Quine-McCluskey trace mode(full, summary, off). Defaults to 'full'.
+        log (callable, optional): log message callback. Defaults to None.
+        cache (PrimeImplicantCache, optional): prime implicant cache. on a cache hit Quine-McCluskey(and its trace) is skipped.
+            Defaults to None. not used for cube and multi-output testcases.
+        metrics (Instrumentation.Metrics, optional): per-step/per-epoch metrics receiver. Defaults to None.
+        cancel_event (multiprocessing.Event, optional): stops the genetic algorithm after the current epoch,
+            the result has the epochs run so far. Defaults to None.
+        rng (RandomStream.RandomStream, optional): random number stream of the genetic algorithm.
+            Defaults to None(RandomStream(testcase['parameters']['seed'])).
+
+    Returns:
+        dict: fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params and execution times
+    """
+    log = log or (lambda message: None)
+    start_time = time.perf_counter()
+    prime_implicants = cache.load(testcase["minterms"], testcase["dontcares"]) \
+        if cache and "cubes" not in testcase and "outputs" not in testcase else None
+    if "outputs" in testcase:
+        qm = MultiOutputQuineMcCluskey(testcase["outputs"], output_directory, trace=trace, metrics=metrics)
+        prime_implicants, minterms = qm.process()
+        log("Multi-output Quine-McCluskey process completed")
+    elif "cubes" in testcase:
+        generator = CubePrimeGenerator(testcase["cubes"], testcase.get("dontcare_cubes", []), output_directory,
+                                       trace=trace, metrics=metrics)
+        prime_implicants, minterms = generator.process()
+        log("Cube prime implicant generation completed")
+    elif prime_implicants is not None:
+        minterms = testcase["minterms"]
+        log("Prime implicants loaded from cache")
+    else:
+        qm = QuineMcCluskey(testcase["minterms"], testcase["dontcares"], output_directory, trace=trace, metrics=metrics)
+        prime_implicants, minterms = qm.process() # get prime implicants and minterms
+        if cache:
+            cache.store(testcase["minterms"], testcase["dontcares"], prime_implicants)
+        log("Quine-McCluskey process completed")
+    quine_mccluskey_time = time.perf_counter() - start_time
+
+    result = run_genetic_algorithm(testcase, prime_implicants, minterms, log, metrics, cancel_event, rng)
+    result['quine_mccluskey_time'] = quine_mccluskey_time
+    return result
+
+def resume_testcase(checkpoint_path, log=None, metrics=None, cancel_event=None):
+    """
+    Continue the genetic algorithm of a checkpoint(parameters['checkpoint'] of a python engine testcase),
+    Quine-McCluskey is not run again(the prime implicants and minterms are in the checkpoint).
+
+    Args:
+        checkpoint_path (str): checkpoint file path
+        log (callable, optional): log message callback. Defaults to None.
+        metrics (Instrumentation.Metrics, optional): per-epoch metrics receiver. Defaults to None.
+        cancel_event (multiprocessing.Event, optional): stops the genetic algorithm after the current epoch. Defaults to None.
+
+    Returns:
+        dict: same as run_testcase, quine_mccluskey_time is 0
+    """
+    log = log or (lambda message: None)
+    state = load_checkpoint(checkpoint_path)
+    context = state['context'] or {}
+    log(f"Checkpoint loaded (epoch {state['epoch']}, best fitness {state['best_solution'][1]})")
+    result = run_genetic_algorithm(context['testcase'], context.get('prime_implicants', state['prime_implicants']),
+                                   context.get('minterms', state['minterms']), log, metrics, cancel_event, checkpoint=state)
+    result['quine_mccluskey_time'] = 0.0
+    return result
+
+def run_genetic_algorithm(testcase, prime_implicants, minterms, log, metrics=None, cancel_event=None, rng=None, checkpoint=None):
+    """
+    Run(or resume) the genetic algorithm engine on the prime implicants, on the cyclic core if testcase['strategy']['reduction']
+
+    Args:
+        testcase (dict): loaded testcase json
+        prime_implicants (list[Implicant]): prime implicants
+        minterms (list[int] | list[Implicant]): minterms
+        log (callable): log message callback
+        metrics (Instrumentation.Metrics, optional): per-epoch metrics receiver. Defaults to None.
+        cancel_event (multiprocessing.Event, optional): stops the genetic algorithm after the current epoch. Defaults to None.
+        rng (RandomStream.RandomStream, optional): random number stream of the genetic algorithm. Defaults to None.
+        checkpoint (dict, optional): checkpoint state to continue instead of a new run. Defaults to None.
+
+    Returns:
+        dict: fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params and genetic_algorithm_time
+    """
+    reducer = None
+    core_prime_implicants, core_minterms = prime_implicants, minterms
+    if testcase["strategy"].get("reduction", False):
+        reducer = PIChartReducer(prime_implicants, minterms)
+        core_prime_implicants, core_minterms = reducer.process()
+        log(f"PI chart reduction completed (essential: {len(reducer.essential_prime_implicants)}, "
+            f"core: {len(core_prime_implicants)} prime implicants x {len(core_minterms)} minterms)")
+
+    # initialize and run the algorithm
+    start_time = time.perf_counter()
+    if reducer and not core_prime_implicants: # essential prime implicants cover every minterm
+        fitness_data, max_genomes, genetic_diversity = {'average': [], 'max': [], 'min': []}, [], []
+        best_solution = (0, 0, 0, 0, -1)
+        visualization_params = {}
+    elif checkpoint is not None:
+        fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params = GeneticAlgorithm.resume(checkpoint, metrics, cancel_event)
+    elif testcase["strategy"].get('engine', 'python') == 'python':
+        # the checkpoints keep the testcase(and the prime implicants before the reduction) for resume_testcase
+        context = {'testcase': testcase, 'prime_implicants': prime_implicants, 'minterms': minterms} if reducer else {'testcase': testcase}
+        algorithm = create_algorithm(testcase["parameters"], testcase["strategy"], metrics, cancel_event, rng)
+        fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params = algorithm.process(core_prime_implicants, core_minterms,
+                                                                                                             context=context)
+    else:
+        algorithm = create_algorithm(testcase["parameters"], testcase["strategy"], metrics, cancel_event, rng)
+        fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params = algorithm.process(core_prime_implicants, core_minterms)
+    genetic_algorithm_time = time.perf_counter() - start_time
+    if reducer:
+        best_solution = reducer.expand_solution(best_solution, int(testcase["parameters"]["weight"]))
+        max_genomes = [reducer.expand_genome(genome) for genome in max_genomes]
+        visualization_params.update({'gene_size': len(prime_implicants),
+                                     'minterms': minterms,
+                                     'prime_implicants': prime_implicants})
+    log("Genetic Algorithm process completed")
+    log(f"Excution Time: {genetic_algorithm_time:.5f} seconds")
+
+    return {'fitness_data': fitness_data,
+            'max_genomes': max_genomes,
+            'best_solution': best_solution,
+            'genetic_diversity': genetic_diversity,
+            'visualization_params': visualization_params,
+            'genetic_algorithm_time': genetic_algorithm_time}
+
+def summarize_result(result):
+    """
+    Convert the result of run_testcase to a json serializable record
+
+    Args:
+        result (dict): result of run_testcase
+
+    Returns:
+        dict: result record
+    """
+    gene_size = result['visualization_params']['gene_size']
+    minterms = result['visualization_params']['minterms']
+    genome, fitness, covered_minterms, used_prime_implicants, epoch = result['best_solution']
+    cache_statistics = result['visualization_params'].get('cache_statistics', {'hits': 0, 'misses': 0})
+    record = {'prime_implicants': gene_size,
+              'minterms': len(minterms),
+              'best_solution': format(genome, 'b').zfill(gene_size),
+              'fitness': fitness,
+              'used_prime_implicants': used_prime_implicants,
+              'covered_minterms': covered_minterms,
+              'coverage': covered_minterms / len(minterms) * 100,
+              'epoch': epoch,
+              'seed': result['visualization_params'].get('seed'),
+              'quine_mccluskey_time': result['quine_mccluskey_time'],
+              'genetic_algorithm_time': result['genetic_algorithm_time'],
+              'fitness_cache_hits': cache_statistics['hits'],
+              'fitness_cache_misses': cache_statistics['misses']}
+    prime_implicants = result['visualization_params']['prime_implicants']
+    if prime_implicants and isinstance(prime_implicants[0], SharedImplicant): # used products serving several outputs
+        record['shared_prime_implicants'] = sum(1 for i in range(gene_size)
+                                                if (genome >> (gene_size - 1 - i)) & 1 and prime_implicants[i].outputs.bit_count() > 1)
+    return record
+
+def run_testcase_worker(testcase, output_directory, message_queue, cancel_event):
+    """
+    Entry point of the background process of the GUI.
+    messages are put to the queue as (kind, payload):
+        - ('log', str): log message
+        - ('epoch', dict): epoch, best_fitness and unique_genomes of each genetic algorithm epoch(python engine)
+        - ('result', dict): result of run_testcase
+        - ('error', str): traceback of the failed run
+
+    Args:
+        testcase (dict): loaded testcase json
+        output_directory (str): directory of the trace files
+        message_queue (multiprocessing.Queue): queue polled by the GUI
+        cancel_event (multiprocessing.Event): set by the cancel button
+    """
+    def on_epoch(record):
+        message_queue.put(('epoch', {'epoch': record['epoch'],
+                                     'best_fitness': record['best_fitness'],
+                                     'unique_genomes': record['unique_genomes']}))
+
+    try:
+        result = run_testcase(testcase, output_directory, log=lambda message: message_queue.put(('log', message)),
+                              metrics=CallbackMetrics(on_epoch=on_epoch), cancel_event=cancel_event)
+        message_queue.put(('result', result))
+    except Exception:
+        message_queue.put(('error', traceback.format_exc()))
@@ -0,0 +1,177 @@
+"""
+    On-disk cache of the Quine-McCluskey prime implicants
+        - key: sha256 of the sorted minterms and dontcares
+        - file: magic, number of prime implicants, packed little-endian uint64 values and dash masks (array('Q'))
+        - eviction: least recently used files(modified time, touched on every hit) are removed over max_bytes
+
+    Usage:
+        python PrimeImplicantCache.py stats --directory outputs/qm_cache
+        python PrimeImplicantCache.py clear --directory outputs/qm_cache
+"""
+
+import os, sys, struct, hashlib, argparse, tempfile
+from array import array
+
+from QuineMcCluskey import Implicant, compress_implicant
+
+DEFAULT_DIRECTORY = os.path.join("./outputs", "qm_cache")
+
+
+class PrimeImplicantCache:
+    MAGIC = b'GQMPI1'
+    SUFFIX = '.pic'
+    HEADER = struct.Struct('<6sQ') # magic, number of prime implicants
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=64 << 20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def __key(self, minterms, dontcares):
+        """
+        Hash of the testcase content(order and duplicates of the terms do not matter)
+
+        Args:
+            minterms (list[int]): minterms
+            dontcares (list[int]): dontcares
+
+        Returns:
+            str: cache key
+        """
+        content = f"{sorted(set(minterms))}|{sorted(set(dontcares))}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def __path(self, minterms, dontcares):
+        return os.path.join(self.directory, self.__key(minterms, dontcares) + self.SUFFIX)
+
+    def __entries(self):
+        """
+        Returns:
+            list[os.DirEntry]: cache files
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        return [entry for entry in os.scandir(self.directory) if entry.name.endswith(self.SUFFIX)]
+
+    def load(self, minterms, dontcares):
+        """
+        Load the prime implicants of the testcase
+
+        Args:
+            minterms (list[int]): minterms
+            dontcares (list[int]): dontcares
+
+        Returns:
+            list[Implicant] | None: prime implicants, None on cache miss
+        """
+        path = self.__path(minterms, dontcares)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        magic, count = self.HEADER.unpack_from(data) if len(data) >= self.HEADER.size else (None, 0)
+        if magic != self.MAGIC or len(data) != self.HEADER.size + 16 * count: # broken(e.g. interrupted write) or old format
+            try:
+                os.remove(path)
+            except FileNotFoundError: # removed by another process
+                pass
+            return None
+        values, masks = array('Q'), array('Q')
+        values.frombytes(data[self.HEADER.size:self.HEADER.size + 8 * count])
+        masks.frombytes(data[self.HEADER.size + 8 * count:])
+        if sys.byteorder == 'big':
+            values.byteswap()
+            masks.byteswap()
+        try:
+            os.utime(path) # mark as recently used
+        except FileNotFoundError: # evicted by another process after the read
+            return None
+        return [Implicant(value, mask) for value, mask in zip(values, masks)]
+
+    def store(self, minterms, dontcares, prime_implicants):
+        """
+        Store the prime implicants of the testcase(skipped if a term does not fit in 64 bits)
+
+        Args:
+            minterms (list[int]): minterms
+            dontcares (list[int]): dontcares
+            prime_implicants (list[Implicant | tuple[int]]): prime implicants
+        """
+        if max(minterms + dontcares, default=0) >= 1 << 64:
+            return
+        implicants = [(prime_implicant.value, prime_implicant.mask) if isinstance(prime_implicant, Implicant)
+                      else compress_implicant(prime_implicant) for prime_implicant in prime_implicants]
+        values = array('Q', (value for value, _ in implicants))
+        masks = array('Q', (mask for _, mask in implicants))
+        if sys.byteorder == 'big':
+            values.byteswap()
+            masks.byteswap()
+
+        # write to a temporary file and rename, so concurrent readers never see a partial file
+        os.makedirs(self.directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, len(implicants)))
+            f.write(values.tobytes())
+            f.write(masks.tobytes())
+        os.replace(temporary_path, self.__path(minterms, dontcares))
+        self.__evict()
+
+    def __evict(self):
+        """
+        Remove the least recently used files until the cache size is under max_bytes
+        """
+        entries = [] # (modified time, size, path)
+        for entry in self.__entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError: # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            total_bytes -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError: # removed by another process
+                pass
+
+    def stats(self):
+        """
+        Returns:
+            (int, int): number of cache files and total bytes
+        """
+        entries = self.__entries()
+        return len(entries), sum(entry.stat().st_size for entry in entries)
+
+    def clear(self):
+        """
+        Invalidate the whole cache
+
+        Returns:
+            int: number of removed files
+        """
+        entries = self.__entries()
+        for entry in entries:
+            os.remove(entry.path)
+        return len(entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the Quine-McCluskey prime implicant cache")
+    parser.add_argument('command', choices=['stats', 'clear'])
+    parser.add_argument('--directory', default=DEFAULT_DIRECTORY, help="cache directory")
+    args = parser.parse_args(argv)
+
+    cache = PrimeImplicantCache(args.directory)
+    if args.command == 'clear':
+        print(f"{cache.clear()} cache files removed")
+    else:
+        count, total_bytes = cache.stats()
+        print(f"{count} cache files, {total_bytes} bytes")
+
+if __name__ == '__main__':
+    main()
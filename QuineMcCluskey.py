@@ -1,70 +1,206 @@
 """
     Quine McCluskey Algorithm Implementation
+        merge engines
+            - hash: each level(implicants with the same number of dashes) is packed as one sorted array('Q') of values per dash mask,
+                    and the partner of each implicant is looked up with a hash probe (value | single bit) in its mask.
+                    only the probed mask is held as a set, so the peak memory is about 8 bytes per implicant of the level.
+            - pairwise: each implicant is a (value, dash mask) pair, compared against every term of group k + 1.
+        prime implicants are Implicant records of (value, dash mask), the minterms are expanded lazily on iteration
+        trace modes
+            - full: every step table is streamed to step_N_table.csv while the step is produced, plus prime_implicants.csv
+            - summary: only prime_implicants.csv
+            - off: no output directory and no file is written
 """
 
-import os
+import os, time
+from array import array
+
+def expand_implicant(value, mask):
+    """
+    expand (value, dash mask) implicant to the sorted tuple of its minterms
+
+    Args:
+        value (int): implicant value(dash positions are 0)
+        mask (int): dash positions
+
+    Returns:
+        tuple[int]: covered minterms
+    """
+    minterms = []
+    submask = mask
+    while True: # enumerate every submask of the dash mask
+        minterms.append(value | submask)
+        if submask == 0:
+            break
+        submask = (submask - 1) & mask
+    return tuple(reversed(minterms))
+
+def compress_implicant(minterms):
+    """
+    compress the minterms of an implicant to (value, dash mask), the inverse of expand_implicant
+
+    Args:
+        minterms (tuple[int]): covered minterms
+
+    Returns:
+        (int, int): implicant value(dash positions are 0) and dash positions
+    """
+    value = min(minterms)
+    mask = 0
+    for minterm in minterms:
+        mask |= minterm ^ value
+    return value, mask
+
+
+class Implicant:
+    """
+    Fixed-size (value, dash mask) record of a prime implicant.
+    Behaves as the sorted tuple of its minterms(iteration, len, in), without storing the minterms.
+    Also used as a cube of the cube-based prime implicant generator, `cube in implicant` is cube containment.
+    """
+    __slots__ = ('value', 'mask')
+
+    def __init__(self, value, mask):
+        self.value = value # implicant value(dash positions are 0)
+        self.mask = mask # dash positions
+
+    def __iter__(self):
+        submask = 0
+        while True: # enumerate every submask of the dash mask in increasing order
+            yield self.value | submask
+            if submask == self.mask:
+                break
+            submask = (submask - self.mask) & self.mask
+
+    def __len__(self):
+        return 1 << self.mask.bit_count()
+
+    def __contains__(self, term):
+        if isinstance(term, Implicant): # cube containment
+            return term.mask & ~self.mask == 0 and term.value & ~self.mask == self.value
+        return term & ~self.mask == self.value
+
+    def __eq__(self, other):
+        if not isinstance(other, Implicant):
+            return NotImplemented
+        return self.value == other.value and self.mask == other.mask
+
+    def __hash__(self):
+        return hash((self.value, self.mask))
+
+    def __reduce__(self):
+        return Implicant, (self.value, self.mask)
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+
+def covered_indices(prime_implicant, minterm_to_idx):
+    """
+    indices of the minterms covered by the prime implicant.
+    the implicant is expanded when it is smaller than the minterm index, otherwise the index is scanned with the
+    containment test. columns that are cubes(Implicant, from the cube-based generator) are always scanned.
+
+    Args:
+        prime_implicant (Implicant | tuple[int]): prime implicant
+        minterm_to_idx (dict): key: minterm(int or Implicant cube), value: column index
+
+    Returns:
+        list[int]: column indices covered by the prime implicant
+    """
+    if isinstance(prime_implicant, Implicant) and (len(prime_implicant) > len(minterm_to_idx)
+                                                   or isinstance(next(iter(minterm_to_idx), None), Implicant)):
+        return [idx for minterm, idx in minterm_to_idx.items() if minterm in prime_implicant]
+    return [minterm_to_idx[minterm] for minterm in prime_implicant if minterm in minterm_to_idx]
+
+
+class StepTableWriter:
+    """
+    Buffered streaming writer of the step_N_table.csv files.
+    Rows are written in the order they are produced, the file of a step is opened with its first row.
+    """
+    def __init__(self, output_directory, max_bit, buffer_size=1 << 16):
+        self.output_directory = output_directory
+        self.max_bit = max_bit
+        self.buffer_size = buffer_size
+        self.file = None
+
+    def __combine_minterm_with_dash(self, value, dash):
+        """
+        for debugging purpose, combine minterm with dash information
+
+        Args:
+            value (int): minterm
+            dash (int): dash location information
+
+        Returns:
+            str: combined minterm with dash
+        """
+        binary_minterm = format(value, 'b').zfill(self.max_bit) # convert integer to binary format
+        if not dash:
+            return binary_minterm
+        binary_dash = format(dash, 'b').zfill(self.max_bit)
+        return ''.join('-' if dash_bit == '1' else bit for bit, dash_bit in zip(binary_minterm, binary_dash))
+
+    def begin_step(self, step_number):
+        self.end_step()
+        self.step_number = step_number
+
+    def write(self, bit_count, value, dash):
+        if self.file is None:
+            self.file = open(os.path.join(self.output_directory, f'step_{self.step_number}_table.csv'), 'w',
+                             buffering=self.buffer_size)
+        self.file.write(f"{bit_count}, {self.__combine_minterm_with_dash(value, dash)}\n")
+
+    def end_step(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
 
 class QuineMcCluskey:
-    def __init__(self, minterms, dontcares, output_directory):
+    def __init__(self, minterms, dontcares, output_directory=None, merge_engine='hash', trace='full', metrics=None):
         self.minterms = minterms
         self.dontcares = dontcares
         self.max_bit = len(bin(max(minterms + dontcares))) - 2 # 2 is the length of '0b'
         self.prime_implicants = []
+        if merge_engine not in ('hash', 'pairwise'):
+            raise ValueError(f"Unknown merge engine: {merge_engine}")
+        self.merge_engine = merge_engine
+        if trace not in ('full', 'summary', 'off'):
+            raise ValueError(f"Unknown trace mode: {trace}")
+        if trace != 'off' and output_directory is None:
+            raise ValueError(f"Trace mode {trace} needs an output directory(use trace='off' without one)")
+        self.trace = trace
+        self.metrics = metrics # Instrumentation.Metrics receiver, None: not measured
 
         # create quine_mccluskey output directory
-        self.output_directory = os.path.join(output_directory, 'quine_mccluskey')
-        os.makedirs(self.output_directory, exist_ok=True)
+        self.output_directory = None
+        self.step_table_writer = None
+        if trace != 'off':
+            self.output_directory = os.path.join(output_directory, 'quine_mccluskey')
+            os.makedirs(self.output_directory, exist_ok=True)
+        if trace == 'full':
+            self.step_table_writer = StepTableWriter(self.output_directory, self.max_bit)
 
     def __init_table(self):
         """ 
         Initialize the table with minterms and dontcares
 
         Returns:
-            dict: key: bit_count(group), value: list of tuple (minterms, dash_position)
+            dict: key: bit_count(group), value: list of tuple (value, dash_position)
         """
         table = {} 
         for term in self.minterms + self.dontcares:
             bit_count = term.bit_count() # number of 1s in the binary representation
             if bit_count not in table:
-                table[bit_count] = [((term,), 0)] 
+                table[bit_count] = [(term, 0)] 
             else:
-                table[bit_count].append(((term,), 0))
-
-        self.__save_table_to_csv(table)
+                table[bit_count].append((term, 0))
+            if self.step_table_writer:
+                self.step_table_writer.write(bit_count, term, 0)
         return table
 
-    def __combine_minterm_with_dash(self, binary_minterm, dash):
-        """
-        for debugging purpose, combine minterm with dash information
-
-        Args:
-            binary_minterm (str): minterm in binary format string
-            dash (int): dash location information
-
-        Returns:
-            str: combined minterm with dash
-        """
-        combine_minterm_with_dash = [bit for bit in binary_minterm]
-        for i in range(self.max_bit):
-            if (dash >> i) & 1:
-                combine_minterm_with_dash[self.max_bit - 1 - i] = '-'
-        return ''.join(combine_minterm_with_dash)
-
-    def __save_table_to_csv(self, table, step_name='step_1'):
-        """
-        save the quine mccluskey table to csv file
-
-        Args:
-            table (dict): key: bit_count(group), value: list of tuple (minterms, dash_position)
-            step_name (str, optional): step name. Defaults to 'step_1'.
-        """
-        with open(os.path.join(self.output_directory, f'{step_name}_table.csv'), 'w') as f:
-            for bit_count in sorted(table):
-                for minterms, dash_position in sorted(table[bit_count]):
-                    integer_to_binary = format(minterms[0], 'b').zfill(self.max_bit) # convert integer to binary format
-                    term_to_binary = self.__combine_minterm_with_dash(integer_to_binary, dash_position)
-                    f.write(f"{bit_count}, {term_to_binary}\n")
-
     def __save_prime_implicants_to_csv(self):
         """
         save the prime implicants to csv file
@@ -80,71 +216,161 @@ class QuineMcCluskey:
 
         Args:
             step_number (int): step number
-            table (): key: bit_count(group), value: list of tuple (minterms, dash_position)
+            table (): key: bit_count(group), value: list of tuple (value, dash_position)
 
         Returns:
-            dict: key: bit_count(group), value: list of tuple (minterms, dash_position)
+            dict: key: bit_count(group), value: list of tuple (value, dash_position)
         """
         new_table = {}
-        generated_minterms_set = set()
-        not_prime_implicants = set() # set of not prime implicants(already merged with other minterms)
+        generated_implicants_set = set()
+        not_prime_implicants = set() # set of not prime implicants(already merged with other implicants)
         groups = sorted(table) # sort by group number(bit_count) to compare with the next group
         for group_bit_count in groups: 
             group = sorted(table[group_bit_count])
             if group_bit_count + 1 not in table: # unable to find 1 bit difference group
-                for minterm, _ in group: 
-                    if tuple(minterm) not in not_prime_implicants:
-                        self.prime_implicants.append(tuple(minterm))
+                for implicant in group: 
+                    if implicant not in not_prime_implicants:
+                        self.prime_implicants.append(Implicant(*implicant))
                 continue
             else: # find 1 bit difference group
                 target_group = sorted(table[group_bit_count + 1]) 
-                for minterms, dash_info in group:
-                    if tuple(minterms) not in not_prime_implicants: # check if it is already merged with
+                for value, dash_info in group:
+                    if (value, dash_info) not in not_prime_implicants: # check if it is already merged with
                         is_prime_implicant = True
                     else:
                         is_prime_implicant = False
-                    for target_minterms, target_dash_info in target_group:
+                    for target_value, target_dash_info in target_group:
                         if dash_info != target_dash_info: # dash position is differnet
                             continue
 
                         # combine minterm with dash information
-                        minterm_with_dash = minterms[0] | dash_info 
-                        target_minterm_with_dash = target_minterms[0] | target_dash_info
+                        minterm_with_dash = value | dash_info 
+                        target_minterm_with_dash = target_value | target_dash_info
                         
                         # check if there is only 1 bit difference
                         if (minterm_with_dash ^ target_minterm_with_dash).bit_count() == 1:
                             is_prime_implicant = False
-                            not_prime_implicants.add(tuple(target_minterms))
-                            if tuple(sorted(minterms + target_minterms)) in generated_minterms_set:  # to avoid duplicated minterms
+                            not_prime_implicants.add((target_value, target_dash_info))
+                            new_implicant = (value, (minterm_with_dash ^ target_minterm_with_dash) + dash_info)
+                            if new_implicant in generated_implicants_set:  # to avoid duplicated implicants
                                 continue
 
-                            # add new minterm to the new table
+                            # add new implicant to the new table
                             if group_bit_count not in new_table: # 1 bit decrease(group_bit_count + 1 - 1)
                                 new_table[group_bit_count] = []
-                            new_table[group_bit_count].append((sorted(minterms + target_minterms),
-                                                            (minterm_with_dash ^ target_minterm_with_dash) + dash_info))
-                            generated_minterms_set.add((tuple(sorted(minterms + target_minterms))))
+                            new_table[group_bit_count].append(new_implicant)
+                            generated_implicants_set.add(new_implicant)
+                            if self.step_table_writer:
+                                self.step_table_writer.write(group_bit_count, *new_implicant)
 
                     if is_prime_implicant: # check if it is prime implicant
-                        self.prime_implicants.append(tuple(minterms))
-        if new_table:
-            self.__save_table_to_csv(new_table, f'step_{step_number}')
+                        self.prime_implicants.append(Implicant(value, dash_info))
         return new_table
 
+    def __init_implicant_table(self):
+        """
+        Initialize the packed level table with minterms and dontcares
+
+        Returns:
+            dict: key: dash mask, value: array('Q') of sorted unique values
+        """
+        values = sorted(set(self.minterms + self.dontcares))
+        if self.step_table_writer:
+            for value in values:
+                self.step_table_writer.write(value.bit_count(), value, 0)
+        return {0: array('Q', values)}
+
+    def __merge_implicant(self, step_number, table):
+        """
+        merge (value, dash mask) implicants to find prime implicants.
+        an implicant is merged with the implicant of the same dash mask that has exactly one more 1 bit,
+        so the partner is probed as (value | single 0 bit) by binary search in the sorted values of the mask.
+        the merged implicant (value, mask | bit) is generated only when bit is above every dash of the mask,
+        so each implicant of the next level is generated once and the values of each mask stay sorted.
+
+        Args:
+            step_number (int): step number
+            table (dict): key: dash mask, value: array('Q') of sorted unique values
+
+        Returns:
+            dict: key: dash mask, value: array('Q') of sorted unique values
+        """
+        new_table = {}
+        full_mask = (1 << self.max_bit) - 1
+        prime_implicants = []
+        for mask, values in table.items():
+            # hash sets of one mask at a time, the level itself stays packed
+            present = set(values)
+            merged = set() # values merged with another implicant
+            for value in values:
+                free_bits = full_mask & ~(value | mask) # positions that can become 1 in the partner
+                while free_bits:
+                    bit = free_bits & -free_bits
+                    free_bits ^= bit
+                    if (value | bit) in present: # hash probe
+                        merged.add(value)
+                        merged.add(value | bit)
+                        if bit > mask: # canonical generation(the new highest dash)
+                            new_table.setdefault(mask | bit, array('Q')).append(value)
+                            if self.step_table_writer:
+                                self.step_table_writer.write(value.bit_count(), value, mask | bit)
+                if value not in merged: # partners have larger values, so the value is final here
+                    prime_implicants.append((value, mask))
+
+        # deterministic order of prime implicants within a step
+        for value, mask in sorted(prime_implicants, key=lambda implicant: (implicant[0].bit_count(), implicant)):
+            self.prime_implicants.append(Implicant(value, mask))
+        return new_table
+
+    def __table_size(self, table):
+        """
+        Returns:
+            int: number of implicants in the table(both merge engine formats)
+        """
+        return sum(sum(map(len, group.values())) if isinstance(group, dict) else len(group) for group in table.values())
+
+    def __run_step(self, step_number, step, *args):
+        """
+        Run one step and report it to the metrics receiver
+        """
+        if self.metrics is None:
+            return step(*args)
+        prime_implicant_count = len(self.prime_implicants)
+        start_time = time.perf_counter()
+        table = step(*args)
+        self.metrics.on_quine_mccluskey_step({'step': step_number,
+                                              'time': time.perf_counter() - start_time,
+                                              'table_size': self.__table_size(table),
+                                              'prime_implicants': len(self.prime_implicants) - prime_implicant_count})
+        return table
+
     def process(self):
         """
         Quine McCluskey main process
 
         Returns:
-            (list[tuple[int]], list[int]): prime implicants(list[tuple[int]]) and minterms(list[int])
-        """
-        new_table = self.__init_table()
-        step_number = 2
-        while True:
-            table = new_table
-            new_table = self.__merge_minterm(step_number, table)
-            step_number += 1
-            if not new_table: # empty table
-                break
-        self.__save_prime_implicants_to_csv()
+            (list[Implicant], list[int]): prime implicants(list[Implicant]) and minterms(list[int])
+        """
+        if self.merge_engine == 'hash':
+            init_table, merge = self.__init_implicant_table, self.__merge_implicant
+        else:
+            init_table, merge = self.__init_table, self.__merge_minterm
+        try:
+            if self.step_table_writer:
+                self.step_table_writer.begin_step(1)
+            new_table = self.__run_step(1, init_table)
+            step_number = 2
+            while True:
+                table = new_table
+                if self.step_table_writer:
+                    self.step_table_writer.begin_step(step_number)
+                new_table = self.__run_step(step_number, merge, step_number, table)
+                step_number += 1
+                if not new_table: # empty table
+                    break
+        finally: # the open step table is closed even if a step raises
+            if self.step_table_writer:
+                self.step_table_writer.end_step()
+        if self.trace != 'off':
+            self.__save_prime_implicants_to_csv()
         return (self.prime_implicants, self.minterms)
@@ -0,0 +1,64 @@
+"""
+    Reproducible random number streams
+        - RandomStream is a random.Random seeded from (root seed, spawn key), so every run is reproduced by its root seed
+          (parameters['seed'] of the testcase, drawn from os entropy and reported when it is not given)
+        - spawn(n) creates n independent child streams(islands, batch testcases), each child has its own spawn key
+          like numpy.random.SeedSequence.spawn, so the streams of parallel workers are never correlated
+        - generator() is the numpy.random.Generator of the same (root seed, spawn key) for batched draws
+"""
+
+import random, hashlib
+
+
+class RandomStream(random.Random):
+    def __init__(self, seed=None, spawn_key=()):
+        """
+        Args:
+            seed (int, optional): root seed. Defaults to None(drawn from os entropy).
+            spawn_key (tuple[int], optional): path of the stream in the spawn tree. Defaults to ()(root stream).
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.root_seed = int(seed)
+        self.spawn_key = tuple(spawn_key)
+        self.children = 0 # number of spawned child streams
+        super().__init__(self.__derived_seed())
+
+    def __derived_seed(self):
+        """
+        Returns:
+            int: seed of the Mersenne Twister state, hash of the root seed and the spawn key
+        """
+        if not self.spawn_key:
+            return self.root_seed
+        content = f"{self.root_seed}:{':'.join(map(str, self.spawn_key))}"
+        return int.from_bytes(hashlib.sha256(content.encode()).digest(), 'big')
+
+    def spawn(self, count):
+        """
+        Create independent child streams
+
+        Args:
+            count (int): number of child streams
+
+        Returns:
+            list[RandomStream]: child streams(the same children for the same root seed and spawn order)
+        """
+        streams = [RandomStream(self.root_seed, self.spawn_key + (self.children + index,)) for index in range(count)]
+        self.children += count
+        return streams
+
+    def generator(self):
+        """
+        Returns:
+            numpy.random.Generator: generator of the same root seed and spawn key
+        """
+        import numpy as np # numpy is only required for the generator
+        return np.random.default_rng(np.random.SeedSequence(self.root_seed, spawn_key=self.spawn_key))
+
+    def __reduce__(self): # sent to worker processes with its current state
+        return (self.__class__, (self.root_seed, self.spawn_key), (self.getstate(), self.children))
+
+    def __setstate__(self, state):
+        random_state, self.children = state
+        self.setstate(random_state)
@@ -0,0 +1,270 @@
+"""
+Vectorized Genetic Algorithm Implementation
+    Same steps as GeneticAlgorithm, but the whole population is kept as a packed uint8 matrix
+    (population_size x gene words) and each step runs as one batched NumPy operation per generation.
+    1. Initialize the population with random packed genomes, optionally seeded with greedy/sparse covers. [ __init_population method ]
+    2. Evaluate the fitness of the population with population x incidence matrix product. [ __evaluate_fitness method ]
+    3. Select the parents based on the fitness. [ __selection method ]
+    4. Generate the next generation by crossover masks. [ __crossover method ]
+    5. Mutate the genes of the next generation with bit-flip masks. [ __mutation method ]
+    6. Replace the current generation with the next generation. [ __generate_next_genomes method ]
+    7. Repeat steps 2-6 until maximum epoch is reached or an early stopping rule is met(parameters['early_stopping']).
+
+    Bit layout: j-th column of the unpacked population is the j-th prime implicant,
+    so a packed row read as a big-endian integer is the genome used by GeneticAlgorithm.
+"""
+
+import math, time
+
+import numpy as np
+
+from QuineMcCluskey import covered_indices
+from EarlyStopping import create_early_stopping
+from History import History
+from RandomStream import RandomStream
+from strategy.Initialization import GreedyCover, SparseCover
+
+class VectorizedGeneticAlgorithm:
+    def __init__(self, parameters, strategy, metrics=None, cancel_event=None, rng=None):
+        self.prime_implicants = None
+        self.metrics = metrics # Instrumentation.Metrics receiver, None: not measured
+        self.epoch_metrics = {}
+        self.cancel_event = cancel_event # stop after the current epoch when it is set, None: not cancellable
+        self.minterms = None
+
+        # paramerter dictionary unpacking
+        self.population_size = int(parameters["population_size"])
+        self.epoch = int(parameters["epoch"])
+        self.weight = int(parameters["weight"])
+        self.mutation_rate = float(parameters["mutation_rate"])
+        self.parent_population_size = int(parameters["parent_population_size"])
+        self.bit_mutation_rate = float(parameters["bit_mutation_rate"])
+        self.parameters = parameters
+        # ratio of the initial population created by each seeding strategy, the rest is uniform random
+        self.initialization = {name: float(ratio) for name, ratio in parameters.get("initialization", {}).items()}
+        for name in self.initialization:
+            if name not in ('greedy', 'sparse'):
+                raise ValueError(f"Unknown initialization strategy: {name}")
+        if int(parameters.get("local_search_size", 0)):
+            raise ValueError("numpy engine does not support local_search_size")
+        if parameters.get("checkpoint"):
+            raise ValueError("numpy engine does not support checkpoint")
+
+        # strategy dictionary unpacking
+        self.crossover_strategy = 'uniform' if strategy['crossover'] == 'uniform' else 'single_point'
+        if strategy.get('selection', 'roulette_wheel') != 'roulette_wheel':
+            raise ValueError("numpy engine supports only roulette_wheel selection")
+        # random number stream of the whole run, seeded by parameters['seed'](os entropy if not given)
+        self.random_stream = rng if rng is not None else RandomStream(parameters.get("seed"))
+        self.rng = self.random_stream.generator() # batched draws
+
+        # best solution (genome, fitness, covered minterms, used prime implicants, epoch)
+        self.best_solution = (0, -math.inf, -math.inf, math.inf, -1)
+
+        # data for visualization, recorded by the history policy(parameters['history']) once the gene size is known
+        self.history = None
+
+    def __set_minterms(self, minterms):
+        self.minterms = minterms
+
+    def __set_prime_implicants(self, prime_implicants):
+        self.prime_implicants = prime_implicants
+        self.gene_size = len(self.prime_implicants) # number of prime implicants
+        self.word_size = (self.gene_size + 7) // 8 # number of uint8 words per genome
+        self.padding = self.word_size * 8 - self.gene_size # unused low bits of the last word
+
+    def __build_incidence_matrix(self):
+        """
+        Build the prime implicant x minterm incidence matrix once per process.
+        incidence[j][k] is 1 when the j-th prime implicant covers the k-th (unique) minterm.
+        """
+        minterm_to_idx = {minterm: idx for idx, minterm in enumerate(dict.fromkeys(self.minterms))}
+        self.incidence = np.zeros((self.gene_size, len(minterm_to_idx)), dtype=np.float32)
+        for j, prime_implicant in enumerate(self.prime_implicants):
+            self.incidence[j, covered_indices(prime_implicant, minterm_to_idx)] = 1
+
+    def __to_genome(self, packed_genome):
+        """
+        Convert a packed row to the int genome format used by GeneticAlgorithm
+
+        Args:
+            packed_genome (np.ndarray): packed uint8 row
+
+        Returns:
+            int: genome
+        """
+        return int.from_bytes(packed_genome.tobytes(), 'big') >> self.padding
+
+    def __evaluate_genetic_diversity(self, genomes):
+        """
+        Evaluate the genetic diversity of the population
+
+        Args:
+            genomes (np.ndarray): packed population matrix
+
+        Returns:
+            int: number of different genomes(genetic diversity)
+        """
+        return int(np.unique(genomes, axis=0).shape[0])
+
+    def __to_packed_genome(self, genome):
+        """
+        Convert an int genome to a packed row, the inverse of __to_genome
+        """
+        return np.frombuffer((genome << self.padding).to_bytes(self.word_size, 'big'), dtype=np.uint8)
+
+    def __init_population(self):
+        """
+        Initialize the population with seeded genomes(parameters['initialization']) and random genomes.
+
+        Returns:
+            np.ndarray: packed population matrix (population_size x word_size)
+        """
+        genomes = self.rng.integers(0, 256, size=(self.population_size, self.word_size), dtype=np.uint8)
+        if self.padding:
+            genomes[:, -1] &= np.uint8((0xFF << self.padding) & 0xFF) # clear the unused low bits
+        if self.initialization:
+            # i-th bit of the int genome is the (gene_size - 1 - i)-th prime implicant(row of the incidence matrix)
+            bit_minterms = [np.flatnonzero(self.incidence[self.gene_size - 1 - bit]).tolist() for bit in range(self.gene_size)]
+            minterm_bits = [[] for _ in range(self.incidence.shape[1])]
+            for bit, minterms in enumerate(bit_minterms):
+                for minterm in minterms:
+                    minterm_bits[minterm].append(bit)
+            seeded = 0
+            for strategy, ratio in ((GreedyCover(bit_minterms, minterm_bits, self.random_stream), self.initialization.get('greedy', 0.0)),
+                                    (SparseCover(bit_minterms, minterm_bits, self.random_stream), self.initialization.get('sparse', 0.0))):
+                for _ in range(min(round(ratio * self.population_size), self.population_size - seeded)):
+                    genomes[seeded] = self.__to_packed_genome(strategy.process(self.gene_size))
+                    seeded += 1
+        return genomes
+
+    def __mutation(self, genomes):
+        mutated_rows = np.flatnonzero(self.rng.random(len(genomes)) < self.mutation_rate)
+        if len(mutated_rows):
+            flip_bits = self.rng.random((len(mutated_rows), self.gene_size)) < self.bit_mutation_rate
+            genomes[mutated_rows] ^= np.packbits(flip_bits, axis=1)
+        return genomes
+
+    def __crossover(self, first_parents, second_parents):
+        if self.crossover_strategy == 'uniform':
+            # randomly select each bit from one of the parents
+            mask = self.rng.integers(0, 256, size=first_parents.shape, dtype=np.uint8)
+        else:
+            # low random_point bits of the genome (last columns) come from the second parent
+            random_points = self.rng.integers(0, self.gene_size, size=len(first_parents))
+            columns = np.arange(self.gene_size)
+            mask = np.packbits(columns >= (self.gene_size - random_points)[:, None], axis=1)
+        return (second_parents & mask) | (first_parents & ~mask)
+
+    def __selection(self, genomes, fitness):
+        # roulette wheel selection on the cumulative fitness sums
+        fitness_sum = np.cumsum(fitness)
+        if fitness_sum[-1] <= 0: # every genome has zero fitness, select parents uniformly
+            return genomes[self.rng.integers(0, len(genomes), size=self.parent_population_size)]
+        # 1 ~ total fitness, i-th genome owns fitness_sum[i-1] < x <= fitness_sum[i]
+        random_numbers = self.rng.integers(1, fitness_sum[-1] + 1, size=self.parent_population_size)
+        return genomes[np.searchsorted(fitness_sum, random_numbers, side='left')]
+
+    def __run_phase(self, phase, function, *args):
+        """
+        Run one phase of the epoch and keep its time if metrics are measured
+        """
+        if self.metrics is None:
+            return function(*args)
+        start_time = time.perf_counter()
+        result = function(*args)
+        self.epoch_metrics[phase] = time.perf_counter() - start_time
+        return result
+
+    def __generate_next_genomes(self, genomes, fitness):
+        """
+        Generate the next genomes by selection, crossover and mutation.
+
+        Args:
+            genomes (np.ndarray): packed population matrix
+            fitness (np.ndarray): fitness of each genome
+
+        Returns:
+            np.ndarray: next generation packed population matrix
+        """
+        parent_genomes = self.__run_phase('select', self.__selection, genomes, fitness)
+        random_numbers = self.rng.integers(0, self.parent_population_size, size=(2, self.population_size))
+        return self.__run_phase('mutate', self.__mutation,
+                                self.__run_phase('crossover', self.__crossover,
+                                                 parent_genomes[random_numbers[0]], parent_genomes[random_numbers[1]]))
+
+    def __evaluate_fitness(self, genomes, epoch):
+        """
+        fitness function:
+            weight * number of covered minterms + total_prime_implicants - number of used prime implicants
+
+        Args:
+            genomes (np.ndarray): packed population matrix
+            epoch (int): current epoch
+
+        Returns:
+            np.ndarray: fitness of each genome
+        """
+        genome_bits = np.unpackbits(genomes, axis=1, count=self.gene_size)
+        used_prime_implicants = genome_bits.sum(axis=1, dtype=np.int64)
+        covered_minterms = ((genome_bits @ self.incidence) > 0).sum(axis=1, dtype=np.int64)
+        fitness = self.weight * covered_minterms + self.gene_size - used_prime_implicants
+
+        # update best_solution (first genome with the highest fitness, same as GeneticAlgorithm)
+        max_index = int(np.argmax(fitness))
+        if fitness[max_index] > self.best_solution[1]:
+            self.best_solution = (self.__to_genome(genomes[max_index]), int(fitness[max_index]),
+                                  int(covered_minterms[max_index]), int(used_prime_implicants[max_index]), epoch)
+        return fitness
+
+    def process(self, prime_implicants, minterms):
+        """
+        Vectorized Genetic Algorithm main process
+
+        Args:
+            prime_implicants (list[tuple[int]]): prime implicants
+            minterms (list[int]): minterms
+
+        Returns:
+            (dict, list, tuple, list, dict): fitness_data, max_genomes, best_solution, genetic_diversity, visualization_params
+        """
+        self.__set_prime_implicants(prime_implicants)
+        self.__set_minterms(minterms)
+        self.__build_incidence_matrix()
+        self.history = History(self.gene_size, self.parameters.get("history"), self.random_stream.spawn(1)[0])
+        early_stopping = create_early_stopping(self.parameters, self.prime_implicants, self.minterms, self.cancel_event)
+        genomes = self.__init_population()
+        for epoch in range(self.epoch):
+            fitness = self.__run_phase('evaluate', self.__evaluate_fitness, genomes, epoch)
+            max_index = int(np.argmax(fitness))
+            max_genome = self.__to_genome(genomes[max_index])
+
+            genomes = self.__generate_next_genomes(genomes, fitness)
+            genetic_diversity = self.__evaluate_genetic_diversity(genomes)
+
+            # set fitness, hitmap and genetic diversity data
+            average_fitness = float(fitness.sum()) / self.population_size
+            self.history.record(epoch, average_fitness, int(fitness[max_index]), int(fitness.min()), max_genome, genetic_diversity)
+            if self.metrics is not None:
+                # every genome is evaluated, there is no fitness cache
+                self.metrics.on_genetic_algorithm_epoch({'epoch': epoch, **self.epoch_metrics,
+                                                         'evaluations': self.population_size,
+                                                         'cache_hits': 0,
+                                                         'unique_genomes': genetic_diversity,
+                                                         'max_fitness': int(fitness[max_index]),
+                                                         'average_fitness': average_fitness,
+                                                         'best_fitness': self.best_solution[1]})
+
+            if early_stopping and early_stopping.should_stop(epoch, self.best_solution, genetic_diversity):
+                break
+        self.history.finish()
+
+        epochs, fitness_data, max_genomes, genetic_diversity = self.history.series()
+        self.history.close()
+        visualization_params = {'gene_size': self.gene_size,
+                                'minterms': self.minterms,
+                                'prime_implicants': self.prime_implicants,
+                                'epochs': epochs,
+                                'seed': self.random_stream.root_seed,
+                                'stop_reason': early_stopping.stop_reason if early_stopping else None}
+        return fitness_data, max_genomes, self.best_solution, genetic_diversity, visualization_params
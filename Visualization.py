@@ -0,0 +1,199 @@
+"""
+    Visualization module renders the plots of a run from its persisted series, apart from the algorithms and the GUI.
+        - series.npz: fitness(min, average, max), genetic diversity, best genome of each recorded epoch(packed bits),
+          the recorded epoch numbers(History policy)
+          and the prime implicant x minterm coverage matrix(packed bits)
+        - each plot is rendered by one render_plot call on the Agg backend, so the plots can run in a process pool
+        - heatmaps of long runs are downsampled to at most max_rows rows(mean of each bin of epochs)
+
+    Usage:
+        python Visualization.py outputs/20240101_000000/series.npz --plots fitness usage_heatmap
+"""
+
+import os, argparse
+
+import numpy as np
+
+from QuineMcCluskey import covered_indices
+
+PLOTS = ('fitness', 'normalized_fitness', 'genetic_diversity', 'group_genetic_diversity', 'usage_heatmap', 'coverage_heatmap')
+SERIES_FILE = 'series.npz'
+
+
+def save_series(path, result, group=10):
+    """
+    Save the series of a run_testcase result as a compressed npz file
+
+    Args:
+        path (str): npz file path
+        result (dict): result of run_testcase
+        group (int, optional): number of groups of the group genetic diversity plot. Defaults to 10.
+    """
+    visualization_params = result['visualization_params']
+    gene_size = visualization_params['gene_size']
+    word_size = (gene_size + 7) // 8
+    genomes = b''.join(genome.to_bytes(word_size, 'big') for genome in result['max_genomes'])
+
+    # j-th column of the unpacked row is the j-th prime implicant(the padding bits are dropped on load)
+    minterm_to_idx = {minterm: idx for idx, minterm in enumerate(dict.fromkeys(visualization_params['minterms']))}
+    incidence = np.zeros((gene_size, len(minterm_to_idx)), dtype=bool)
+    for j, prime_implicant in enumerate(visualization_params['prime_implicants']):
+        incidence[j, covered_indices(prime_implicant, minterm_to_idx)] = True
+
+    fitness_data = result['fitness_data']
+    epochs = visualization_params.get('epochs', range(len(fitness_data['average']))) # every epoch if not given
+    np.savez_compressed(path,
+                        epochs=np.asarray(epochs, dtype=np.int64),
+                        fitness_min=np.asarray(fitness_data['min'], dtype=np.int64),
+                        fitness_average=np.asarray(fitness_data['average'], dtype=np.float64),
+                        fitness_max=np.asarray(fitness_data['max'], dtype=np.int64),
+                        genetic_diversity=np.asarray(result['genetic_diversity'], dtype=np.int64),
+                        best_genomes=np.frombuffer(genomes, dtype=np.uint8).reshape(len(result['max_genomes']), word_size),
+                        incidence=np.packbits(incidence, axis=1),
+                        gene_size=gene_size,
+                        minterm_count=len(minterm_to_idx),
+                        group=group)
+
+def load_series(path):
+    """
+    Returns:
+        dict: arrays of the npz file, best_genomes(epochs x gene_size) and incidence(gene_size x minterms) are unpacked
+    """
+    with np.load(path) as npz_file:
+        series = {key: npz_file[key] for key in npz_file.files}
+    gene_size = int(series['gene_size'])
+    padding = series['best_genomes'].shape[1] * 8 - gene_size
+    series['best_genomes'] = np.unpackbits(series['best_genomes'], axis=1)[:, padding:]
+    series['incidence'] = np.unpackbits(series['incidence'], axis=1, count=int(series['minterm_count']))
+    return series
+
+def downsample(data, max_rows):
+    """
+    Downsample the rows(epochs) to at most max_rows rows, each row is the mean of a bin of consecutive epochs
+
+    Args:
+        data (np.ndarray): epochs x columns matrix
+        max_rows (int): maximum number of rows
+
+    Returns:
+        np.ndarray: downsampled matrix(data itself if it is short enough)
+    """
+    if len(data) <= max_rows:
+        return data
+    starts = np.linspace(0, len(data), max_rows, endpoint=False).astype(np.int64)
+    counts = np.diff(np.append(starts, len(data)))
+    return np.add.reduceat(data.astype(np.float64), starts, axis=0) / counts[:, None]
+
+def render_plot(series_path, output_directory, plot, max_rows=500):
+    """
+    Render one plot of the series to a png file on the Agg backend
+
+    Args:
+        series_path (str): npz file path saved by save_series
+        output_directory (str): directory of the png file
+        plot (str): one of PLOTS
+        max_rows (int, optional): maximum number of epochs(rows) of the heatmaps. Defaults to 500.
+
+    Returns:
+        str: png file path
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    series = load_series(series_path)
+    epoch = len(series['fitness_average']) # number of recorded epochs
+    epochs = series['epochs'] if 'epochs' in series else np.arange(epoch) # recorded epoch numbers
+    if plot == 'fitness':
+        # x-axis: epoch, y-axis: fitness
+        plt.plot(epochs, series['fitness_min'], label='Min Fitness', color='green')
+        plt.plot(epochs, series['fitness_average'], label='Average Fitness', color='blue')
+        plt.plot(epochs, series['fitness_max'], label='Max Fitness', color='orange')
+        plt.title("Fitness Plot")
+        plt.xlabel("Epoch")
+        plt.ylabel("Fitness")
+        plt.legend(loc='best', framealpha=0.5)
+        file_name = 'Fitness_Plot.png'
+    elif plot == 'normalized_fitness':
+        # normalize the average fitness data
+        average = series['fitness_average']
+        fitness_range = (average.max() - average.min()) or 1 # constant average fitness(e.g. early stopped run)
+        plt.plot(epochs / (epochs[-1] + 1), (average - average.min()) / fitness_range, label='Average Fitness', color='blue')
+        plt.title("Normalized Fitness Plot")
+        plt.xlabel("Epoch")
+        plt.ylabel("Fitness")
+        plt.legend(loc='best', framealpha=0.5)
+        file_name = 'Normalized_Fitness_Plot.png'
+    elif plot == 'genetic_diversity':
+        # x-axis: epoch, y-axis: genetic diversity
+        plt.plot(epochs, series['genetic_diversity'], label='Genetic Diversity', color='purple')
+        plt.title("Genetic Diversity Plot")
+        plt.xlabel("Epoch")
+        plt.ylabel("Genetic Diversity")
+        file_name = 'Genetic_Diversity_Plot.png'
+    elif plot == 'group_genetic_diversity':
+        # average of each group of recorded epochs, the last group has fewer epochs if epoch is not divisible by group
+        diversity = series['genetic_diversity']
+        group_size = max(1, -(-len(diversity) // int(series['group']))) # ceil(len(diversity) / group)
+        x_data = np.arange(0, len(diversity), group_size)
+        plt.plot(epochs[x_data], np.add.reduceat(diversity, x_data) / np.diff(np.append(x_data, len(diversity))), color='purple')
+        plt.title("Genetic Diversity(Group) Plot")
+        plt.xlabel("Epoch")
+        plt.ylabel("Genetic Diversity")
+        file_name = 'Genetic_Diversity_Group_Plot.png'
+    elif plot == 'usage_heatmap':
+        plt.matshow(downsample(series['best_genomes'], max_rows), cmap=plt.get_cmap('Blues'))
+        plt.title("Prime_Implicants_Usage_Heatmap")
+        if epoch > max_rows:
+            plt.ylabel(f"Epoch / {epoch / max_rows:.1f}")
+        file_name = 'Prime_Implicants_Usage_Heatmap.png'
+    elif plot == 'coverage_heatmap':
+        # coverage is linear in the genome bits, so the mean coverage of a bin is the mean genome times the incidence
+        genomes = downsample(series['best_genomes'], max_rows)
+        plt.matshow(genomes.astype(np.float64) @ series['incidence'], cmap=plt.get_cmap('Greys'))
+        plt.title("Minterm_Coverage_Hitmap")
+        if epoch > max_rows:
+            plt.ylabel(f"Epoch / {epoch / max_rows:.1f}")
+        plt.colorbar(shrink=0.8, aspect=10)
+        plt.clim(vmin=0)
+        file_name = 'Minterm_Coverage_Hitmap.png'
+    else:
+        raise ValueError(f"Unknown plot: {plot}")
+    path = os.path.join(output_directory, file_name)
+    plt.savefig(path)
+    plt.close()
+    return path
+
+def render_plots(series_path, output_directory, plots=PLOTS, executor=None, max_rows=500):
+    """
+    Render the plots of the series
+
+    Args:
+        series_path (str): npz file path saved by save_series
+        output_directory (str): directory of the png files
+        plots (list[str], optional): plots to render. Defaults to PLOTS.
+        executor (concurrent.futures.Executor, optional): render in the executor. Defaults to None(render here).
+        max_rows (int, optional): maximum number of epochs(rows) of the heatmaps. Defaults to 500.
+
+    Returns:
+        list[str] | list[concurrent.futures.Future]: png file paths, or their futures if executor is given
+    """
+    if executor is None:
+        return [render_plot(series_path, output_directory, plot, max_rows) for plot in plots]
+    return [executor.submit(render_plot, series_path, output_directory, plot, max_rows) for plot in plots]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the plots of a saved series")
+    parser.add_argument('series', help="series.npz path")
+    parser.add_argument('--plots', nargs='+', choices=PLOTS, default=list(PLOTS))
+    parser.add_argument('--output', default=None, help="png directory. Defaults to the directory of the series")
+    parser.add_argument('--max-rows', type=int, default=500, help="maximum number of epochs(rows) of the heatmaps")
+    args = parser.parse_args(argv)
+
+    output_directory = args.output or os.path.dirname(args.series)
+    for path in render_plots(args.series, output_directory, args.plots, max_rows=args.max_rows):
+        print(path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+    Frozen copy of the original tuple-based Quine-McCluskey merge(before the (value, mask) implicants and the hash engine)
+    Only the csv trace files are removed, the merge is unchanged, so the merge engines are benchmarked against the original code.
+    Do not optimize this module.
+"""
+
+
+class BaselineQuineMcCluskey:
+    def __init__(self, minterms, dontcares):
+        self.minterms = minterms
+        self.dontcares = dontcares
+        self.prime_implicants = []
+
+    def __init_table(self):
+        """
+        Initialize the table with minterms and dontcares
+
+        Returns:
+            dict: key: bit_count(group), value: list of tuple (minterms, dash_position)
+        """
+        table = {}
+        for term in self.minterms + self.dontcares:
+            bit_count = term.bit_count() # number of 1s in the binary representation
+            if bit_count not in table:
+                table[bit_count] = [((term,), 0)]
+            else:
+                table[bit_count].append(((term,), 0))
+        return table
+
+    def __merge_minterm(self, table):
+        """
+        merge minterms to find prime implicants
+
+        Args:
+            table (dict): key: bit_count(group), value: list of tuple (minterms, dash_position)
+
+        Returns:
+            dict: key: bit_count(group), value: list of tuple (minterms, dash_position)
+        """
+        new_table = {}
+        generated_minterms_set = set()
+        not_prime_implicants = set() # set of not prime implicants(already merged with other minterms)
+        groups = sorted(table) # sort by group number(bit_count) to compare with the next group
+        for group_bit_count in groups:
+            group = sorted(table[group_bit_count])
+            if group_bit_count + 1 not in table: # unable to find 1 bit difference group
+                for minterm, _ in group:
+                    if tuple(minterm) not in not_prime_implicants:
+                        self.prime_implicants.append(tuple(minterm))
+                continue
+            else: # find 1 bit difference group
+                target_group = sorted(table[group_bit_count + 1])
+                for minterms, dash_info in group:
+                    if tuple(minterms) not in not_prime_implicants: # check if it is already merged with
+                        is_prime_implicant = True
+                    else:
+                        is_prime_implicant = False
+                    for target_minterms, target_dash_info in target_group:
+                        if dash_info != target_dash_info: # dash position is differnet
+                            continue
+
+                        # combine minterm with dash information
+                        minterm_with_dash = minterms[0] | dash_info
+                        target_minterm_with_dash = target_minterms[0] | target_dash_info
+
+                        # check if there is only 1 bit difference
+                        if (minterm_with_dash ^ target_minterm_with_dash).bit_count() == 1:
+                            is_prime_implicant = False
+                            not_prime_implicants.add(tuple(target_minterms))
+                            if tuple(sorted(minterms + target_minterms)) in generated_minterms_set:  # to avoid duplicated minterms
+                                continue
+
+                            # add new minterm to the new table
+                            if group_bit_count not in new_table: # 1 bit decrease(group_bit_count + 1 - 1)
+                                new_table[group_bit_count] = []
+                            new_table[group_bit_count].append((sorted(minterms + target_minterms),
+                                                            (minterm_with_dash ^ target_minterm_with_dash) + dash_info))
+                            generated_minterms_set.add((tuple(sorted(minterms + target_minterms))))
+
+                    if is_prime_implicant: # check if it is prime implicant
+                        self.prime_implicants.append(tuple(minterms))
+        return new_table
+
+    def process(self):
+        """
+        Returns:
+            (list[tuple[int]], list[int]): prime implicants(list[tuple[int]]) and minterms(list[int])
+        """
+        new_table = self.__init_table()
+        while True:
+            table = new_table
+            new_table = self.__merge_minterm(table)
+            if not new_table: # empty table
+                break
+        return (self.prime_implicants, self.minterms)
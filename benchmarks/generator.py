@@ -0,0 +1,80 @@
+"""
+    Synthetic boolean function(testcase) generator
+
+    Run from the repository root:
+        python -m benchmarks.generator --variables 10 --density 0.3 --dontcare-ratio 0.05 --seed 1 --output testcases/random.json
+"""
+
+import json, random, argparse
+
+DEFAULT_PARAMETERS = {
+    "population_size": 100,
+    "parent_population_size": 30,
+    "epoch": 200,
+    "weight": 4,
+    "mutation_rate": 0.02,
+    "bit_mutation_rate": 0.03
+}
+
+DEFAULT_STRATEGY = {
+    "crossover": "single_point"
+}
+
+def generate_terms(variable_count, density, dontcare_ratio=0.0, seed=0):
+    """
+    Generate random minterms and dontcares of a single-output boolean function
+
+    Args:
+        variable_count (int): number of input variables
+        density (float): ratio of minterms in the 2 ** variable_count input space
+        dontcare_ratio (float, optional): ratio of dontcares in the input space. Defaults to 0.0.
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        (list[int], list[int]): sorted minterms and sorted dontcares
+    """
+    generator = random.Random(seed)
+    space = 1 << variable_count
+    minterm_count = max(1, int(space * density))
+    dontcare_count = min(space - minterm_count, int(space * dontcare_ratio))
+    terms = generator.sample(range(space), minterm_count + dontcare_count)
+    return sorted(terms[:minterm_count]), sorted(terms[minterm_count:])
+
+def generate_testcase(variable_count, density, dontcare_ratio=0.0, seed=0, parameters=None, strategy=None, group=10):
+    """
+    Generate a random testcase in the same format as testcases/*.json
+
+    Args:
+        variable_count (int): number of input variables
+        density (float): ratio of minterms in the input space
+        dontcare_ratio (float, optional): ratio of dontcares in the input space. Defaults to 0.0.
+        seed (int, optional): random seed. Defaults to 0.
+        parameters (dict, optional): genetic algorithm parameters. Defaults to DEFAULT_PARAMETERS.
+        strategy (dict, optional): genetic algorithm strategy. Defaults to DEFAULT_STRATEGY.
+        group (int, optional): visualization group. Defaults to 10.
+
+    Returns:
+        dict: testcase
+    """
+    minterms, dontcares = generate_terms(variable_count, density, dontcare_ratio, seed)
+    return {"minterms": minterms,
+            "dontcares": dontcares,
+            "parameters": dict(parameters or DEFAULT_PARAMETERS),
+            "strategy": dict(strategy or DEFAULT_STRATEGY),
+            "visualization": {"group": group}}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a random testcase json")
+    parser.add_argument('--variables', type=int, required=True, help="number of input variables")
+    parser.add_argument('--density', type=float, default=0.3, help="ratio of minterms in the input space")
+    parser.add_argument('--dontcare-ratio', type=float, default=0.0, help="ratio of dontcares in the input space")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    parser.add_argument('--output', required=True, help="output testcase json path")
+    args = parser.parse_args(argv)
+
+    testcase = generate_testcase(args.variables, args.density, args.dontcare_ratio, args.seed)
+    with open(args.output, 'w') as json_file:
+        json.dump(testcase, json_file, indent=4)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+    Benchmark of the Quine-McCluskey merge engines (hash, pairwise) against the original tuple-based merge
+    (frozen copy in benchmarks/baseline_qm.py), the speedups are relative to the original code
+
+    Run from the repository root:
+        python -m benchmarks.qm_merge_benchmark
+"""
+
+import json, time
+
+from QuineMcCluskey import QuineMcCluskey
+from benchmarks.baseline_qm import BaselineQuineMcCluskey
+from benchmarks.generator import generate_terms
+
+def run_engine(minterms, dontcares, merge_engine):
+    """
+    Run Quine-McCluskey with the given merge engine
+
+    Returns:
+        (float, set[tuple[int]]): elapsed seconds and the set of prime implicants
+    """
+    start_time = time.perf_counter()
+    if merge_engine == 'original':
+        prime_implicants, _ = BaselineQuineMcCluskey(minterms, dontcares).process()
+    else:
+        prime_implicants, _ = QuineMcCluskey(minterms, dontcares, merge_engine=merge_engine, trace='off').process()
+    end_time = time.perf_counter()
+    return end_time - start_time, {tuple(prime_implicant) for prime_implicant in prime_implicants}
+
+def main():
+    with open('testcases/testcase2.json', 'r') as json_file:
+        testcase = json.load(json_file)
+    cases = [('testcase2.json', testcase['minterms'], testcase['dontcares'])]
+    for variable_count, density in [(10, 0.3), (11, 0.4), (12, 0.4), (13, 0.5)]:
+        cases.append((f'random {variable_count} vars, density {density}',
+                      *generate_terms(variable_count, density, seed=variable_count)))
+
+    print(f"{'case':<32}{'minterms':>10}{'PIs':>8}{'original(s)':>14}{'pairwise(s)':>14}{'hash(s)':>10}"
+          f"{'pairwise speedup':>18}{'hash speedup':>14}")
+    for name, minterms, dontcares in cases:
+        original_time, original_prime_implicants = run_engine(minterms, dontcares, 'original')
+        pairwise_time, pairwise_prime_implicants = run_engine(minterms, dontcares, 'pairwise')
+        hash_time, hash_prime_implicants = run_engine(minterms, dontcares, 'hash')
+        if not original_prime_implicants == pairwise_prime_implicants == hash_prime_implicants:
+            raise AssertionError(f"prime implicants differ on {name}")
+        print(f"{name:<32}{len(minterms):>10}{len(hash_prime_implicants):>8}"
+              f"{original_time:>14.3f}{pairwise_time:>14.3f}{hash_time:>10.3f}"
+              f"{original_time / pairwise_time:>17.1f}x{original_time / hash_time:>13.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+    Benchmark suite on synthetic testcases
+        - Quine-McCluskey: time, table size and prime implicants of each merge step
+        - Genetic Algorithm: time of each phase(evaluate, local_search, select, crossover, mutate) summed over the epochs
+        - peak memory(tracemalloc) of both stages, measured in a separate run so it does not slow down the timings
+    Results are written to a json file to compare runs across changes.
+
+    Run from the repository root:
+        python -m benchmarks.suite --variables 8 10 --density 0.3 --seeds 0 1 --output bench.json
+"""
+
+import json, time, argparse, platform, tracemalloc
+from datetime import datetime
+
+from QuineMcCluskey import QuineMcCluskey
+from GeneticAlgorithm import GeneticAlgorithm
+from Instrumentation import MetricsRecorder
+from benchmarks.generator import generate_testcase
+
+GENETIC_ALGORITHM_PHASES = ('evaluate', 'local_search', 'select', 'crossover', 'mutate')
+
+def measure_peak_memory(function):
+    """
+    Run the function under tracemalloc
+
+    Returns:
+        (object, int): result of the function and peak traced memory in bytes
+    """
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak_bytes
+
+def run_case(testcase, measure_memory=True):
+    """
+    Benchmark one testcase
+
+    Args:
+        testcase (dict): testcase
+        measure_memory (bool, optional): run again under tracemalloc for the peak memory. Defaults to True.
+
+    Returns:
+        dict: benchmark record of the testcase
+    """
+    minterms, dontcares = testcase["minterms"], testcase["dontcares"]
+
+    # Quine-McCluskey per merge step
+    metrics = MetricsRecorder()
+    start_time = time.perf_counter()
+    prime_implicants, minterms = QuineMcCluskey(minterms, dontcares, trace='off', metrics=metrics).process()
+    quine_mccluskey_time = time.perf_counter() - start_time
+    quine_mccluskey_steps = metrics.quine_mccluskey_steps
+
+    # Genetic Algorithm per phase
+    metrics = MetricsRecorder()
+    algorithm = GeneticAlgorithm(testcase["parameters"], testcase["strategy"], metrics=metrics)
+    start_time = time.perf_counter()
+    _, _, best_solution, _, _ = algorithm.process(prime_implicants, minterms)
+    genetic_algorithm_time = time.perf_counter() - start_time
+    phase_times = {phase: sum(epoch_metrics.get(phase, 0.0) for epoch_metrics in metrics.genetic_algorithm_epochs)
+                   for phase in GENETIC_ALGORITHM_PHASES}
+
+    record = {'minterms': len(minterms),
+              'dontcares': len(testcase["dontcares"]),
+              'prime_implicants': len(prime_implicants),
+              'quine_mccluskey': {'time': quine_mccluskey_time, 'steps': quine_mccluskey_steps},
+              'genetic_algorithm': {'time': genetic_algorithm_time,
+                                    'epochs': len(metrics.genetic_algorithm_epochs),
+                                    'phases': phase_times,
+                                    'best_fitness': best_solution[1],
+                                    'used_prime_implicants': best_solution[3],
+                                    'covered_minterms': best_solution[2]}}
+
+    if measure_memory:
+        _, record['quine_mccluskey']['peak_memory'] = measure_peak_memory(
+            lambda: QuineMcCluskey(testcase["minterms"], dontcares, trace='off').process())
+        _, record['genetic_algorithm']['peak_memory'] = measure_peak_memory(
+            lambda: GeneticAlgorithm(testcase["parameters"], testcase["strategy"]).process(prime_implicants, minterms))
+    return record
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Quine-McCluskey and the genetic algorithm on random testcases")
+    parser.add_argument('--variables', type=int, nargs='+', default=[8, 10], help="numbers of input variables")
+    parser.add_argument('--density', type=float, nargs='+', default=[0.3], help="ratios of minterms in the input space")
+    parser.add_argument('--dontcare-ratio', type=float, nargs='+', default=[0.0], help="ratios of dontcares in the input space")
+    parser.add_argument('--seeds', type=int, nargs='+', default=[0], help="random seeds")
+    parser.add_argument('--epoch', type=int, default=100, help="genetic algorithm epochs")
+    parser.add_argument('--population-size', type=int, default=100, help="genetic algorithm population size")
+    parser.add_argument('--crossover', choices=['single_point', 'uniform'], default='single_point')
+    parser.add_argument('--no-memory', action='store_true', help="skip the peak memory measurement")
+    parser.add_argument('--output', default='bench_output.json', help="output json path")
+    args = parser.parse_args(argv)
+
+    runs = []
+    for variable_count in args.variables:
+        for density in args.density:
+            for dontcare_ratio in args.dontcare_ratio:
+                for seed in args.seeds:
+                    testcase = generate_testcase(variable_count, density, dontcare_ratio, seed)
+                    testcase["parameters"].update(epoch=args.epoch, population_size=args.population_size, seed=seed)
+                    testcase["strategy"].update(crossover=args.crossover)
+                    record = {'variables': variable_count, 'density': density, 'dontcare_ratio': dontcare_ratio, 'seed': seed}
+                    record.update(run_case(testcase, measure_memory=not args.no_memory))
+                    runs.append(record)
+                    print(f"variables={variable_count} density={density} dontcare_ratio={dontcare_ratio} seed={seed}: "
+                          f"qm {record['quine_mccluskey']['time']:.3f}s, ga {record['genetic_algorithm']['time']:.3f}s")
+
+    result = {'environment': {'python': platform.python_version(),
+                              'platform': platform.platform(),
+                              'timestamp': datetime.now().isoformat(timespec='seconds')},
+              'settings': vars(args),
+              'runs': runs}
+    with open(args.output, 'w') as json_file:
+        json.dump(result, json_file, indent=2)
+
+if __name__ == '__main__':
+    main()
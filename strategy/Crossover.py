@@ -6,6 +6,13 @@ import random
 from abc import ABC, abstractmethod
 
 class CrossoverStrategy(ABC):
+    def __init__(self, rng=random):
+        """
+        Args:
+            rng (random.Random, optional): random number stream. Defaults to the random module.
+        """
+        self.rng = rng
+
     @abstractmethod
     def process(self, parents, gene_size):
         """
@@ -20,11 +27,25 @@ class CrossoverStrategy(ABC):
         """
         pass
 
+    def process_batch(self, parents_list, gene_size):
+        """
+        Generate child genomes for every parent pair in one call.
+
+        Args:
+            parents_list (list[tuple]): A list of tuples containing two parent genomes.
+            gene_size (int): The size of the genome.
+
+        Returns:
+            list[int]: The child genomes generated by crossover.
+        """
+        process = self.process
+        return [process(parents, gene_size) for parents in parents_list]
+
 
 class SinglePoint(CrossoverStrategy):
     def process(self, parents, gene_size):
         # Select a random crossover point.
-        random_point = random.randrange(gene_size) 
+        random_point = self.rng.randrange(gene_size) 
         # Create a mask at the crossover point.
         mask = (1 << random_point) - 1 
         # Generate the child genome by combining the parent genomes at the crossover point.
@@ -35,11 +56,14 @@ class SinglePoint(CrossoverStrategy):
 
 class Uniform(CrossoverStrategy):
     def process(self, parents, gene_size):
-        genome = 0
-        for i in range(gene_size):
-            # Randomly select each bit from one of the parents.
-            if random.random() < 0.5:
-                genome |= (parents[0] & (1 << i))
-            else:
-                genome |= (parents[1] & (1 << i))
-        return genome
\ No newline at end of file
+        # Randomly select each bit from one of the parents with one gene_size-bit random mask.
+        mask = self.rng.getrandbits(gene_size)
+        return (parents[0] & mask) | (parents[1] & ~mask)
+
+    def process_batch(self, parents_list, gene_size):
+        getrandbits = self.rng.getrandbits
+        children = []
+        for first_parent, second_parent in parents_list:
+            mask = getrandbits(gene_size)
+            children.append((first_parent & mask) | (second_parent & ~mask))
+        return children
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+    Initialization module contains the strategies for creating the genomes of the initial population.
+"""
+
+import random
+from abc import ABC, abstractmethod
+
+class InitializationStrategy(ABC):
+    def __init__(self, rng=random):
+        """
+        Args:
+            rng (random.Random, optional): random number stream. Defaults to the random module.
+        """
+        self.rng = rng
+
+    @abstractmethod
+    def process(self, gene_size):
+        """
+        Abstract method to create one genome of the initial population.
+
+        Args:
+            gene_size (int): The size of the genome.
+
+        Returns:
+            int: The created genome.
+        """
+        pass
+
+class UniformRandom(InitializationStrategy):
+    def process(self, gene_size):
+        return self.rng.randrange(1 << gene_size) # select random genome from 0 to 2 ** gene_size - 1
+
+class GreedyCover(InitializationStrategy):
+    """
+    Greedy set cover: add the prime implicant covering the most uncovered minterms until every minterm is covered,
+    ties are broken randomly so the genomes differ.
+    """
+    def __init__(self, bit_minterms, minterm_bits, rng=random):
+        """
+        Args:
+            bit_minterms (list[list[int]]): minterm indices covered by each genome bit
+            minterm_bits (list[list[int]]): genome bits covering each minterm
+            rng (random.Random, optional): random number stream. Defaults to the random module.
+        """
+        super().__init__(rng)
+        self.bit_minterms = bit_minterms
+        self.minterm_bits = minterm_bits
+
+    def process(self, gene_size):
+        gains = [len(minterms) for minterms in self.bit_minterms] # number of uncovered minterms of each genome bit
+        covered = [False] * len(self.minterm_bits)
+        remaining = sum(1 for bits in self.minterm_bits if bits) # coverable minterms not covered yet
+        genome = 0
+        while remaining:
+            best_gain = max(gains)
+            bit = self.rng.choice([candidate for candidate, gain in enumerate(gains) if gain == best_gain])
+            genome |= 1 << bit
+            for minterm in self.bit_minterms[bit]:
+                if covered[minterm]:
+                    continue
+                covered[minterm] = True
+                remaining -= 1
+                for other in self.minterm_bits[minterm]:
+                    gains[other] -= 1
+        return genome
+
+class SparseCover(InitializationStrategy):
+    """
+    Random cover: visit the minterms in random order and cover each uncovered one with a random prime implicant covering it.
+    """
+    def __init__(self, bit_minterms, minterm_bits, rng=random):
+        """
+        Args:
+            bit_minterms (list[list[int]]): minterm indices covered by each genome bit
+            minterm_bits (list[list[int]]): genome bits covering each minterm
+            rng (random.Random, optional): random number stream. Defaults to the random module.
+        """
+        super().__init__(rng)
+        self.bit_minterms = bit_minterms
+        self.minterm_bits = minterm_bits
+
+    def process(self, gene_size):
+        order = list(range(len(self.minterm_bits)))
+        self.rng.shuffle(order)
+        covered = [False] * len(self.minterm_bits)
+        genome = 0
+        for minterm in order:
+            if covered[minterm] or not self.minterm_bits[minterm]:
+                continue
+            bit = self.rng.choice(self.minterm_bits[minterm])
+            genome |= 1 << bit
+            for other in self.bit_minterms[bit]:
+                covered[other] = True
+        return genome
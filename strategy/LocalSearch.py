@@ -0,0 +1,97 @@
+"""
+    LocalSearch module contains the local search strategies for refining the best genomes of a generation(memetic step).
+"""
+
+from abc import ABC, abstractmethod
+
+def coverage_lists(coverage_masks, minterm_count):
+    """
+    Convert the coverage bitmasks of the genome bits to index lists in both directions
+
+    Args:
+        coverage_masks (list[int]): coverage bitmask of each genome bit(j-th bit: j-th unique minterm is covered)
+        minterm_count (int): number of unique minterms
+
+    Returns:
+        (list[list[int]], list[list[int]]): minterm indices covered by each genome bit, genome bits covering each minterm
+    """
+    bit_minterms = []
+    for mask in coverage_masks:
+        minterms = []
+        while mask:
+            lowest_bit = mask & -mask
+            minterms.append(lowest_bit.bit_length() - 1)
+            mask ^= lowest_bit
+        bit_minterms.append(minterms)
+    minterm_bits = [[] for _ in range(minterm_count)]
+    for bit, minterms in enumerate(bit_minterms):
+        for minterm in minterms:
+            minterm_bits[minterm].append(bit)
+    return bit_minterms, minterm_bits
+
+class LocalSearchStrategy(ABC):
+    @abstractmethod
+    def process(self, genome):
+        """
+        Abstract method to refine the given genome.
+
+        Args:
+            genome (int): The genome to refine.
+
+        Returns:
+            (int, int, int): The refined genome, its number of covered minterms and its number of used prime implicants.
+        """
+        pass
+
+class GreedyCoverRefinement(LocalSearchStrategy):
+    """
+    Repair the genome to a full cover, then remove the redundant prime implicants.
+    Coverage counts(number of selected prime implicants covering each minterm) are built once per genome,
+    so adding or removing one prime implicant costs O(number of its minterms).
+    """
+    def __init__(self, bit_minterms, minterm_bits):
+        """
+        Args:
+            bit_minterms (list[list[int]]): minterm indices covered by each genome bit
+            minterm_bits (list[list[int]]): genome bits covering each minterm
+        """
+        self.bit_minterms = bit_minterms
+        self.minterm_bits = minterm_bits
+        self.minterm_count = len(minterm_bits)
+
+    def __add(self, counts, bit):
+        for minterm in self.bit_minterms[bit]:
+            counts[minterm] += 1
+
+    def __remove(self, counts, bit):
+        for minterm in self.bit_minterms[bit]:
+            counts[minterm] -= 1
+
+    def process(self, genome):
+        bit_minterms = self.bit_minterms
+        counts = [0] * self.minterm_count
+        selected = []
+        remaining = genome
+        while remaining:
+            lowest_bit = remaining & -remaining
+            bit = lowest_bit.bit_length() - 1
+            selected.append(bit)
+            self.__add(counts, bit)
+            remaining ^= lowest_bit
+
+        # repair: cover each uncovered minterm with the prime implicant covering the most uncovered minterms
+        for minterm in range(self.minterm_count):
+            if counts[minterm] or not self.minterm_bits[minterm]: # covered, or no prime implicant covers it
+                continue
+            bit = max(self.minterm_bits[minterm],
+                      key=lambda candidate: sum(1 for other in bit_minterms[candidate] if not counts[other]))
+            genome |= 1 << bit
+            selected.append(bit)
+            self.__add(counts, bit)
+
+        # redundancy removal: smaller prime implicants first, every minterm of a redundant one is covered twice or more
+        for bit in sorted(selected, key=lambda bit: len(bit_minterms[bit])):
+            if all(counts[minterm] > 1 for minterm in bit_minterms[bit]):
+                genome ^= 1 << bit
+                self.__remove(counts, bit)
+        return genome, sum(1 for count in counts if count), genome.bit_count()
@@ -0,0 +1,88 @@
+"""
+    Mutation module contains the mutation strategies for changing the child genomes.
+"""
+
+import math, random
+from abc import ABC, abstractmethod
+
+class MutationStrategy(ABC):
+    @abstractmethod
+    def process(self, genome, gene_size):
+        """
+        Abstract method to mutate the given genome.
+
+        Args:
+            genome (int): The genome to mutate.
+            gene_size (int): The size of the genome.
+
+        Returns:
+            int: The mutated genome.
+        """
+        pass
+
+    def process_batch(self, genomes, gene_size):
+        """
+        Mutate every genome in one call.
+
+        Args:
+            genomes (list[int]): The genomes to mutate.
+            gene_size (int): The size of the genome.
+
+        Returns:
+            list[int]: The mutated genomes.
+        """
+        process = self.process
+        return [process(genome, gene_size) for genome in genomes]
+
+
+def geometric_positions(size, probability, rng=random):
+    """
+    Generate the positions(0 ~ size - 1) where independent Bernoulli(probability) trials succeed.
+    The gap to the next success is geometric, so the cost scales with the number of successes, not with size.
+
+    Args:
+        size (int): The number of trials.
+        probability (float): The success probability of each trial.
+        rng (random.Random, optional): The random number stream. Defaults to the random module.
+
+    Yields:
+        int: The position of a success in increasing order.
+    """
+    if probability <= 0:
+        return
+    if probability >= 1:
+        yield from range(size)
+        return
+    log_failure = math.log(1.0 - probability)
+    position = -1
+    while True:
+        # 1.0 - rng.random() is in (0, 1], so log never fails.
+        position += 1 + int(math.log(1.0 - rng.random()) / log_failure)
+        if position >= size:
+            return
+        yield position
+
+
+class BitFlip(MutationStrategy):
+    def __init__(self, mutation_rate, bit_mutation_rate, rng=random):
+        self.mutation_rate = mutation_rate
+        self.bit_mutation_rate = bit_mutation_rate
+        self.rng = rng
+
+    def __flip_bits(self, genome, gene_size):
+        # Flip each bit with bit_mutation_rate, visiting only the flipped positions.
+        for position in geometric_positions(gene_size, self.bit_mutation_rate, self.rng):
+            genome ^= (1 << position)
+        return genome
+
+    def process(self, genome, gene_size):
+        if self.rng.random() < self.mutation_rate:
+            genome = self.__flip_bits(genome, gene_size)
+        return genome
+
+    def process_batch(self, genomes, gene_size):
+        # Mutated genomes are chosen by geometric gaps as well.
+        genomes = list(genomes)
+        for idx in geometric_positions(len(genomes), self.mutation_rate, self.rng):
+            genomes[idx] = self.__flip_bits(genomes[idx], gene_size)
+        return genomes
@@ -6,6 +6,13 @@ import random
 from abc import ABC, abstractmethod
 
 class SelectionStrategy(ABC):
+    def __init__(self, rng=random):
+        """
+        Args:
+            rng (random.Random, optional): random number stream. Defaults to the random module.
+        """
+        self.rng = rng
+
     @abstractmethod
     def process(self, parent_population_size, genomes_with_fitness):
         """
@@ -21,7 +28,8 @@ class SelectionStrategy(ABC):
         pass
 
 class RouletteWheel(SelectionStrategy):
-    def __init__(self, population_size):
+    def __init__(self, population_size, rng=random):
+        super().__init__(rng)
         self.population_size = population_size
     def __lower_bound(self, fitness_sum, find):
         """
@@ -60,10 +68,101 @@ class RouletteWheel(SelectionStrategy):
                 fitness_sum.append(fitness_sum[-1] + genome_with_fitness[0]) # prefix_sum
             total_fitness += genome_with_fitness[0]
 
+        # Every genome has zero fitness, select parents uniformly.
+        if total_fitness <= 0:
+            return [self.rng.choice(genomes_with_fitness)[1] for _ in range(parent_population_size)]
+
         # Select parents based on their fitness.
         for _ in range(parent_population_size):
-            random_number = random.randrange(total_fitness + 1)
+            random_number = self.rng.randrange(1, total_fitness + 1) # 1 ~ total_fitness, i-th genome owns fitness_sum[i-1] < x <= fitness_sum[i]
             genome_idx = self.__lower_bound(fitness_sum, random_number)
             selected_genome = genomes_with_fitness[genome_idx][1]
             parent_genomes.append(selected_genome)
-        return parent_genomes
\ No newline at end of file
+        return parent_genomes
+
+
+class AliasMethod(SelectionStrategy):
+    """
+    Walker/Vose alias method: O(n) table construction per generation and O(1) per draw.
+    """
+    def __build_alias_table(self, fitness):
+        """
+        Build the probability and alias tables (Vose's algorithm).
+
+        Args:
+            fitness (list[int]): fitness of each genome. sum(fitness) > 0
+
+        Returns:
+            (list[float], list[int]): probability table and alias table
+        """
+        size = len(fitness)
+        total_fitness = sum(fitness)
+        scaled = [value * size / total_fitness for value in fitness] # average is 1
+        probability, alias = [1.0] * size, list(range(size))
+        small = [i for i, value in enumerate(scaled) if value < 1]
+        large = [i for i, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less], alias[less] = scaled[less], more
+            # the large column gives (1 - scaled[less]) to fill the small column
+            scaled[more] -= 1 - scaled[less]
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+        return probability, alias
+
+    def process(self, parent_population_size, genomes_with_fitness):
+        fitness = [genome_with_fitness[0] for genome_with_fitness in genomes_with_fitness]
+        if sum(fitness) <= 0:
+            return [self.rng.choice(genomes_with_fitness)[1] for _ in range(parent_population_size)]
+
+        probability, alias = self.__build_alias_table(fitness)
+        parent_genomes = []
+        for _ in range(parent_population_size):
+            # Select a column uniformly, then the column itself or its alias.
+            genome_idx = self.rng.randrange(len(fitness))
+            if self.rng.random() >= probability[genome_idx]:
+                genome_idx = alias[genome_idx]
+            parent_genomes.append(genomes_with_fitness[genome_idx][1])
+        return parent_genomes
+
+
+class StochasticUniversalSampling(SelectionStrategy):
+    """
+    Stochastic universal sampling: one random number per generation, parents are picked by evenly spaced pointers.
+    """
+    def process(self, parent_population_size, genomes_with_fitness):
+        total_fitness = sum(genome_with_fitness[0] for genome_with_fitness in genomes_with_fitness)
+        if total_fitness <= 0:
+            return [self.rng.choice(genomes_with_fitness)[1] for _ in range(parent_population_size)]
+
+        # Pointers are scaled by parent_population_size to stay integers(offset + i * total_fitness),
+        # so the last pointer is always below the scaled total and exactly parent_population_size parents are selected.
+        pointer = self.rng.randrange(total_fitness)
+        parent_genomes = []
+        fitness_sum = 0
+        for fitness, genome in genomes_with_fitness:
+            fitness_sum += fitness * parent_population_size
+            # Every pointer in the current genome's fitness range selects it.
+            while pointer < fitness_sum and len(parent_genomes) < parent_population_size:
+                parent_genomes.append(genome)
+                pointer += total_fitness
+        return parent_genomes
+
+
+class Tournament(SelectionStrategy):
+    """
+    Tournament selection: the fittest of tournament_size randomly drawn genomes is selected.
+    """
+    def __init__(self, tournament_size=2, rng=random):
+        super().__init__(rng)
+        self.tournament_size = tournament_size
+
+    def process(self, parent_population_size, genomes_with_fitness):
+        parent_genomes = []
+        for _ in range(parent_population_size):
+            winner = max((self.rng.choice(genomes_with_fitness) for _ in range(self.tournament_size)),
+                         key=lambda genome_with_fitness: genome_with_fitness[0])
+            parent_genomes.append(winner[1])
+        return parent_genomes
@@ -0,0 +1,68 @@
+"""
+    Shared brute-force references of the property tests.
+    The modules are top-level scripts, so the repository root is put on the import path.
+"""
+
+import os, sys, random, itertools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def random_function(seed, max_variables=6):
+    """
+    Random single-output function
+
+    Returns:
+        (int, list[int], list[int]): number of variables, minterms and dontcares
+    """
+    rng = random.Random(seed)
+    variable_count = rng.randint(1, max_variables)
+    terms = list(range(1 << variable_count))
+    rng.shuffle(terms)
+    on_count = rng.randint(1, len(terms))
+    dontcare_count = rng.randint(0, len(terms) - on_count)
+    return variable_count, sorted(terms[:on_count]), sorted(terms[on_count:on_count + dontcare_count])
+
+def cubes(variable_count):
+    """
+    Every cube of the variables as (value, dash mask)
+    """
+    for mask in range(1 << variable_count):
+        for value in range(1 << variable_count):
+            if value & mask == 0:
+                yield value, mask
+
+def cube_minterms(value, mask):
+    return [value | submask for submask in range(mask + 1) if submask & ~mask == 0]
+
+def brute_force_primes(variable_count, terms):
+    """
+    Prime implicants of the terms: cubes inside the terms that are not inside a cube with one more dash
+
+    Returns:
+        set[(int, int)]: (value, dash mask) of each prime implicant
+    """
+    terms = set(terms)
+    implicants = {(value, mask) for value, mask in cubes(variable_count)
+                  if all(minterm in terms for minterm in cube_minterms(value, mask))}
+    return {(value, mask) for value, mask in implicants
+            if not any((value & ~(1 << bit), mask | (1 << bit)) in implicants
+                       for bit in range(variable_count) if not (mask >> bit) & 1)}
+
+def brute_force_minimum_cover(prime_implicants, minterms):
+    """
+    Returns:
+        int: smallest number of prime implicants covering every coverable minterm
+    """
+    coverable = {minterm for minterm in minterms if any(minterm in prime_implicant for prime_implicant in prime_implicants)}
+    for size in range(len(prime_implicants) + 1):
+        for rows in itertools.combinations(prime_implicants, size):
+            if all(any(minterm in prime_implicant for prime_implicant in rows) for minterm in coverable):
+                return size
+
+def genome_rows(genome, gene_size):
+    """
+    Returns:
+        list[int]: prime implicant indices selected by the genome(i-th bit selects the (gene_size - 1 - i)-th prime implicant)
+    """
+    return [row for row in range(gene_size) if (genome >> (gene_size - 1 - row)) & 1]
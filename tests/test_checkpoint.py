@@ -0,0 +1,50 @@
+import copy, json, os, random
+
+import pytest
+
+from Checkpoint import load_checkpoint, save_checkpoint
+from Pipeline import run_testcase, resume_testcase
+
+TESTCASE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'testcases', 'testcase2.json')
+
+
+def load_testcase(parameters, strategy):
+    with open(TESTCASE) as f:
+        testcase = json.load(f)
+    if strategy.get('reduction'): # the chart of testcase2 has no cyclic core, this function has 12 prime implicants in it
+        testcase.update(minterms=sorted(random.Random(3).sample(range(128), 50)), dontcares=[])
+    testcase['parameters'].update(seed=11, epoch=60, **copy.deepcopy(parameters))
+    testcase['strategy'].update(strategy)
+    return testcase
+
+def series(result):
+    return (result['best_solution'], list(result['fitness_data']['average']), list(result['fitness_data']['max']),
+            list(result['fitness_data']['min']), list(result['max_genomes']), list(result['genetic_diversity']))
+
+
+@pytest.mark.parametrize('parameters, strategy', [
+    ({}, {}),
+    ({}, {'reduction': True}),
+    ({'local_search_size': 2, 'initialization': {'greedy': 0.3}}, {'selection': 'stochastic_universal'}),
+    ({'history': {'policy': 'reservoir', 'size': 15}}, {'selection': 'alias'}),
+])
+def test_resumed_run_matches_the_uninterrupted_run(tmp_path, parameters, strategy):
+    full = run_testcase(load_testcase(parameters, strategy), trace='off')
+
+    # stop at epoch 30 with a checkpoint at epoch 20, then continue the checkpoint up to epoch 60
+    testcase = load_testcase(parameters, strategy)
+    testcase['parameters'].update(epoch=30, checkpoint={'path': str(tmp_path / 'run.ckpt'), 'interval': 20})
+    run_testcase(testcase, trace='off')
+    state = load_checkpoint(str(tmp_path / 'run.ckpt'))
+    assert state['epoch'] == 20
+    state['parameters']['epoch'] = state['context']['testcase']['parameters']['epoch'] = 60
+    save_checkpoint(str(tmp_path / 'resume.ckpt'), state)
+
+    resumed = resume_testcase(str(tmp_path / 'resume.ckpt'))
+    assert series(resumed) == series(full)
+
+def test_unknown_checkpoint_format_raises(tmp_path):
+    path = tmp_path / 'broken.ckpt'
+    path.write_bytes(b'not a checkpoint')
+    with pytest.raises(ValueError):
+        load_checkpoint(str(path))
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from CubePrimeGenerator import CubePrimeGenerator, parse_cube, format_cube
+from conftest import brute_force_primes, cube_minterms
+
+
+def random_cubes(rng, variable_count, count):
+    return [''.join(rng.choice('01--') for _ in range(variable_count)) for _ in range(count)]
+
+def cube_terms(cubes):
+    return {minterm for cube in cubes for minterm in cube_minterms(*parse_cube(cube))}
+
+
+@pytest.mark.parametrize('seed', range(60))
+def test_prime_implicants_match_brute_force(seed):
+    rng = random.Random(seed)
+    variable_count = rng.randint(1, 6)
+    cubes = random_cubes(rng, variable_count, rng.randint(1, 6))
+    dontcare_cubes = random_cubes(rng, variable_count, rng.randint(0, 3))
+    prime_implicants, coverage_cubes = CubePrimeGenerator(cubes, dontcare_cubes, trace='off').process()
+
+    on_set = cube_terms(cubes)
+    assert {(prime_implicant.value, prime_implicant.mask) for prime_implicant in prime_implicants} == \
+        brute_force_primes(variable_count, on_set | cube_terms(dontcare_cubes))
+
+    # every coverage cube is in the ON-set, and every ON minterm has a coverage cube with the same covering prime implicants
+    covering = lambda term: frozenset(row for row, prime_implicant in enumerate(prime_implicants) if term in prime_implicant)
+    assert all(set(coverage_cube) <= on_set for coverage_cube in coverage_cubes)
+    coverage_sets = {covering(coverage_cube) for coverage_cube in coverage_cubes}
+    assert {covering(minterm) for minterm in on_set} == coverage_sets
+
+def test_cube_format_round_trip():
+    for cube in ('0', '1', '-', '10-1', '----', '0110'):
+        assert format_cube(*parse_cube(cube), len(cube)) == cube
@@ -0,0 +1,58 @@
+import pytest
+
+from QuineMcCluskey import QuineMcCluskey
+from ExactCover import ExactCoverSolver
+from PIChartReduction import PIChartReducer
+from conftest import random_function, brute_force_minimum_cover, genome_rows
+
+
+def pi_chart(seed):
+    _, minterms, dontcares = random_function(seed, max_variables=5)
+    return QuineMcCluskey(minterms, dontcares, trace='off').process()
+
+def assert_full_cover(genome, prime_implicants, minterms):
+    rows = genome_rows(genome, len(prime_implicants))
+    assert all(any(minterm in prime_implicants[row] for row in rows) for minterm in minterms)
+    return len(rows)
+
+
+@pytest.mark.parametrize('seed', range(80))
+def test_exact_cover_is_minimum(seed):
+    prime_implicants, minterms = pi_chart(seed)
+    solver = ExactCoverSolver({'weight': 3}, {})
+    _, _, best_solution, _, visualization_params = solver.process(prime_implicants, minterms)
+    assert visualization_params['exact']['is_optimal']
+    assert visualization_params['stop_reason'] is None
+    assert best_solution[3] == assert_full_cover(best_solution[0], prime_implicants, minterms)
+    assert best_solution[3] == brute_force_minimum_cover(prime_implicants, minterms)
+    assert best_solution[2] == len(set(minterms))
+
+def test_exact_cover_returns_a_cover_when_the_budget_runs_out():
+    prime_implicants, minterms = [(row, (row + 1) % 15) for row in range(15)], list(range(15))
+    _, _, best_solution, _, visualization_params = ExactCoverSolver({'weight': 3, 'node_budget': 1}, {}).process(prime_implicants, minterms)
+    assert visualization_params['stop_reason'] == 'node_budget'
+    assert not visualization_params['exact']['is_optimal']
+    assert_full_cover(best_solution[0], prime_implicants, minterms)
+
+def test_exact_cover_handles_deep_searches():
+    # 200 disjoint 5-cycles: the lower bound is weak, so the search goes 600 prime implicants deep
+    prime_implicants = [(5 * cycle + row, 5 * cycle + (row + 1) % 5) for cycle in range(200) for row in range(5)]
+    minterms = list(range(1000))
+    _, _, best_solution, _, _ = ExactCoverSolver({'weight': 3, 'node_budget': 2000}, {}).process(prime_implicants, minterms)
+    assert best_solution[3] == assert_full_cover(best_solution[0], prime_implicants, minterms) == 600
+
+
+@pytest.mark.parametrize('seed', range(80))
+def test_reduction_keeps_the_minimum_cover(seed):
+    prime_implicants, minterms = pi_chart(seed)
+    reducer = PIChartReducer(prime_implicants, minterms)
+    core_prime_implicants, core_minterms = reducer.process()
+    assert all(any(minterm in prime_implicant for prime_implicant in core_prime_implicants) for minterm in core_minterms)
+
+    core_solution = (0, 0, 0, 0, -1)
+    if core_prime_implicants:
+        _, _, core_solution, _, _ = ExactCoverSolver({'weight': 3}, {}).process(core_prime_implicants, core_minterms)
+    best_solution = reducer.expand_solution(core_solution, 3)
+    used = assert_full_cover(best_solution[0], prime_implicants, minterms)
+    assert best_solution[3] == used == brute_force_minimum_cover(prime_implicants, minterms)
+    assert best_solution[1] == 3 * len(set(minterms)) + len(prime_implicants) - used
@@ -0,0 +1,69 @@
+import pickle, random
+
+import pytest
+
+from History import History
+
+
+def record_epochs(history, epochs, seed=0):
+    """
+    Record random epochs
+
+    Returns:
+        list[tuple]: (epoch, average, max, min, genome, diversity) of every epoch
+    """
+    rng = random.Random(seed)
+    entries = []
+    for epoch in range(epochs):
+        entry = (epoch, rng.random() * 100, rng.randrange(1000), rng.randrange(100), rng.getrandbits(history.gene_size), rng.randrange(50))
+        history.record(*entry)
+        entries.append(entry)
+    history.finish()
+    return entries
+
+def series_entries(history):
+    epochs, fitness_data, max_genomes, genetic_diversity = history.series()
+    return list(zip(epochs, fitness_data['average'], fitness_data['max'], fitness_data['min'], max_genomes, genetic_diversity))
+
+
+@pytest.mark.parametrize('epochs', [1, 7, 100, 101])
+@pytest.mark.parametrize('config, expected', [
+    (None, lambda entries: entries),
+    ({'policy': 'every', 'interval': 10}, lambda entries: [entry for entry in entries if entry[0] % 10 == 0 or entry is entries[-1]]),
+    ({'policy': 'ring', 'size': 30}, lambda entries: entries[-30:]),
+])
+def test_policies_keep_the_expected_epochs(epochs, config, expected):
+    history = History(70, config)
+    entries = record_epochs(history, epochs)
+    assert series_entries(history) == expected(entries)
+
+@pytest.mark.parametrize('epochs', [5, 100, 1000])
+def test_reservoir_keeps_a_sample_in_epoch_order(epochs):
+    history = History(70, {'policy': 'reservoir', 'size': 40}, random.Random(1))
+    entries = record_epochs(history, epochs)
+    sample = series_entries(history)
+    assert len(sample) == min(epochs, 40)
+    assert [entry[0] for entry in sample] == sorted({entry[0] for entry in sample})
+    assert all(entry == entries[entry[0]] for entry in sample)
+
+@pytest.mark.parametrize('config', [{'policy': 'full'}, {'policy': 'ring', 'size': 16}, {'policy': 'reservoir', 'size': 16, 'seed': 3}])
+def test_spilled_history_matches_the_memory_history(tmp_path, config):
+    in_memory = History(130, config)
+    spilled = History(130, {**config, 'spill': str(tmp_path / 'genomes.bin')})
+    record_epochs(in_memory, 500)
+    record_epochs(spilled, 500)
+    expected = series_entries(in_memory)
+    assert series_entries(spilled) == expected
+
+    # the spilled genomes stay readable after close, and a pickled history(checkpoint) has the same series
+    _, _, max_genomes, _ = spilled.series()
+    restored = pickle.loads(pickle.dumps(spilled))
+    spilled.close()
+    assert list(max_genomes) == [entry[4] for entry in expected]
+    assert series_entries(restored) == expected
+    restored.close()
+
+@pytest.mark.parametrize('config', [{'policy': 'unknown'}, {'policy': 'every', 'interval': 0}, {'policy': 'ring', 'size': 0}])
+def test_invalid_configurations_raise(config):
+    with pytest.raises(ValueError):
+        History(8, config)
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from QuineMcCluskey import QuineMcCluskey
+from MultiOutputQuineMcCluskey import MultiOutputQuineMcCluskey
+from conftest import cubes, cube_minterms
+
+
+def random_outputs(seed):
+    rng = random.Random(seed)
+    variable_count, output_count = rng.randint(1, 5), rng.randint(1, 4)
+    outputs = []
+    for _ in range(output_count):
+        terms = list(range(1 << variable_count))
+        rng.shuffle(terms)
+        on_count = rng.randint(1, len(terms))
+        dontcare_count = rng.randint(0, (len(terms) - on_count) // 2)
+        outputs.append({'minterms': sorted(terms[:on_count]), 'dontcares': sorted(terms[on_count:on_count + dontcare_count])})
+    return variable_count, outputs
+
+def brute_force_shared_primes(variable_count, outputs):
+    """
+    Shared prime implicants: (cube, outputs whose ON-set or dontcares contain the cube),
+    kept when no cube with one more dash has the same outputs and the cube has a minterm of one of its outputs
+
+    Returns:
+        set[(int, int, int)]: (value, dash mask, bitmask of the outputs)
+    """
+    care_sets = [set(output['minterms']) | set(output['dontcares']) for output in outputs]
+    tags = {}
+    for value, mask in cubes(variable_count):
+        minterms = cube_minterms(value, mask)
+        tag = sum(1 << index for index, care in enumerate(care_sets) if all(minterm in care for minterm in minterms))
+        if tag:
+            tags[(value, mask)] = tag
+    primes = set()
+    for (value, mask), tag in tags.items():
+        if any(tags.get((value & ~(1 << bit), mask | (1 << bit))) == tag for bit in range(variable_count) if not (mask >> bit) & 1):
+            continue
+        if any(minterm in outputs[index]['minterms'] for index in range(len(outputs)) if (tag >> index) & 1
+               for minterm in cube_minterms(value, mask)):
+            primes.add((value, mask, tag))
+    return primes
+
+
+@pytest.mark.parametrize('seed', range(80))
+def test_shared_prime_implicants_match_brute_force(seed):
+    _, outputs = random_outputs(seed)
+    qm = MultiOutputQuineMcCluskey(outputs, trace='off')
+    prime_implicants, minterms = qm.process()
+    assert {(prime_implicant.value, prime_implicant.mask, prime_implicant.outputs) for prime_implicant in prime_implicants} == \
+        brute_force_shared_primes(qm.variable_count, outputs)
+    assert len(prime_implicants) == len(set(prime_implicants))
+
+    # tagged minterm keys of every output, a product covers the keys of its outputs only
+    assert minterms == [(index << qm.variable_count) | minterm
+                        for index, output in enumerate(outputs) for minterm in dict.fromkeys(output['minterms'])]
+    for prime_implicant in prime_implicants:
+        keys = list(prime_implicant)
+        assert keys == sorted(keys) and len(keys) == len(prime_implicant)
+        assert all((key in prime_implicant) == (key in keys) for key in range(len(outputs) << qm.variable_count))
+
+@pytest.mark.parametrize('seed', range(20))
+def test_single_output_matches_quine_mccluskey(seed):
+    _, outputs = random_outputs(seed)
+    output = outputs[0]
+    shared_primes, _ = MultiOutputQuineMcCluskey([output], trace='off').process()
+    prime_implicants, _ = QuineMcCluskey(output['minterms'], output['dontcares'], trace='off').process()
+    # products covering only dontcares are dropped by the multi-output generator
+    assert {(prime_implicant.value, prime_implicant.mask) for prime_implicant in shared_primes} == \
+        {(prime_implicant.value, prime_implicant.mask) for prime_implicant in prime_implicants
+         if any(minterm in prime_implicant for minterm in output['minterms'])}
@@ -0,0 +1,35 @@
+import pytest
+
+from QuineMcCluskey import QuineMcCluskey, Implicant
+from conftest import random_function, brute_force_primes, cube_minterms
+
+
+@pytest.mark.parametrize('seed', range(60))
+@pytest.mark.parametrize('merge_engine', ['hash', 'pairwise'])
+def test_prime_implicants_match_brute_force(seed, merge_engine):
+    variable_count, minterms, dontcares = random_function(seed)
+    prime_implicants, returned_minterms = QuineMcCluskey(minterms, dontcares, merge_engine=merge_engine, trace='off').process()
+    assert returned_minterms == minterms
+    assert len(prime_implicants) == len(set(prime_implicants))
+    assert {(prime_implicant.value, prime_implicant.mask) for prime_implicant in prime_implicants} == \
+        brute_force_primes(variable_count, minterms + dontcares)
+
+@pytest.mark.parametrize('seed', range(20))
+def test_merge_engines_agree(seed):
+    _, minterms, dontcares = random_function(seed, max_variables=8)
+    hash_primes, _ = QuineMcCluskey(minterms, dontcares, merge_engine='hash', trace='off').process()
+    pairwise_primes, _ = QuineMcCluskey(minterms, dontcares, merge_engine='pairwise', trace='off').process()
+    assert sorted(hash_primes, key=lambda prime_implicant: (prime_implicant.value, prime_implicant.mask)) == \
+        sorted(pairwise_primes, key=lambda prime_implicant: (prime_implicant.value, prime_implicant.mask))
+    assert [len(prime_implicant) for prime_implicant in hash_primes] == sorted(len(prime_implicant) for prime_implicant in hash_primes)
+
+def test_implicant_behaves_as_its_minterms():
+    implicant = Implicant(0b1000, 0b0101)
+    assert tuple(implicant) == tuple(cube_minterms(0b1000, 0b0101)) == (8, 9, 12, 13)
+    assert len(implicant) == 4
+    assert all((term in implicant) == (term in (8, 9, 12, 13)) for term in range(16))
+    assert Implicant(0b1001, 0b0100) in implicant
+
+def test_trace_needs_an_output_directory():
+    with pytest.raises(ValueError):
+        QuineMcCluskey([1, 2], [], trace='summary')